@@ -0,0 +1,161 @@
+# Archive tier: long-inactive players moved out of the main store, compressed
+
+import asyncio
+import base64
+import json
+import os
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from .items import ITEMS
+from .leaderboard import HS_FIELDS
+from .models import _SERIAL_FIELDS, DATA_DIR, PackedRecord, _now, fsync_dir
+
+if TYPE_CHECKING:
+    from .wilderness import Wilderness
+
+ARCHIVE_FILE = os.path.join(DATA_DIR, "players_archive.jsonl")
+
+
+
+def default_zdict() -> bytes:
+    """Preset zlib dictionary of record keys and item names (records are too small to compress well alone).
+
+    An archive keeps the dictionary it was written with in its header line,
+    so later item additions only affect new archives.
+    """
+    keys = [f'"{name}":' for name, _default, _copy in _SERIAL_FIELDS] + [f'"{item}":' for item in ITEMS]
+    return "".join(keys).encode("utf-8")[-32768:]
+
+
+def pack(d: Dict[str, Any], zdict: bytes) -> bytes:
+    z = zlib.compressobj(9, zdict=zdict)
+    return z.compress(json.dumps(d, separators=(",", ":")).encode("utf-8")) + z.flush()
+
+
+def unpack(blob: bytes, zdict: bytes) -> Dict[str, Any]:
+    z = zlib.decompressobj(zdict=zdict)
+    return json.loads((z.decompress(blob) + z.flush()).decode("utf-8"))
+
+
+class ArchiveManager:
+    """Moves players inactive for config["archive_after_days"] into ARCHIVE_FILE.
+
+    A header line {"zdict"} and then one JSON line per player: {"uid",
+    "s": highscore summary, "z": base64 zlib record}. Records stay
+    compressed in memory; only the summaries are parsed (highscores keep
+    counting archived players); the record is unpacked when the player next
+    acts, see PlayerRepository.get. The archive file is written before the
+    main store forgets a player and rewritten after restored players are
+    flushed back, so a player is never missing from both; if both have
+    them, the main store wins.
+    """
+
+    def __init__(self, cog: "Wilderness"):
+        self.cog = cog
+        self._lock = asyncio.Lock()
+
+    async def load(self):
+        def _read() -> List[Dict[str, Any]]:
+            if not os.path.exists(ARCHIVE_FILE):
+                return []
+            out = []
+            with open(ARCHIVE_FILE, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        out.append(json.loads(line))
+                    except Exception:
+                        continue
+            return out
+
+        repo = self.cog.players
+        repo.archive_zdict = default_zdict()
+        for rec in await asyncio.to_thread(_read):
+            if "zdict" in rec:
+                repo.archive_zdict = base64.b64decode(rec["zdict"])
+                continue
+            try:
+                uid = int(rec["uid"])
+                blob = base64.b64decode(rec["z"])
+            except Exception:
+                continue
+            if uid in repo:
+                # Restored, but the archive was not rewritten before shutdown
+                repo.archive_dirty = True
+                continue
+            repo.archived[uid] = (rec.get("s") or {}, blob)
+
+    async def save(self):
+        repo = self.cog.players
+        repo.archive_dirty = False
+        if not repo.archived:
+            repo.archive_zdict = default_zdict()
+        header = json.dumps({"zdict": base64.b64encode(repo.archive_zdict).decode("ascii")}) + "\n"
+        lines = header + "".join(
+            json.dumps({"uid": uid, "s": s, "z": base64.b64encode(z).decode("ascii")}, separators=(",", ":")) + "\n"
+            for uid, (s, z) in repo.archived.items()
+        )
+
+        def _write():
+            tmp = ARCHIVE_FILE + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, ARCHIVE_FILE)
+            fsync_dir(ARCHIVE_FILE)
+
+        async with self._lock:
+            try:
+                await asyncio.to_thread(_write)
+            except Exception:
+                repo.archive_dirty = True
+                raise
+
+    async def archive_inactive(self) -> int:
+        """Archive cold players idle past the cutoff; returns how many moved."""
+        days = float(self.cog.config.get("archive_after_days", 90))
+        if days <= 0:
+            return 0
+        cutoff = _now() - int(days * 86400)
+        repo = self.cog.players
+        picked = {}
+        for uid, d in repo.cold.items():
+            last = int((d.summary if isinstance(d, PackedRecord) else d).get("last_action", 0) or 0)
+            # No last_action (records from before it was saved): idle time unknown, keep them
+            if last and last < cutoff:
+                picked[uid] = d
+        if not picked:
+            return 0
+        if not repo.archived:
+            repo.archive_zdict = default_zdict()
+        for uid, d in picked.items():
+            rec = d.decode() if isinstance(d, PackedRecord) else d
+            repo.archived[uid] = ({k: rec[k] for k in HS_FIELDS if k in rec}, pack(rec, repo.archive_zdict))
+        await self.save()
+
+        # Anyone who acted while the archive was being written stays in the main store
+        moved = []
+        for uid, d in picked.items():
+            if repo.cold.get(uid) is d:
+                del repo.cold[uid]
+                moved.append(uid)
+            else:
+                repo.archived.pop(uid, None)
+                repo.archive_dirty = True
+        if moved:
+            await self.cog.store.append_players({str(uid): None for uid in moved})
+        return len(moved)
+
+    async def run(self):
+        try:
+            while True:
+                await asyncio.sleep(float(self.cog.config.get("archive_check_interval_sec", 6 * 3600)))
+                if not self.cog._ready:
+                    continue
+                try:
+                    await self.archive_inactive()
+                except Exception:
+                    continue
+        except asyncio.CancelledError:
+            return
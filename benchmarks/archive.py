@@ -0,0 +1,99 @@
+"""Startup with long-inactive players archived vs. all players in the main snapshot.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.archive
+"""
+
+import base64
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from ..archive import default_zdict, pack, unpack
+from ..items import ITEMS
+from ..leaderboard import HS_FIELDS
+from ..models import PlayerState
+
+PLAYERS = 50_000
+ACTIVE = 5_000
+
+
+def records(rng: random.Random):
+    names = list(ITEMS)
+    return {
+        str(uid): PlayerState(
+            user_id=uid, kills=rng.randint(0, 500), coins=rng.randint(0, 5_000_000),
+            inventory={rng.choice(names): rng.randint(1, 50) for _ in range(rng.randint(0, 20))},
+            bank={rng.choice(names): rng.randint(1, 5_000) for _ in range(rng.randint(0, 60))},
+        ).to_dict()
+        for uid in range(PLAYERS)
+    }
+
+
+def load(main_path: str, archive_path: str = ""):
+    with open(main_path, "r", encoding="utf-8") as f:
+        main = json.load(f)
+    archived = {}
+    if archive_path:
+        with open(archive_path, "r", encoding="utf-8") as f:
+            for line in f:
+                rec = json.loads(line)
+                if "uid" in rec:
+                    archived[rec["uid"]] = (rec["s"], base64.b64decode(rec["z"]))
+    return main, archived
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    took = time.perf_counter() - t0
+    tracemalloc.start()
+    out = fn()
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return out, took, mem
+
+
+def run() -> None:
+    recs = records(random.Random(1))
+    active = set(list(recs)[:ACTIVE])
+    zdict = default_zdict()
+    with tempfile.TemporaryDirectory() as tmp:
+        full = os.path.join(tmp, "players.json")
+        main = os.path.join(tmp, "players_main.json")
+        arch = os.path.join(tmp, "players_archive.jsonl")
+        with open(full, "w", encoding="utf-8") as f:
+            json.dump(recs, f)
+        with open(main, "w", encoding="utf-8") as f:
+            json.dump({uid: d for uid, d in recs.items() if uid in active}, f)
+        with open(arch, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"zdict": base64.b64encode(zdict).decode("ascii")}) + "\n")
+            for uid, d in recs.items():
+                if uid not in active:
+                    s = {k: d[k] for k in HS_FIELDS if k in d}
+                    z = base64.b64encode(pack(d, zdict)).decode("ascii")
+                    f.write(json.dumps({"uid": int(uid), "s": s, "z": z}, separators=(",", ":")) + "\n")
+
+        _, legacy_t, legacy_mem = timed(lambda: load(full))
+        (_, archived), t, mem = timed(lambda: load(main, arch))
+        sizes = (os.path.getsize(full), os.path.getsize(main), os.path.getsize(arch))
+
+    blobs = [z for _s, z in archived.values()][:2_000]
+    t0 = time.perf_counter()
+    for z in blobs:
+        PlayerState.from_dict(unpack(z, zdict))
+    restore = (time.perf_counter() - t0) / len(blobs)
+
+    print(f"{PLAYERS:,} players, {PLAYERS - ACTIVE:,} archived")
+    print(f"  startup load : {legacy_t * 1e3:8.0f} -> {t * 1e3:8.0f} ms")
+    print(f"  resident     : {legacy_mem / 2**20:8.1f} -> {mem / 2**20:8.1f} MiB")
+    print(f"  files        : {sizes[0] / 2**20:8.1f} -> {sizes[1] / 2**20:.1f} + {sizes[2] / 2**20:.1f} MiB (main + archive)")
+    print(f"  restore      : {restore * 1e6:8.1f} µs per archived player")
+
+
+if __name__ == "__main__":
+    run()
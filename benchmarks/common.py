@@ -0,0 +1,21 @@
+"""Helpers shared by the benchmarks."""
+
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from ..models import PlayerState
+from ..player_repository import PlayerRepository
+
+
+def fake_cog(players: Optional[Dict[int, PlayerState]] = None, cache_size: Optional[int] = None) -> SimpleNamespace:
+    """The attributes the managers read from the cog, with `players` loaded hot."""
+    players = players or {}
+    cog = SimpleNamespace(
+        config={"player_cache_size": cache_size or max(1, len(players))},
+        _changed_uids=set(), _dirty_uids=set(),
+        lock_mgr=SimpleNamespace(is_locked=lambda uid: False),
+    )
+    cog.players = PlayerRepository(cog)
+    for uid, p in players.items():
+        cog.players[uid] = p
+    return cog
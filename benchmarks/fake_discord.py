@@ -0,0 +1,206 @@
+"""A stand-in `discord` package so the cog imports and runs without discord.py.
+
+install() registers discord, discord.ext.commands, discord.app_commands,
+discord.ui and discord.abc in sys.modules. Decorated commands keep their
+callbacks, views and buttons are inert, and Embed records what was set on
+it, so game code runs unchanged while the benchmarks measure only the
+game. Nothing here talks to a gateway.
+"""
+
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+MODULES = ("discord", "discord.ext", "discord.ext.commands", "discord.app_commands", "discord.ui", "discord.abc")
+
+
+class _StubMeta(type):
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub()
+
+
+class _Stub(metaclass=_StubMeta):
+    """Any discord class, constant or decorator the benchmarks never look inside."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        pass
+
+    def __init_subclass__(cls, **kwargs: Any):
+        pass
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        # Used as a decorator (@discord.ui.button(...)): hand the function back
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return _Stub()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub()
+
+    def __class_getitem__(cls, item: Any) -> Any:
+        return cls
+
+
+def _stub_getattr(name: str) -> Any:
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return _Stub
+
+
+# ── discord ──
+
+class Colour(int):
+    @classmethod
+    def green(cls) -> "Colour":
+        return cls(0x2ECC71)
+
+    @classmethod
+    def gold(cls) -> "Colour":
+        return cls(0xF1C40F)
+
+    @classmethod
+    def red(cls) -> "Colour":
+        return cls(0xE74C3C)
+
+    @classmethod
+    def purple(cls) -> "Colour":
+        return cls(0x9B59B6)
+
+
+class Embed:
+    """Keeps title, description, colour, fields and footer, like discord.Embed."""
+
+    def __init__(self, *, title: Optional[str] = None, description: Optional[str] = None,
+                 colour: Optional[int] = None, color: Optional[int] = None, **kwargs: Any):
+        self.title = title
+        self.description = description
+        self.colour = colour if colour is not None else color
+        self.fields: List[Dict[str, Any]] = []
+        self.footer: Optional[str] = None
+
+    def add_field(self, *, name: str, value: str, inline: bool = True) -> "Embed":
+        self.fields.append({"name": name, "value": value, "inline": inline})
+        return self
+
+    def set_footer(self, *, text: Optional[str] = None, **kwargs: Any) -> "Embed":
+        self.footer = text
+        return self
+
+    def set_thumbnail(self, **kwargs: Any) -> "Embed":
+        return self
+
+    def set_image(self, **kwargs: Any) -> "Embed":
+        return self
+
+    def set_author(self, **kwargs: Any) -> "Embed":
+        return self
+
+    def __len__(self) -> int:
+        return sum(len(s or "") for s in (self.title, self.description, self.footer)) + sum(
+            len(f["name"]) + len(f["value"]) for f in self.fields
+        )
+
+
+class Object:
+    def __init__(self, id: int):
+        self.id = int(id)
+
+
+class Guild:
+    """Just enough of a guild for embeds: an id and get_member()."""
+
+    def __init__(self, id: int, members: Optional[Dict[int, Any]] = None):
+        self.id = int(id)
+        self._members = members or {}
+
+    def get_member(self, user_id: int) -> Any:
+        return self._members.get(user_id)
+
+
+class Member:
+    def __init__(self, id: int, display_name: Optional[str] = None):
+        self.id = int(id)
+        self.display_name = display_name or f"Player {id}"
+        self.mention = f"<@{id}>"
+
+
+# ── discord.ext.commands / discord.app_commands ──
+
+class _Command:
+    """What @commands.group / @w.command / @app_commands.command produce."""
+
+    def __init__(self, callback: Callable, **kwargs: Any):
+        self.callback = callback
+        self.name = kwargs.get("name") or callback.__name__
+
+    def command(self, *args: Any, **kwargs: Any) -> Callable[[Callable], "_Command"]:
+        return lambda fn: _Command(fn, **kwargs)
+
+    def group(self, *args: Any, **kwargs: Any) -> Callable[[Callable], "_Command"]:
+        return lambda fn: _Command(fn, **kwargs)
+
+    def error(self, fn: Callable) -> Callable:
+        return fn
+
+    def autocomplete(self, *args: Any) -> Callable[[Callable], Callable]:
+        return lambda fn: fn
+
+
+def _command(*args: Any, **kwargs: Any) -> Callable[[Callable], _Command]:
+    return lambda fn: _Command(fn, **kwargs)
+
+
+def _passthrough(*args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+    return lambda fn: fn
+
+
+class Cog:
+    @classmethod
+    def listener(cls, *args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+        return lambda fn: fn
+
+
+class Group(_Command):
+    def __init__(self, **kwargs: Any):
+        self.name = kwargs.get("name")
+
+
+def install() -> None:
+    """Register the fake modules (replacing discord.py if it was imported); idempotent."""
+    if getattr(sys.modules.get("discord"), "FAKE", False):
+        return
+    mods = {name: ModuleType(name) for name in MODULES}
+    for mod in mods.values():
+        mod.__getattr__ = _stub_getattr
+
+    d = mods["discord"]
+    d.FAKE = True
+    d.Colour = d.Color = Colour
+    d.Embed = Embed
+    d.Object = Object
+    d.Guild = Guild
+    d.Member = Member
+    d.ext = mods["discord.ext"]
+    d.app_commands = mods["discord.app_commands"]
+    d.ui = mods["discord.ui"]
+    d.abc = mods["discord.abc"]
+    mods["discord.ext"].commands = mods["discord.ext.commands"]
+
+    cmds = mods["discord.ext.commands"]
+    cmds.Cog = Cog
+    cmds.command = cmds.group = _command
+    cmds.check = _passthrough
+
+    app = mods["discord.app_commands"]
+    app.Group = Group
+    app.command = _command
+    app.describe = app.choices = app.autocomplete = _passthrough
+
+    ui = mods["discord.ui"]
+    ui.button = ui.select = _passthrough
+
+    sys.modules.update(mods)
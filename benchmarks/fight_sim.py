@@ -0,0 +1,65 @@
+"""Headless fight simulator: throughput and a sample balance matrix.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.fight_sim
+"""
+
+import time
+
+from ..fight_sim import FightSimulator
+from ..models import PlayerState
+
+FIGHTS = 20_000
+NPC_NAMES = (
+    "Revenant knight", "Fury Bunny", "Windstrider", "Hollow Warden",
+    "Lord Valthyros", "Revenant Archon",
+)
+
+
+def _player(equipment, inventory, **fields) -> PlayerState:
+    p = PlayerState(user_id=0, equipment=dict(equipment), inventory=dict(inventory))
+    for k, v in fields.items():
+        setattr(p, k, v)
+    return p
+
+
+LOADOUTS = {
+    "fury paws": _player(
+        {"mainhand": "Fury Paws", "helm": "Black Mask", "gloves": "Wristwraps of the Damned",
+         "amulet": "Amulet of Seeping", "cape": "Shroud of the Undying"},
+        {"Shark": 10, "Blood rune": 500},
+    ),
+    "soulfire": _player(
+        {"mainhand": "Soulfire staff", "offhand": "Cindertome"},
+        {"Manta Ray": 10, "Blood rune": 200},
+    ),
+    "chainmace": _player(
+        {"mainhand": "Viggora's Chainmace"},
+        {"Shark": 10, "Revenant ether": 300},
+    ),
+}
+
+
+def run() -> None:
+    sim = FightSimulator(seed=1)
+    total = 0
+    elapsed = 0.0
+    print(f"{'loadout':<10} {'npc':<18} {'win%':>6} {'kills/h':>8} {'food':>5} {'rounds':>6} {'loot/kill':>10}")
+    for label, p in LOADOUTS.items():
+        for name in NPC_NAMES:
+            npc = sim.resolve_npc(name)
+            p.wildy_level = int(npc["min_wildy"])
+            t0 = time.perf_counter()
+            r = sim.run(p, npc, FIGHTS)
+            elapsed += time.perf_counter() - t0
+            total += FIGHTS
+            print(
+                f"{label:<10} {name:<18} {r.win_rate * 100:6.1f} {r.kills_per_hour:8.0f} "
+                f"{r.food_per_fight:5.2f} {r.rounds_per_fight:6.1f} {r.loot_per_kill:10,.0f}"
+            )
+    print(f"\n{total:,} fights in {elapsed:.2f}s — {total / elapsed:,.0f} fights/s")
+
+
+if __name__ == "__main__":
+    run()
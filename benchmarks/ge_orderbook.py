@@ -0,0 +1,101 @@
+"""GE matching latency vs. number of open offers.
+
+Compares the GEOrderBook heaps against the old sort-the-whole-list scan.
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.ge_orderbook
+"""
+
+import random
+import time
+from typing import List
+
+from . import fake_discord
+
+# grand_exchange imports discord
+fake_discord.install()
+
+from ..grand_exchange import GEOffer, GEOrderBook  # noqa: E402
+
+SIZES = (100, 1_000, 10_000, 50_000)
+ITEMS = [f"Item {i}" for i in range(50)]
+PROBES = 500
+
+
+def _legacy_match(offers: List[GEOffer], offer: GEOffer):
+    """The pre-order-book matcher: filter + sort every open offer."""
+    if offer.offer_type == "buy":
+        counters = sorted(
+            (o for o in offers
+             if o.offer_type == "sell" and o.item == offer.item and not o.is_complete
+             and o.price_each <= offer.price_each and o.user_id != offer.user_id),
+            key=lambda o: (o.price_each, o.created_at),
+        )
+    else:
+        counters = sorted(
+            (o for o in offers
+             if o.offer_type == "buy" and o.item == offer.item and not o.is_complete
+             and o.price_each >= offer.price_each and o.user_id != offer.user_id),
+            key=lambda o: (-o.price_each, o.created_at),
+        )
+    for c in counters:
+        if offer.is_complete:
+            break
+        qty = min(offer.remaining, c.remaining)
+        offer.filled += qty
+        c.filled += qty
+
+
+def _resting(n: int, rng: random.Random) -> List[GEOffer]:
+    # Buys rest at 1..1000, sells at 1001..2000, so nothing crosses while seeding
+    out = []
+    for i in range(n):
+        side = "buy" if i % 2 else "sell"
+        price = rng.randint(1, 1000) + (0 if side == "buy" else 1000)
+        out.append(GEOffer(
+            offer_id=i + 1, user_id=rng.randint(1, n // 4 + 1), offer_type=side,
+            item=rng.choice(ITEMS), price_each=price, quantity=10_000, created_at=i, slot=0,
+        ))
+    return out
+
+
+def _probes(n: int, rng: random.Random) -> List[GEOffer]:
+    out = []
+    for i in range(PROBES):
+        side = rng.choice(("buy", "sell"))
+        out.append(GEOffer(
+            offer_id=10_000_000 + i, user_id=0, offer_type=side, item=rng.choice(ITEMS),
+            price_each=2000 if side == "buy" else 1, quantity=1, created_at=n + i, slot=0,
+        ))
+    return out
+
+
+def run() -> None:
+    print(f"{'open offers':>12}  {'order book µs/match':>20}  {'legacy µs/match':>16}")
+    for n in SIZES:
+        rng = random.Random(n)
+        resting = _resting(n, rng)
+        probes = _probes(n, rng)
+
+        book = GEOrderBook()
+        for o in resting:
+            book.add(o)
+        t0 = time.perf_counter()
+        for p in probes:
+            book.match(p)
+        book_us = (time.perf_counter() - t0) / len(probes) * 1e6
+
+        # Same workload again, fresh objects (matching mutates fills)
+        rng = random.Random(n)
+        resting = _resting(n, rng)
+        probes = _probes(n, rng)
+        t0 = time.perf_counter()
+        for p in probes:
+            _legacy_match(resting, p)
+        legacy_us = (time.perf_counter() - t0) / len(probes) * 1e6
+
+        print(f"{n:>12,}  {book_us:>20.2f}  {legacy_us:>16.2f}")
+
+
+if __name__ == "__main__":
+    run()
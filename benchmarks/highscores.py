@@ -0,0 +1,86 @@
+"""Highscores query cost: incremental top-K vs. scoring and sorting every player.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.highscores
+"""
+
+import random
+import time
+
+from ..leaderboard import HS_CATEGORIES, LeaderboardManager
+from ..models import PlayerState
+from .common import fake_cog
+
+PLAYERS = 20_000
+QUERIES = 200
+UPDATES = 20_000
+GUILDS = 100
+
+
+def legacy_top(players, category: str, n: int = 50, guild_id=None):
+    score_fn = HS_CATEGORIES[category]
+    scored = [(uid, score_fn(p)) for uid, p in players.items() if guild_id is None or guild_id in p.guild_ids]
+    scored = [s for s in scored if s[1] > 0]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[:n]
+
+
+def run() -> None:
+    rng = random.Random(1)
+    players = {
+        uid: PlayerState(
+            user_id=uid, kills=rng.randint(0, 2_000), deaths=rng.randint(0, 300),
+            coins=rng.randint(0, 10_000_000), slayer_xp=rng.randint(0, 2_000_000),
+            guild_ids=[uid % GUILDS],
+        )
+        for uid in range(PLAYERS)
+    }
+    hs = LeaderboardManager(fake_cog(players))
+
+    t0 = time.perf_counter()
+    hs.rebuild()
+    build = time.perf_counter() - t0
+
+    cats = list(HS_CATEGORIES)
+    t0 = time.perf_counter()
+    for i in range(QUERIES):
+        legacy_top(players, cats[i % len(cats)])
+    legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(QUERIES):
+        hs.top(cats[i % len(cats)], 50)
+    fast = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(QUERIES):
+        legacy_top(players, cats[i % len(cats)], guild_id=i % GUILDS)
+    legacy_guild = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(QUERIES):
+        hs.top(cats[i % len(cats)], 50, i % GUILDS)
+    fast_guild = time.perf_counter() - t0
+
+    uids = [rng.randrange(PLAYERS) for _ in range(UPDATES)]
+    t0 = time.perf_counter()
+    for uid in uids:
+        p = players[uid]
+        p.kills += 1
+        p.coins = max(0, p.coins + rng.randint(-500_000, 500_000))
+        hs.update((uid,))
+    upd = time.perf_counter() - t0
+
+    assert [s for _, s in hs.top("coins", 50)] == [s for _, s in legacy_top(players, "coins")]
+    assert [s for _, s in hs.top("kills", 50, 7)] == [s for _, s in legacy_top(players, "kills", guild_id=7)]
+    print(f"{PLAYERS:,} players, {len(cats)} categories (rebuild {build * 1e3:.0f} ms)")
+    print(f"  legacy query : {legacy / QUERIES * 1e3:8.3f} ms")
+    print(f"  top-K query  : {fast / QUERIES * 1e3:8.3f} ms  ({legacy / fast:,.0f}x)")
+    print(f"  legacy guild : {legacy_guild / QUERIES * 1e3:8.3f} ms  ({GUILDS} guilds)")
+    print(f"  guild shard  : {fast_guild / QUERIES * 1e3:8.3f} ms  ({legacy_guild / fast_guild:,.0f}x)")
+    print(f"  update       : {upd / UPDATES * 1e6:8.2f} µs per changed player")
+
+
+if __name__ == "__main__":
+    run()
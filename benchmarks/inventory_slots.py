@@ -0,0 +1,60 @@
+"""Free-slot checks: maintained Inventory counter vs. walking the dict.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.inventory_slots
+"""
+
+import random
+import time
+from typing import Dict
+
+from ..items import FOOD, ITEMS
+from ..models import Inventory
+
+CHECKS = 200_000
+
+
+def legacy_slots_used(bag: Dict[str, int]) -> int:
+    """The pre-counter inv_slots_used, kept verbatim for comparison."""
+    used = 0
+    for name, qty in bag.items():
+        if qty <= 0:
+            continue
+        if name in FOOD:
+            used += qty
+            continue
+        meta = ITEMS.get(name)
+        if name.startswith("Noted ") or (meta is not None and meta.get("stackable", False)):
+            used += 1
+        else:
+            used += qty
+    return used
+
+
+def run() -> None:
+    rng = random.Random(1)
+    names = list(ITEMS)
+    # A typical mid-run inventory: food, runes/ammo and a handful of drops
+    plain = {name: rng.randint(1, 3) for name in rng.sample(names, 20)}
+    plain.update({food: 2 for food in list(FOOD)[:3]})
+    inv = Inventory(plain)
+    assert inv.slots == legacy_slots_used(plain)
+
+    t0 = time.perf_counter()
+    for _ in range(CHECKS):
+        legacy_slots_used(plain)
+    legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(CHECKS):
+        inv.slots
+    fast = time.perf_counter() - t0
+
+    print(f"{CHECKS:,} slot checks on a {len(plain)}-item inventory")
+    print(f"  legacy  : {legacy / CHECKS * 1e6:6.3f} µs/check")
+    print(f"  counter : {fast / CHECKS * 1e6:6.3f} µs/check  ({legacy / fast:.0f}x)")
+
+
+if __name__ == "__main__":
+    run()
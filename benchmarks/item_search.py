@@ -0,0 +1,68 @@
+"""Item search: word-level FuzzyIndex vs. a substring scan over every alias.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.item_search
+"""
+
+import time
+from typing import Dict, List
+
+from ..player_manager import PlayerManager
+
+QUERIES = ["shark", "shrak", "drag", "rune", "bld rune", "anglr", "abyssal whip", "zarveth", "cha", "qqqq"]
+ROUNDS = 2_000
+
+
+def legacy_search(aliases: Dict[str, str], query: str) -> List[str]:
+    """The bank-search rule (substring of the lowercased name) applied to every alias."""
+    q = query.lower()
+    return sorted({canonical for alias, canonical in aliases.items() if q in alias})
+
+
+# (query, name that must rank above, name that must rank below)
+RANKING = [
+    ("bld rune", "Blood rune", "Air rune"),
+    ("bld rune", "Air rune", "Rune sq shield"),
+    ("shrak", "Shark", None),
+    ("anglr", "Anglerfish", None),
+    ("dragon dagger", "Dragon dagger", "Rune dagger"),
+]
+
+
+def check_ranking(pm: PlayerManager) -> None:
+    for q, above, below in RANKING:
+        got = pm.search_items(q, limit=None)
+        assert above in got, f"{q!r}: {above} missing from {got[:5]}"
+        if below is not None:
+            assert below in got and got.index(above) < got.index(below), f"{q!r}: {got[:5]}"
+
+
+def run() -> None:
+    pm = PlayerManager(cog=None)
+    pm.build_item_alias_map()
+    aliases = pm._item_alias_map
+    check_ranking(pm)
+
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        for q in QUERIES:
+            legacy_search(aliases, q)
+    legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        for q in QUERIES:
+            pm.search_items(q)
+    fast = time.perf_counter() - t0
+
+    n = ROUNDS * len(QUERIES)
+    print(f"{n:,} searches over {len(aliases)} names/aliases")
+    print(f"  substring scan : {legacy / n * 1e6:7.2f} µs/search")
+    print(f"  FuzzyIndex     : {fast / n * 1e6:7.2f} µs/search  ({legacy / fast:.1f}x)")
+    for q in QUERIES[:5]:
+        print(f"  {q!r:12} -> {pm.search_items(q, limit=3)}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,83 @@
+"""Loot roll cost: compiled alias tables vs. per-entry rolling.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.loot_tables
+"""
+
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config_default import DEFAULT_CONFIG
+from ..items import ITEMS
+from ..loot_manager import CompiledTable
+from ..models import parse_chance
+
+ROLLS = 200_000
+
+
+def legacy_roll_pick_one(entries: List[Dict[str, Any]]) -> Optional[Tuple[str, int]]:
+    """The pre-compilation roll_pick_one, kept verbatim for comparison."""
+    successes = []
+    for e in entries or []:
+        try:
+            item = str(e.get("item", "")).strip()
+            if not item:
+                continue
+            ch = parse_chance(e.get("chance", 0))
+            if ch <= 0:
+                continue
+            if random.random() <= ch:
+                lo = int(e.get("min", 1))
+                hi = int(e.get("max", lo))
+                if hi < lo:
+                    hi = lo
+                qty = random.randint(lo, hi)
+                noted = bool(e.get("noted", False))
+                if qty > 0:
+                    successes.append((ch, item, qty, noted))
+        except Exception:
+            continue
+    if not successes:
+        return None
+    min_ch = min(s[0] for s in successes)
+    rarest = [s for s in successes if s[0] == min_ch]
+    _, item, qty, noted = random.choice(rarest)
+    if noted and not bool(ITEMS.get(item, {}).get("stackable", False)):
+        item = "Noted " + item
+    return item, qty
+
+
+def _tables() -> Dict[str, List[Dict[str, Any]]]:
+    out = {f"wildy/{band}": t for band, t in DEFAULT_CONFIG["loot_tables"].items()}
+    for npc_type, drop in DEFAULT_CONFIG["npc_drops"].items():
+        out[f"{npc_type}/loot"] = drop.get("loot", [])
+    return out
+
+
+def run() -> None:
+    tables = _tables()
+    compiled = {name: CompiledTable(entries) for name, entries in tables.items()}
+    names = list(tables)
+
+    rng = random.Random(1)
+    order = [rng.choice(names) for _ in range(ROLLS)]
+
+    t0 = time.perf_counter()
+    for name in order:
+        legacy_roll_pick_one(tables[name])
+    legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for name in order:
+        compiled[name].roll()
+    fast = time.perf_counter() - t0
+
+    print(f"{ROLLS:,} rolls across {len(names)} tables")
+    print(f"  legacy   : {legacy / ROLLS * 1e6:6.2f} µs/roll")
+    print(f"  compiled : {fast / ROLLS * 1e6:6.2f} µs/roll  ({legacy / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,76 @@
+"""Startup cost with lazily loaded players vs. building every PlayerState up front.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.player_cache
+"""
+
+import random
+import time
+import tracemalloc
+
+from ..items import ITEMS
+from ..leaderboard import LeaderboardManager
+from ..models import PlayerState
+from .common import fake_cog
+
+PLAYERS = 50_000
+ACTIVE = 2_000
+
+
+def stored_records(rng: random.Random):
+    names = list(ITEMS)
+    return {
+        str(uid): PlayerState(
+            user_id=uid, kills=rng.randint(0, 500), coins=rng.randint(0, 5_000_000),
+            inventory={rng.choice(names): rng.randint(1, 50) for _ in range(rng.randint(0, 20))},
+            bank={rng.choice(names): rng.randint(1, 5_000) for _ in range(rng.randint(0, 60))},
+        ).to_dict()
+        for uid in range(PLAYERS)
+    }
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    took = time.perf_counter() - t0
+    tracemalloc.start()
+    out = fn()
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return out, took, mem
+
+
+def run() -> None:
+    rng = random.Random(1)
+    records = stored_records(rng)
+    active = rng.sample(range(PLAYERS), ACTIVE)
+
+    def legacy():
+        cog = fake_cog({int(uid): PlayerState.from_dict(d) for uid, d in records.items()})
+        LeaderboardManager(cog).rebuild()
+        return cog.players
+
+    def lazy():
+        cog = fake_cog(cache_size=ACTIVE)
+        cog.players.load(records)
+        LeaderboardManager(cog).rebuild()
+        return cog.players
+
+    _, legacy_t, legacy_mem = timed(legacy)
+    repo, lazy_t, lazy_mem = timed(lazy)
+
+    t0 = time.perf_counter()
+    for uid in active:
+        repo.get(uid)
+    fault = (time.perf_counter() - t0) / ACTIVE
+
+    assert len(repo.hot) == ACTIVE and len(repo) == PLAYERS
+    print(f"{PLAYERS:,} stored players, {ACTIVE:,} active")
+    print(f"  startup  : {legacy_t * 1e3:8.0f} -> {lazy_t * 1e3:8.0f} ms (load + highscores rebuild)")
+    print(f"  objects  : {legacy_mem / 2**20:8.1f} -> {lazy_mem / 2**20:8.1f} MiB allocated at startup")
+    print(f"  fault-in : {fault * 1e6:8.1f} µs per cold player on first command")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,82 @@
+"""Bank/inventory key lookups: NamedKeys index vs. normalizing every key.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.player_keys
+"""
+
+import os
+import random
+import re
+import time
+
+from ..items import ITEMS
+from ..name_index import NamedKeys
+from ..player_manager import PlayerManager
+
+LOOKUPS = 100_000
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# A .keys() view hides the NamedKeys behind it, so such a call always scans
+KEYS_VIEW_CALL = re.compile(r"resolve_from_keys_case_insensitive\([^)\n]*\.keys\(\)\)")
+
+
+class CountingKeys(NamedKeys):
+    """Counts index lookups, so a resolver that falls back to scanning is caught."""
+
+    __slots__ = ("hits",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hits = 0
+
+    def resolve(self, query):
+        self.hits += 1
+        return super().resolve(query)
+
+
+def keys_view_callers():
+    """file:line of every call that passes .keys() instead of the container."""
+    out = []
+    for name in sorted(os.listdir(PACKAGE_DIR)):
+        if not name.endswith(".py"):
+            continue
+        with open(os.path.join(PACKAGE_DIR, name), "r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                if KEYS_VIEW_CALL.search(line):
+                    out.append(f"{name}:{lineno}")
+    return out
+
+
+def run() -> None:
+    bad = keys_view_callers()
+    assert not bad, f"pass p.inventory / p.bank, not .keys(): {', '.join(bad)}"
+
+    pm = PlayerManager(cog=None)
+    rng = random.Random(1)
+    names = rng.sample(list(ITEMS), min(300, len(ITEMS)))
+    plain = {name: rng.randint(1, 5_000) for name in names}
+    bank = CountingKeys(plain)
+    queries = [rng.choice(names).upper().replace(" ", "  ") for _ in range(LOOKUPS)]
+
+    # Callers pass the container itself (see Wilderness._resolve_from_keys_case_insensitive)
+    for q in queries[:100]:
+        assert pm.resolve_from_keys_case_insensitive(q, bank) == pm.resolve_from_keys_case_insensitive(q, plain)
+    assert bank.hits == 100, "resolve_from_keys_case_insensitive scanned the keys instead of using the index"
+
+    t0 = time.perf_counter()
+    for q in queries:
+        pm.resolve_from_keys_case_insensitive(q, plain)
+    legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for q in queries:
+        pm.resolve_from_keys_case_insensitive(q, bank)
+    fast = time.perf_counter() - t0
+
+    print(f"{LOOKUPS:,} lookups in a {len(plain)}-item bank")
+    print(f"  scan    : {legacy / LOOKUPS * 1e6:7.2f} µs/lookup")
+    print(f"  indexed : {fast / LOOKUPS * 1e6:7.2f} µs/lookup  ({legacy / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    run()
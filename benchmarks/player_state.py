@@ -0,0 +1,86 @@
+"""PlayerState memory and per-persist serialization: slotted + to_dict vs. the old dataclass + asdict.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.player_state
+"""
+
+import json
+import random
+import time
+import tracemalloc
+from dataclasses import asdict, field, fields, make_dataclass
+
+from ..items import ITEMS
+from ..models import PlayerState
+
+PLAYERS = 10_000
+
+# The pre-slots layout: same fields, same __post_init__, a per-instance __dict__
+LegacyPlayerState = make_dataclass(
+    "LegacyPlayerState",
+    [(f.name, f.type, field(default=f.default)) if f.name != "user_id" else (f.name, f.type)
+     for f in fields(PlayerState) if f.init],
+    namespace={"__post_init__": PlayerState.__post_init__},
+)
+
+
+def synthetic(rng: random.Random):
+    names = list(ITEMS)
+    out = []
+    for uid in range(PLAYERS):
+        d = {
+            "user_id": uid, "started": True, "coins": rng.randint(0, 5_000_000),
+            "inventory": {rng.choice(names): rng.randint(1, 50) for _ in range(rng.randint(0, 20))},
+            "bank": {rng.choice(names): rng.randint(1, 5_000) for _ in range(rng.randint(0, 80))},
+            "equipment": {"mainhand": rng.choice(names), "head": rng.choice(names)},
+            "kills": rng.randint(0, 500), "deaths": rng.randint(0, 100),
+            "npc_kills": {f"NPC {i}": rng.randint(1, 200) for i in range(rng.randint(0, 15))},
+        }
+        if rng.random() < 0.2:
+            d["presets"] = {"pvm": {"equipment": dict(d["equipment"]), "inventory": {"Shark": 10}}}
+        if rng.random() < 0.1:
+            d["in_wilderness"] = True
+            d["ground_items"] = [[rng.choice(names), 1, 0] for _ in range(rng.randint(1, 5))]
+        out.append(d)
+    return out
+
+
+def measure(make, records):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    players = [make(d) for d in records]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    return players, size
+
+
+def run() -> None:
+    records = synthetic(random.Random(1))
+    legacy_players, legacy_mem = measure(lambda d: LegacyPlayerState(**d), records)
+    players, mem = measure(PlayerState.from_dict, records)
+
+    t0 = time.perf_counter()
+    legacy_out = [asdict(p) for p in legacy_players]
+    legacy_ser = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    out = [p.to_dict() for p in players]
+    ser = time.perf_counter() - t0
+
+    for p, d in zip(players[:500], out):
+        q = PlayerState.from_dict(json.loads(json.dumps(d)))
+        q.last_action = p.last_action
+        assert q == p
+
+    legacy_bytes = sum(len(json.dumps(d, separators=(",", ":"))) for d in legacy_out)
+    new_bytes = sum(len(json.dumps(d, separators=(",", ":"))) for d in out)
+    print(f"{PLAYERS:,} synthetic players")
+    print(f"  memory   : {legacy_mem / PLAYERS:8,.0f} -> {mem / PLAYERS:8,.0f} bytes per player (incl. containers)")
+    print(f"  serialize: {legacy_ser * 1e3:8.1f} -> {ser * 1e3:8.1f} ms for all players ({legacy_ser / ser:.1f}x)")
+    print(f"  JSON     : {legacy_bytes / PLAYERS:8,.0f} -> {new_bytes / PLAYERS:8,.0f} bytes per player")
+
+
+if __name__ == "__main__":
+    run()
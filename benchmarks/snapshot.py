@@ -0,0 +1,71 @@
+"""Cold start and compaction: binary players snapshot vs. players.json.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.snapshot
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+
+from ..items import ITEMS
+from ..models import PackedRecord, PlayerState, read_players_snapshot, write_players_snapshot
+from ..player_repository import SUMMARY_FIELDS
+
+PLAYERS = 50_000
+
+
+def records(rng: random.Random):
+    names = list(ITEMS)
+    return {
+        str(uid): PlayerState(
+            user_id=uid, kills=rng.randint(0, 500), coins=rng.randint(0, 5_000_000),
+            inventory={rng.choice(names): rng.randint(1, 50) for _ in range(rng.randint(0, 20))},
+            bank={rng.choice(names): rng.randint(1, 5_000) for _ in range(rng.randint(0, 60))},
+            npc_kills={f"NPC {i}": rng.randint(1, 200) for i in range(rng.randint(0, 15))},
+        ).to_dict()
+        for uid in range(PLAYERS)
+    }
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def run() -> None:
+    recs = records(random.Random(1))
+    packed = {uid: PackedRecord.encode(d, SUMMARY_FIELDS) for uid, d in recs.items()}
+    with tempfile.TemporaryDirectory() as tmp:
+        js = os.path.join(tmp, "players.json")
+        snap = os.path.join(tmp, "players.snap")
+
+        def write_json():
+            with open(js, "w", encoding="utf-8") as f:
+                json.dump(recs, f, indent=2, ensure_ascii=False)
+
+        _, json_write = timed(write_json)
+        _, snap_write = timed(lambda: write_players_snapshot(snap, packed))
+
+        def legacy_load():
+            with open(js, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {int(uid): PlayerState.from_dict(d) for uid, d in data.items()}
+
+        _, legacy = timed(legacy_load)
+        loaded, fast = timed(lambda: read_players_snapshot(snap))
+        sizes = os.path.getsize(js), os.path.getsize(snap)
+
+    assert loaded["123"].decode() == recs["123"]
+    print(f"{PLAYERS:,} players")
+    print(f"  cold start : {legacy * 1e3:8.0f} -> {fast * 1e3:8.0f} ms (json.load + from_dict vs. index + summaries)")
+    print(f"  compaction : {json_write * 1e3:8.0f} -> {snap_write * 1e3:8.0f} ms (json.dump vs. snapshot of packed records)")
+    print(f"  file size  : {sizes[0] / 2**20:8.1f} -> {sizes[1] / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,334 @@
+"""Hot-path benchmark suite with saved results and regression checks.
+
+Boots the real cog against the fake discord layer (see fake_discord.py) in
+a throwaway data directory and times PvM fights, loot rolls,
+equipped_bonus, per-command persistence, flushes, compaction and cold
+start at each player count, GE matching against large books, and the
+highscores embeds. Every result is a time per operation, lower is better.
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.suite --out baseline.json
+    python -m <package>.benchmarks.suite --baseline baseline.json
+
+With --baseline, exits 1 if any result is more than --tolerance slower
+than the saved one. Compare runs from the same machine only.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from . import fake_discord
+
+# Before anything imports discord
+fake_discord.install()
+
+from ..grand_exchange import GEOffer, GEOrderBook  # noqa: E402
+from ..items import ITEMS  # noqa: E402
+from ..models import PlayerState, _now  # noqa: E402
+from ..wilderness import Wilderness  # noqa: E402
+from .ge_orderbook import _probes, _resting  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000)
+GE_SIZES = (10_000, 100_000)
+GUILD_ID = 1
+FIGHTS = 2_000
+ROLLS = 100_000
+BONUS_CALLS = 100_000
+COMMANDS = 1_000
+FLUSH_EVERY = 50
+EMBEDS = 200
+
+NPC_NAMES = ("Revenant imp", "Revenant knight", "Fury Bunny", "Hollow Warden", "Revenant Archon")
+LOADOUTS = (
+    {"mainhand": "Fury Paws", "helm": "Black Mask", "amulet": "Amulet of Seeping", "cape": "Shroud of the Undying"},
+    {"mainhand": "Soulfire staff", "offhand": "Cindertome"},
+    {"mainhand": "Viggora's Chainmace"},
+)
+SUPPLIES = {"Shark": 10, "Manta Ray": 5, "Blood rune": 500, "Revenant ether": 300}
+
+Results = Dict[str, Tuple[float, str]]
+
+
+def best_of(repeat: int, fn: Callable[[], float]) -> float:
+    """fn returns seconds per operation; keep the fastest run."""
+    return min(fn() for _ in range(repeat))
+
+
+async def best_of_async(repeat: int, fn: Callable[[], Awaitable[float]]) -> float:
+    return min([await fn() for _ in range(repeat)])
+
+
+def fake_player(uid: int, rng: random.Random, names: List[str], now: int) -> PlayerState:
+    p = PlayerState(
+        user_id=uid, kills=rng.randint(0, 500), deaths=rng.randint(0, 200), escapes=rng.randint(0, 50),
+        coins=rng.randint(0, 5_000_000), bank_coins=rng.randint(0, 50_000_000),
+        slayer_xp=rng.randint(0, 2_000_000), unique_drops=rng.randint(0, 20),
+        inventory={rng.choice(names): rng.randint(1, 50) for _ in range(rng.randint(0, 20))},
+        bank={rng.choice(names): rng.randint(1, 5_000) for _ in range(rng.randint(0, 60))},
+        equipment=dict(rng.choice(LOADOUTS)),
+        last_action=now - rng.randint(0, 30 * 86400),
+    )
+    if uid % 10 == 0:
+        p.guild_ids.append(GUILD_ID)
+    return p
+
+
+async def boot() -> Wilderness:
+    """cog_load, minus the background tasks (the suite drives flushes itself)."""
+    cog = Wilderness(None)
+    await cog.cog_load()
+    for task in (cog._timer_task, cog._archive_task, cog._flush_task):
+        task.cancel()
+    return cog
+
+
+# ── Workloads ──
+
+def bench_fights(cog: Wilderness, repeat: int) -> Results:
+    npcs = [cog.player_mgr.resolve_npc(name) for name in NPC_NAMES]
+
+    def once() -> float:
+        random.seed(1)
+        fights = []
+        for i in range(FIGHTS):
+            npc = npcs[i % len(npcs)]
+            p = PlayerState(
+                user_id=i, equipment=dict(LOADOUTS[i % len(LOADOUTS)]), inventory=dict(SUPPLIES),
+                in_wilderness=True, wildy_level=int(npc["min_wildy"]),
+            )
+            fights.append((p, npc))
+        sim = cog.combat_mgr.simulate_pvm_fight_and_loot
+        t0 = time.perf_counter()
+        for p, npc in fights:
+            sim(p, npc)
+        return (time.perf_counter() - t0) / FIGHTS
+
+    return {"fight.pvm": (best_of(repeat, once) * 1e6, "us/fight")}
+
+
+def bench_loot(cog: Wilderness, repeat: int) -> Results:
+    cfg = cog.config
+    tables = list((cfg.get("loot_tables") or {}).values())
+    tables += [drop.get("loot", []) for drop in (cfg.get("npc_drops") or {}).values()]
+    tables += [drop.get("unique", []) for drop in (cfg.get("npc_drops") or {}).values()]
+    rng = random.Random(1)
+    order = [rng.choice(tables) for _ in range(ROLLS)]
+
+    def once() -> float:
+        roll = cog.loot_mgr.roll_pick_one
+        t0 = time.perf_counter()
+        for entries in order:
+            roll(entries)
+        return (time.perf_counter() - t0) / ROLLS
+
+    return {"loot.roll": (best_of(repeat, once) * 1e6, "us/roll")}
+
+
+def bench_equipped_bonus(cog: Wilderness, repeat: int) -> Results:
+    players = [PlayerState(user_id=i, equipment=dict(gear), inventory=dict(SUPPLIES)) for i, gear in enumerate(LOADOUTS)]
+    bonus = cog.inv_mgr.equipped_bonus
+
+    def cached() -> float:
+        t0 = time.perf_counter()
+        for i in range(BONUS_CALLS):
+            bonus(players[i % len(players)], vs_npc=bool(i & 1))
+        return (time.perf_counter() - t0) / BONUS_CALLS
+
+    def regear() -> float:
+        t0 = time.perf_counter()
+        for i in range(BONUS_CALLS // 10):
+            p = players[i % len(players)]
+            p.gear_changed()
+            bonus(p, vs_npc=True)
+        return (time.perf_counter() - t0) / (BONUS_CALLS // 10)
+
+    return {
+        "inventory.equipped_bonus": (best_of(repeat, cached) * 1e6, "us/call"),
+        "inventory.equipped_bonus_regear": (best_of(repeat, regear) * 1e6, "us/call"),
+    }
+
+
+def bench_highscores(cog: Wilderness, guild: Any, repeat: int, n: int) -> Results:
+    out: Results = {}
+    for label, category, where in (
+        ("kills", "kills", None), ("overall", "overall", None), ("guild_kills", "kills", guild),
+    ):
+        def once() -> float:
+            t0 = time.perf_counter()
+            for _ in range(EMBEDS):
+                cog._highscores_embed(category, where)
+            return (time.perf_counter() - t0) / EMBEDS
+
+        out[f"highscores.{n}.{label}"] = (best_of(repeat, once) * 1e6, "us/embed")
+    return out
+
+
+def bench_ge(repeat: int) -> Results:
+    out: Results = {}
+    for n in GE_SIZES:
+        def once() -> float:
+            rng = random.Random(n)
+            book = GEOrderBook()
+            for o in _resting(n, rng):
+                book.add(o)
+            probes: List[GEOffer] = _probes(n, rng)
+            t0 = time.perf_counter()
+            for o in probes:
+                book.match(o)
+            return (time.perf_counter() - t0) / len(probes)
+
+        out[f"ge.{n}.match"] = (best_of(repeat, once) * 1e6, "us/match")
+    return out
+
+
+async def bench_players(n: int, repeat: int) -> Results:
+    """Persistence and highscores with n stored players, from a cold start."""
+    out: Results = {}
+    rng = random.Random(n)
+    names = list(ITEMS)
+    now = _now()
+
+    cog = await boot()
+    for uid in range(1, n + 1):
+        cog.players[uid] = fake_player(uid, rng, names, now)
+    cog.hs_mgr.rebuild()
+    cog.timer_mgr.rebuild()
+    await cog.store.compact()
+
+    t0 = time.perf_counter()
+    cog = await boot()
+    out[f"persist.{n}.cold_start"] = ((time.perf_counter() - t0) * 1e3, "ms")
+
+    # A command: fetch the author (often cold), change them, _persist();
+    # the flusher's work is timed separately, every FLUSH_EVERY commands
+    cog.store.compact_every = 1 << 30
+    uids = [rng.randint(1, n) for _ in range(COMMANDS)]
+
+    async def commands_once() -> Tuple[float, float]:
+        spent = flushed = 0.0
+        for i, uid in enumerate(uids, 1):
+            t0 = time.perf_counter()
+            p = cog.players.get(uid)
+            p.kills += 1
+            cog._mark_changed(uid)
+            await cog._persist()
+            spent += time.perf_counter() - t0
+            if i % FLUSH_EVERY == 0:
+                t0 = time.perf_counter()
+                await cog._flush_players()
+                flushed += time.perf_counter() - t0
+        return spent / COMMANDS, flushed / (COMMANDS // FLUSH_EVERY)
+
+    runs = [await commands_once() for _ in range(repeat)]
+    out[f"persist.{n}.command"] = (min(r[0] for r in runs) * 1e6, "us/command")
+    out[f"persist.{n}.flush"] = (min(r[1] for r in runs) * 1e3, f"ms/{FLUSH_EVERY} players")
+
+    async def compact_once() -> float:
+        t0 = time.perf_counter()
+        await cog.store.compact(cog.lock_mgr.barrier)
+        return time.perf_counter() - t0
+
+    out[f"persist.{n}.compact"] = (await best_of_async(repeat, compact_once) * 1e3, "ms")
+
+    members = {uid: fake_discord.Member(uid) for uid in range(GUILD_ID * 10, n + 1, 10)}
+    out.update(bench_highscores(cog, fake_discord.Guild(GUILD_ID, members), repeat, n))
+    await cog.cog_unload()
+    return out
+
+
+async def run_suite(sizes: List[int], repeat: int) -> Results:
+    out: Results = {}
+    cog = await boot()
+    out.update(bench_fights(cog, repeat))
+    out.update(bench_loot(cog, repeat))
+    out.update(bench_equipped_bonus(cog, repeat))
+    await cog.cog_unload()
+    out.update(bench_ge(repeat))
+    for n in sizes:
+        out.update(await bench_players(n, repeat))
+    return out
+
+
+# ── Reporting ──
+
+def compare(results: Results, baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print new vs. saved per result; returns the names that regressed."""
+    saved = baseline.get("results", {})
+    regressed = []
+    print(f"\n{'benchmark':<36} {'baseline':>12} {'now':>12} {'change':>8}")
+    for name, (value, unit) in results.items():
+        old = (saved.get(name) or {}).get("value")
+        if not old:
+            print(f"{name:<36} {'-':>12} {value:>12.2f} {'new':>8}")
+            continue
+        change = value / old - 1
+        flag = ""
+        if change > tolerance:
+            regressed.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<36} {old:>12.2f} {value:>12.2f} {change:>+8.1%}{flag}")
+    return regressed
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--out", help="write results to this JSON file")
+    ap.add_argument("--baseline", help="compare against results saved with --out")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs. the baseline (0.25 = 25%%)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="player counts")
+    ap.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the fastest counts")
+    args = ap.parse_args(argv)
+
+    cwd = os.getcwd()
+    out_path = os.path.join(cwd, args.out) if args.out else None
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    # DATA_DIR is relative, so the cog writes under this temp dir
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            results = asyncio.run(run_suite(args.sizes, args.repeat))
+        finally:
+            os.chdir(cwd)
+
+    print(f"{'benchmark':<36} {'value':>12}  unit")
+    for name, (value, unit) in results.items():
+        print(f"{name:<36} {value:>12.2f}  {unit}")
+
+    if out_path:
+        doc = {
+            "meta": {
+                "created": int(time.time()),
+                "python": platform.python_version(),
+                "machine": platform.platform(),
+                "sizes": args.sizes,
+                "repeat": args.repeat,
+            },
+            "results": {name: {"value": value, "unit": unit} for name, (value, unit) in results.items()},
+        }
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(doc, f, indent=2)
+        print(f"\nwrote {out_path}")
+
+    if baseline is not None:
+        regressed = compare(results, baseline, args.tolerance)
+        if regressed:
+            print(f"\n{len(regressed)} regression(s) over {args.tolerance:.0%}: {', '.join(regressed)}")
+            return 1
+        print(f"\nno regressions over {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,69 @@
+"""AFK expiry cost: deadline heap vs. the old 5-minute scan over every player.
+
+Run from the directory containing the cog package:
+
+    python -m <package>.benchmarks.timers
+"""
+
+import random
+import time
+
+from . import fake_discord
+
+# timers imports combat_manager, which imports discord
+fake_discord.install()
+
+from ..combat_manager import AFK_TIMEOUT_SEC  # noqa: E402
+from ..models import PlayerState  # noqa: E402
+from ..timers import TimerManager  # noqa: E402
+from .common import fake_cog  # noqa: E402
+
+PLAYERS = 50_000
+IN_WILDY = 0.02
+SWEEPS = 50
+
+
+def legacy_sweep(players, now: int):
+    return [
+        uid for uid, p in players.items()
+        if p.in_wilderness and p.last_action and now - p.last_action >= AFK_TIMEOUT_SEC
+    ]
+
+
+def run() -> None:
+    rng = random.Random(1)
+    now = int(time.time())
+    players = {}
+    for uid in range(PLAYERS):
+        p = PlayerState(user_id=uid, last_action=now - rng.randint(0, 2 * AFK_TIMEOUT_SEC))
+        p.in_wilderness = rng.random() < IN_WILDY
+        players[uid] = p
+    timers = TimerManager(fake_cog(players))
+
+    t0 = time.perf_counter()
+    timers.rebuild()
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(SWEEPS):
+        expected = legacy_sweep(players, now)
+    legacy = (time.perf_counter() - t0) / SWEEPS
+
+    t0 = time.perf_counter()
+    for uid in range(PLAYERS):
+        timers.track(uid)
+    track = (time.perf_counter() - t0) / PLAYERS
+
+    t0 = time.perf_counter()
+    due = timers._pop_due(now)
+    pop = time.perf_counter() - t0
+
+    assert sorted(uid for kind, uid in due if kind == "afk") == sorted(expected)
+    print(f"{PLAYERS:,} players, {len(expected):,} AFK in the wilderness (heap build {build * 1e3:.0f} ms)")
+    print(f"  legacy sweep : {legacy * 1e3:8.3f} ms every 5 minutes")
+    print(f"  heap pop     : {pop * 1e3:8.3f} ms for the due timers")
+    print(f"  track        : {track * 1e6:8.2f} µs per changed player")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,20 +1,20 @@
 import discord
 import asyncio
 import random
-from typing import Dict, Any, Optional, Tuple, List, TYPE_CHECKING
+from typing import Dict, Any, Optional, Tuple, List, Union, Callable, TYPE_CHECKING
 
 from .models import PlayerState, DuelState, clamp, parse_chance, _now
-from .npcs import NPCS, NPC_SLAYER
-from .items import FOOD, ITEMS, STANCE_TO_STYLE, COMBAT_KEY_DISPLAY, STYLE_DISPLAY, STANCE_DISPLAY
+from .npcs import NPCS, NPC_SLAYER, REVENANT_TYPES
+from .items import FOOD, ITEMS, STANCE_TO_STYLE, COMBAT_KEY_DISPLAY, STYLE_DISPLAY, STANCE_DISPLAY, ETHER_WEAPONS, SLAYER_HELMS
 from .consume import CONSUMABLES
+from . import fight_log as fl
+from .fight_log import FightLog
+from .npc_abilities import FightState, hooks_for
 
 if TYPE_CHECKING:
     from .wilderness import Wilderness
 
-REVENANT_TYPES = {"revenant goblin", "revenant knight", "revenant demon", "revenant necro", "revenant archon", "revenant imp", "revenant pyromancer"}
-ETHER_WEAPONS = {"Viggora's Chainmace", "Abyssal Chainmace"}
 AFK_TIMEOUT_SEC = 60 * 60
-AFK_SWEEP_INTERVAL_SEC = 5 * 60
 
 
 class CombatManager:
@@ -92,6 +92,7 @@ class CombatManager:
             dest = self.cog._try_put_item(winner, item, 1)
             lines.append(f"🛡️ Looted equipped ({slot}) {item} x1 {dest}".rstrip())
         loser.equipment.clear()
+        loser.gear_changed()
         return lines
 
     def food_summary_lines(self, eaten: Dict[str, int], inv: Dict[str, int]) -> List[str]:
@@ -157,8 +158,11 @@ class CombatManager:
             chance_str = f"{int(ch*100)}%" if ch > 0 else "0%"
         return f"- {item} x{qty} • {chance_str}"
 
-    def build_pages(self, lines: List[str], per_page: int = 10) -> List[str]:
-        pages: List[str] = []
+    def build_pages(self, lines: Union[List[str], FightLog], per_page: int = 10) -> List[Union[str, Callable[[], str]]]:
+        """Split a log into pages; a FightLog yields lazy page renderers."""
+        if isinstance(lines, FightLog):
+            return lines.pages(per_page) or ["(no log)"]
+        pages: List[Union[str, Callable[[], str]]] = []
         for i in range(0, len(lines), per_page):
             pages.append("\n".join(lines[i:i + per_page]))
         return pages or ["(no log)"]
@@ -230,67 +234,38 @@ class CombatManager:
         return emb
 
     
-    async def afk_sweeper(self):
-        try:
-            while True:
-                await asyncio.sleep(AFK_SWEEP_INTERVAL_SEC)
-                if not self.cog._ready:
-                    continue
-                now = _now()
-                to_tele: List[int] = []
-                async with self.cog._mem_lock:
-                    for uid, p in self.cog.players.items():
-                        try:
-                            if not p.in_wilderness:
-                                continue
-                            last = int(getattr(p, "last_action", 0) or 0)
-                            if last and (now - last) >= AFK_TIMEOUT_SEC:
-                                to_tele.append(uid)
-                        except Exception:
-                            continue
-
-                if not to_tele:
-                    continue
-
-                for uid in to_tele:
-                    p = self.cog.players.get(uid)
-                    if not p:
-                        continue
-
-                    duel = self.duel_active_for_user(uid)
-                    if duel:
-                        key = self.pair_key(duel.a_id, duel.b_id)
-                        self.cog.duels_by_pair.pop(key, None)
-                        if duel.channel_id:
-                            self.cog.duels_by_channel.pop(duel.channel_id, None)
-
-                        ch = self.cog.bot.get_channel(duel.channel_id) if duel.channel_id else None
-                        if isinstance(ch, discord.abc.Messageable):
-                            try:
-                                a_m = None
-                                b_m = None
-                                if hasattr(ch, "guild") and ch.guild:
-                                    a_m = ch.guild.get_member(duel.a_id)
-                                    b_m = ch.guild.get_member(duel.b_id)
-                                a_name = a_m.display_name if a_m else str(duel.a_id)
-                                b_name = b_m.display_name if b_m else str(duel.b_id)
-                                await ch.send(
-                                    f"⏳ AFK: **{a_name if uid == duel.a_id else b_name}** was inactive for 60 minutes and was auto-teleported out. Fight ended."
-                                )
-                            except Exception:
-                                pass
-
-                    p.wildy_run_id = int(p.wildy_run_id) + 1
-                    p.ground_items = []
-                    p.in_wilderness = False
-                    p.skulled = False
-                    p.wildy_level = 1
-                    self.cog._full_heal(p)
+    async def afk_teleport(self, uid: int, p: PlayerState):
+        """Teleport an AFK player out of the wilderness (timer callback, caller holds the lock)."""
+        duel = self.duel_active_for_user(uid)
+        if duel:
+            key = self.pair_key(duel.a_id, duel.b_id)
+            self.cog.duels_by_pair.pop(key, None)
+            if duel.channel_id:
+                self.cog.duels_by_channel.pop(duel.channel_id, None)
 
-                await self.cog._persist()
+            ch = self.cog.bot.get_channel(duel.channel_id) if duel.channel_id else None
+            if isinstance(ch, discord.abc.Messageable):
+                try:
+                    a_m = None
+                    b_m = None
+                    if hasattr(ch, "guild") and ch.guild:
+                        a_m = ch.guild.get_member(duel.a_id)
+                        b_m = ch.guild.get_member(duel.b_id)
+                    a_name = a_m.display_name if a_m else str(duel.a_id)
+                    b_name = b_m.display_name if b_m else str(duel.b_id)
+                    await ch.send(
+                        f"⏳ AFK: **{a_name if uid == duel.a_id else b_name}** was inactive for 60 minutes and was auto-teleported out. Fight ended."
+                    )
+                except Exception:
+                    pass
 
-        except asyncio.CancelledError:
-            return
+        p.wildy_run_id = int(p.wildy_run_id) + 1
+        p.ground_items = []
+        p.in_wilderness = False
+        p.skulled = False
+        p.wildy_level = 1
+        self.cog._full_heal(p)
+        self.cog._mark_changed(uid)
 
     
     async def duel_action(
@@ -305,7 +280,7 @@ class CombatManager:
         if ch is None or ch.id not in self.cog.ALLOWED_CHANNEL_IDS:
             return
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(duel.a_id, duel.b_id):
             key = self.pair_key(duel.a_id, duel.b_id)
             if self.cog.duels_by_pair.get(key) is None:
                 await interaction.response.send_message("This fight is no longer active.", ephemeral=True)
@@ -493,7 +468,7 @@ class CombatManager:
                     defender.skulled = False
                     self.cog._full_heal(defender)
 
-                    await self.cog._persist()
+                    await self.cog._persist(duel.a_id, duel.b_id, durable=True)
                     self.cog.duels_by_pair.pop(key, None)
                     self.cog.duels_by_channel.pop(duel.channel_id, None)
                     await interaction.response.edit_message(
@@ -540,22 +515,18 @@ class CombatManager:
         your_hp = p.hp
         start_hp = p.hp
 
-        events: List[str] = []
+        max_hp = int(self.cog.config["max_hp"])
+        events = FightLog(npc_name, npc_max, max_hp, header_lines)
+        events.add(fl.START, start_hp)
         eaten_food: Dict[str, int] = {}
 
-        if header_lines:
-            events.extend(header_lines)
-
-        events.append(f"👹 **{npc_name}** (HP **{npc_max}**) — You start **{start_hp}/{self.cog.config['max_hp']}**")
-
-        force_zero_next_hit = False
+        st = FightState(npc_name, your_hp, max_hp, npc_hp, npc_max_hit, events)
+        st.ethereum = npc_type in REVENANT_TYPES and p.equipment.get("amulet") == "Bracelet of ethereum"
+        st.shroud = p.equipment.get("cape") == "Shroud of the Undying"
+        hooks = hooks_for(chosen_npc)
         bleed_hits = 0
-        netharis_debuff_hits = 0
-        netharis_debuff_amount = 4
-        stone_shell_hits = 0
-        blaze_hits = 0
 
-        while npc_hp > 0 and your_hp > 0:
+        while st.npc_hp > 0 and st.your_hp > 0:
             charged = False
             mainhand = p.equipment.get("mainhand", "")
             mh_meta = ITEMS.get(mainhand, {})
@@ -567,7 +538,7 @@ class CombatManager:
             # Ammo/rune consumption
             ammo_charged, consumed_ammo = self.cog.inv_mgr.check_and_consume_ammo(p)
             if consumed_ammo:
-                events.append(f"🏹 Used **{consumed_ammo}**")
+                events.add(fl.AMMO, consumed_ammo)
 
             bonuses = self.cog._equipped_bonus(p, vs_npc=True, chainmace_charged=charged, consumes_charged=ammo_charged)
             player_stance = self.cog._weapon_stance(p)
@@ -581,205 +552,129 @@ class CombatManager:
             roll_d = random.randint(0, npc_def_stat)
             hit = max(0, roll_a - roll_d)
 
-            # Forced zero mechanic (Zarveth / Windstrider Evasive Dash)
-            if force_zero_next_hit:
+            # Forced zero (force_zero abilities)
+            if st.force_zero:
                 hit = 0
-                force_zero_next_hit = False
-                events.append("🕳️ Your attack is disrupted — your hit is forced to **0**!")
+                st.force_zero = False
+                events.add(fl.ZEROED)
 
-            # Stone Shell (Hollow Warden) — player damage halved
-            if stone_shell_hits > 0 and hit > 0:
+            # Damage shell abilities — player damage halved
+            if st.shell_hits > 0 and hit > 0:
                 hit = max(1, hit // 2)
-                stone_shell_hits -= 1
-                events.append(f"🪨 **Stone Shell** halves your damage! ({stone_shell_hits} hits remaining)")
+                st.shell_hits -= 1
+                events.add(fl.SHELL, st.shell_name, st.shell_hits)
 
             # Wristwraps
             if p.equipment.get("gloves") == "Wristwraps of the Damned":
                 if hit > 0 and random.random() < 0.05:
                     bleed_hits = 3
-                    events.append("🩸 **Bleed inflicted!** Next 3 hits deal +2 damage.")
+                    events.add(fl.BLEED_ON)
 
             if bleed_hits > 0 and hit > 0:
                 bleed_hits -= 1
                 hit += 2
-                events.append(f"🩸 Bleed deals +2 damage. ({bleed_hits} hits remaining)")
+                events.add(fl.BLEED, bleed_hits)
 
             # Slayer helm/mask bonus - 13%/20%/27% damage on task
             helm = p.equipment.get("helm", "")
-            if helm in ("Black Mask", "Slayer Helmet", "Shady Slayer Helm") and hit > 0:
+            if helm in SLAYER_HELMS and hit > 0:
                 task = getattr(p, "slayer_task", None)
                 if task and task.get("npc_type") == npc_type and int(task.get("remaining", 0)) > 0:
-                    mult = 1.27 if helm == "Shady Slayer Helm" else 1.20 if helm == "Slayer Helmet" else 1.13
-                    hit = int(hit * mult)
+                    hit = int(hit * SLAYER_HELMS[helm])
 
-            npc_hp = max(0, npc_hp - hit)
-            events.append(f"🗡️ You hit **{hit}** | You: **{your_hp}/{self.cog.config['max_hp']}** | {npc_name}: **{npc_hp}/{npc_max}**")
-            events.extend(self.cog._consume_buffs_on_hit(p))
+            st.npc_hp = max(0, st.npc_hp - hit)
+            events.add(fl.HIT, hit, st.your_hp, st.npc_hp)
+            for line in self.cog._consume_buffs_on_hit(p):
+                events.text(line)
 
             healed = self.cog._apply_seeping_heal(p, hit)
             if healed > 0:
-                your_hp = int(p.hp)
-                events.append(f"🩸 Amulet of Seeping heals **{healed}** | You: **{your_hp}/{self.cog.config['max_hp']}**")
+                st.your_hp = int(p.hp)
+                events.add(fl.SEEP, healed, st.your_hp)
 
             # Fury Paws weapon special — Paws of Fury (15% chance, 2 extra hits at 50% reduced damage)
-            if p.equipment.get("mainhand") == "Fury Paws" and hit > 0 and npc_hp > 0:
+            if p.equipment.get("mainhand") == "Fury Paws" and hit > 0 and st.npc_hp > 0:
                 if random.random() < 0.15:
-                    events.append("🐾 **Paws of Fury!** Your claws slash twice more!")
+                    events.add(fl.FURY_PROC)
                     for fury_i in range(2):
-                        if npc_hp <= 0:
+                        if st.npc_hp <= 0:
                             break
                         fury_roll_a = random.randint(0, your_atk)
                         fury_roll_d = random.randint(0, npc_def_stat)
                         fury_hit = max(0, fury_roll_a - fury_roll_d)
                         fury_hit = max(1, fury_hit // 2)  # 50% reduced damage
-                        if helm in ("Black Mask", "Slayer Helmet", "Shady Slayer Helm") and fury_hit > 0:
+                        if helm in SLAYER_HELMS and fury_hit > 0:
                             task = getattr(p, "slayer_task", None)
                             if task and task.get("npc_type") == npc_type and int(task.get("remaining", 0)) > 0:
-                                mult = 1.27 if helm == "Shady Slayer Helm" else 1.20 if helm == "Slayer Helmet" else 1.13
-                                fury_hit = int(fury_hit * mult)
-                        npc_hp = max(0, npc_hp - fury_hit)
-                        events.append(f"🐾 Fury slash #{fury_i + 2} deals **{fury_hit}** (50% reduced) | {npc_name}: **{npc_hp}/{npc_max}**")
+                                fury_hit = int(fury_hit * SLAYER_HELMS[helm])
+                        st.npc_hp = max(0, st.npc_hp - fury_hit)
+                        events.add(fl.FURY, fury_i + 2, fury_hit, st.npc_hp)
 
             # Soulfire Staff special — 50% chance (75% with Cindertome) for an extra hit dealing 10 damage
-            if p.equipment.get("mainhand") == "Soulfire staff" and hit > 0 and npc_hp > 0:
+            if p.equipment.get("mainhand") == "Soulfire staff" and hit > 0 and st.npc_hp > 0:
                 sf_chance = 0.75 if p.equipment.get("offhand") == "Cindertome" else 0.50
                 if random.random() < sf_chance:
                     sf_hit = 10
-                    npc_hp = max(0, npc_hp - sf_hit)
-                    events.append(f"🔥 **Soulfire Blaze!** An extra flame deals **{sf_hit}** damage | {npc_name}: **{npc_hp}/{npc_max}**")
+                    st.npc_hp = max(0, st.npc_hp - sf_hit)
+                    events.add(fl.SOULFIRE, sf_hit, st.npc_hp)
 
-            if npc_hp <= 0:
+            if st.npc_hp <= 0:
                 break
 
             def_for_roll = your_def
-            if netharis_debuff_hits > 0:
-                def_for_roll = max(0, your_def - netharis_debuff_amount)
-                netharis_debuff_hits -= 1
+            if st.debuff_hits > 0:
+                def_for_roll = max(0, your_def - st.debuff_amount)
+                st.debuff_hits -= 1
+            st.def_for_roll = def_for_roll
 
             roll_na = random.randint(0, npc_max_hit)
             roll_nd = random.randint(0, def_for_roll)
             npc_hit = max(0, roll_na - roll_nd)
 
-            # Infernal Blaze (Infernal Warlock) — NPC hits deal +3
-            if blaze_hits > 0 and npc_hit > 0:
-                npc_hit += 3
-                blaze_hits -= 1
-                events.append(f"🔥 **Infernal Blaze** adds +3 damage! ({blaze_hits} hits remaining)")
+            # Damage boost abilities — NPC hits deal +amount
+            if st.blaze_hits > 0 and npc_hit > 0:
+                npc_hit += st.blaze_amount
+                st.blaze_hits -= 1
+                events.add(fl.BLAZE, st.blaze_name, st.blaze_amount, st.blaze_hits)
 
-            if npc_type in REVENANT_TYPES and p.equipment.get("amulet") == "Bracelet of ethereum":
+            if st.ethereum:
                 npc_hit = int(npc_hit * 0.5)
 
             # Shroud of the Undying - 2% chance to nullify incoming hit
-            if p.equipment.get("cape") == "Shroud of the Undying" and npc_hit > 0:
+            if st.shroud and npc_hit > 0:
                 if random.random() < 0.02:
                     npc_hit = 0
-                    events.append("🛡️ **Shroud of the Undying** nullifies the hit!")
+                    events.add(fl.SHROUD)
+            st.npc_hit = npc_hit
 
             # Death prevention: if this hit would kill us, eat food first
-            if your_hp - npc_hit <= 0 and npc_hit > 0:
+            if st.your_hp - npc_hit <= 0 and npc_hit > 0:
                 save_food = self.cog.inv_mgr.best_food_in_inventory(p)
                 if save_food:
                     save_heal = int(FOOD.get(save_food, {}).get("heal", 0))
                     if save_heal > 0 and self.cog.inv_mgr.remove_item(p.inventory, save_food, 1):
-                        hp_before_save = your_hp
-                        your_hp = clamp(your_hp + save_heal, 0, int(self.cog.config["max_hp"]))
+                        hp_before_save = st.your_hp
+                        st.your_hp = clamp(st.your_hp + save_heal, 0, max_hp)
                         eaten_food[save_food] = eaten_food.get(save_food, 0) + 1
-                        events.append(f"🍖 **Death prevented!** Auto-ate **{save_food}** (+{your_hp - hp_before_save}) before taking the hit.")
+                        events.add(fl.SAVE_EAT, save_food, st.your_hp - hp_before_save)
 
-            your_hp = clamp(your_hp - npc_hit, 0, int(self.cog.config["max_hp"]))
-            events.append(f"💥 {npc_name} hits **{npc_hit}** | You: **{your_hp}/{self.cog.config['max_hp']}** | {npc_name}: **{npc_hp}/{npc_max}**")
+            st.your_hp = clamp(st.your_hp - npc_hit, 0, max_hp)
+            events.add(fl.NPC_HIT, npc_hit, st.your_hp, st.npc_hp)
 
-            if your_hp > 0:
-                before = your_hp
-                your_hp, ate_food, extra_roll, healed_amt = self.cog._maybe_auto_eat_after_hit(p, your_hp)
+            if st.your_hp > 0:
+                before = st.your_hp
+                st.your_hp, ate_food, extra_roll, healed_amt = self.cog._maybe_auto_eat_after_hit(p, st.your_hp)
                 if ate_food:
                     eaten_food[ate_food] = eaten_food.get(ate_food, 0) + 1
-                    events.append(
-                        f"🍖 Auto-eat **{ate_food}** (+{your_hp - before}) | You: **{your_hp}/{self.cog.config['max_hp']}**"
-                    )
+                    events.add(fl.EAT, ate_food, st.your_hp - before, st.your_hp)
 
-            # Zarveth 5% proc
-            if npc_name == "Zarveth the Veilbreaker" and your_hp > 0 and npc_hp > 0:
-                if random.random() < 0.05:
-                    force_zero_next_hit = True
-                    events.append("🌀 **Zarveth the Veilbreaker** shatters the veil! Your **next hit will deal 0**.")
+            # NPC special abilities (npcs.NPCS "abilities")
+            for hook in hooks:
+                if st.your_hp <= 0 or st.npc_hp <= 0:
+                    break
+                hook(st)
 
-            # Netharis 15% proc - reduces player DEF by 4 for 5 hits
-            if npc_name == "Netharis the Undying" and your_hp > 0 and npc_hp > 0:
-                if random.random() < 0.15:
-                    netharis_debuff_hits = 5
-                    events.append("💀 **Netharis the Undying** curses you! Your defence is reduced by **4** for **5** hits.")
-
-            # Lord Valthyros 10% life steal - heals 100% of damage dealt
-            if npc_name == "Lord Valthyros" and your_hp > 0 and npc_hp > 0 and npc_hit > 0:
-                if random.random() < 0.10:
-                    heal_amt = npc_hit
-                    npc_hp = min(npc_hp + heal_amt, npc_max)
-                    events.append(f"🩸 **Lord Valthyros** drains your blood! Heals **{heal_amt} HP** | {npc_name}: **{npc_hp}/{npc_max}**")
-
-            # Windstrider 10% proc — Evasive Dash (force next player hit to 0)
-            if npc_name == "Windstrider" and your_hp > 0 and npc_hp > 0:
-                if random.random() < 0.10:
-                    force_zero_next_hit = True
-                    events.append("💨 **Windstrider** dashes aside! Your **next hit will deal 0**.")
-
-            # Infernal Warlock 8% proc — Infernal Blaze (+3 NPC hit damage for 3 hits)
-            if npc_name == "Infernal Warlock" and your_hp > 0 and npc_hp > 0:
-                if random.random() < 0.08:
-                    blaze_hits = 3
-                    events.append("🔥 **Infernal Warlock** ignites! NPC hits deal **+3 damage** for **3** hits.")
-
-            # Hollow Warden 10% proc — Stone Shell (player damage halved for 3 hits)
-            if npc_name == "Hollow Warden" and your_hp > 0 and npc_hp > 0:
-                if random.random() < 0.10:
-                    stone_shell_hits = 3
-                    events.append("🪨 **Hollow Warden** raises a Stone Shell! Your damage is **halved** for **3** hits.")
-
-            # Fury Bunny 2-12% proc — Paws of Fury (3 rapid hits, 2nd and 3rd at 50% reduced damage)
-            if npc_name == "Fury Bunny" and your_hp > 0 and npc_hp > 0:
-                fury_chance = random.randint(2, 12) / 100
-                if random.random() < fury_chance:
-                    events.append("🐾 **Fury Bunny** unleashes **Paws of Fury**!")
-                    for paw_i in range(2):
-                        if your_hp <= 0:
-                            break
-                        roll_paw_a = random.randint(0, npc_max_hit)
-                        roll_paw_d = random.randint(0, def_for_roll)
-                        paw_hit = max(0, roll_paw_a - roll_paw_d)
-                        paw_hit = max(1, paw_hit // 2)  # 50% reduced damage
-                        if npc_type in REVENANT_TYPES and p.equipment.get("amulet") == "Bracelet of ethereum":
-                            paw_hit = int(paw_hit * 0.5)
-                        if p.equipment.get("cape") == "Shroud of the Undying" and paw_hit > 0:
-                            if random.random() < 0.02:
-                                paw_hit = 0
-                                events.append("🛡️ **Shroud of the Undying** nullifies the hit!")
-                        your_hp = clamp(your_hp - paw_hit, 0, int(self.cog.config["max_hp"]))
-                        events.append(f"🐾 Paws of Fury hit #{paw_i + 2} deals **{paw_hit}** (50% reduced) | You: **{your_hp}/{self.cog.config['max_hp']}**")
-
-            # Duskwalker 8% proc — Shadow Volley (immediate second NPC attack)
-            if npc_name == "Duskwalker" and your_hp > 0 and npc_hp > 0:
-                if random.random() < 0.08:
-                    events.append("🌑 **Duskwalker** unleashes a Shadow Volley!")
-                    roll_na2 = random.randint(0, npc_max_hit)
-                    roll_nd2 = random.randint(0, def_for_roll)
-                    npc_hit2 = max(0, roll_na2 - roll_nd2)
-                    your_hp = clamp(your_hp - npc_hit2, 0, int(self.cog.config["max_hp"]))
-                    events.append(f"💥 Shadow Volley hits **{npc_hit2}** | You: **{your_hp}/{self.cog.config['max_hp']}**")
-
-            # Emberlord Kael 10% proc — Flame Burst (5 flat unavoidable damage)
-            if npc_name == "Emberlord Kael" and your_hp > 0 and npc_hp > 0:
-                if random.random() < 0.10:
-                    your_hp = clamp(your_hp - 5, 0, int(self.cog.config["max_hp"]))
-                    events.append(f"🌋 **Emberlord Kael** unleashes a Flame Burst! **5** unavoidable damage | You: **{your_hp}/{self.cog.config['max_hp']}**")
-
-            # Gravekeeper Azriel 12% proc — Soul Siphon (life steal + def reduction)
-            if npc_name == "Gravekeeper Azriel" and your_hp > 0 and npc_hp > 0 and npc_hit > 0:
-                if random.random() < 0.12:
-                    heal_amt = npc_hit
-                    npc_hp = min(npc_hp + heal_amt, npc_max)
-                    netharis_debuff_hits = 4
-                    netharis_debuff_amount = 3
-                    events.append(f"👻 **Gravekeeper Azriel** siphons your soul! Heals **{heal_amt} HP** and reduces your defence by **3** for **4** hits. | {npc_name}: **{npc_hp}/{npc_max}**")
+        your_hp = st.your_hp
 
         if your_hp <= 0:
             lost_items = dict(p.inventory)
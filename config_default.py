@@ -13,11 +13,21 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "attack_cooldown_sec": 20,
     "teleport_cooldown_sec": 20,
     "bank_cooldown_sec": 5,
+    "fight_cooldown_sec": 1,
     "pvp_total_timeout_sec": 6 * 60,
     "max_inventory_items": 28,
     "coins_item_name": "Coins",
     "deep_wildy_level_cap": 50,
     "auto_eat_extra_range": [1, 10],
+    "fight_batch_max": 10,
+    "storage_backend": "json",  # "json" or "sqlite"
+    "journal_compact_records": 500,
+    "persist_flush_interval_sec": 5,
+    "persist_flush_max_dirty": 50,
+    "binary_player_snapshot": True,  # also write players.snap on compaction and start from it
+    "player_cache_size": 2000,  # players kept loaded; the rest stay stored records until they act
+    "archive_after_days": 90,  # move players idle this long to the compressed archive (0 = never)
+    "archive_check_interval_sec": 6 * 3600,
 
     "item_effects": ITEM_EFFECTS,
 
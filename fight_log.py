@@ -0,0 +1,82 @@
+# Structured PvM fight events, rendered to Markdown only when a page is shown
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Event kinds. Each event is a tuple (kind, *fields); hp fields are snapshots.
+TEXT = 0          # (line,)                         preformatted line
+START = 1         # (your_hp,)
+AMMO = 2          # (item,)
+ZEROED = 3        # ()
+SHELL = 4         # (name, hits_left)
+BLEED_ON = 5      # ()
+BLEED = 6         # (hits_left,)
+HIT = 7           # (damage, your_hp, npc_hp)
+SEEP = 8          # (healed, your_hp)
+FURY_PROC = 9     # ()
+FURY = 10         # (n, damage, npc_hp)
+SOULFIRE = 11     # (damage, npc_hp)
+BLAZE = 12        # (name, bonus, hits_left)
+SHROUD = 13       # ()
+SAVE_EAT = 14     # (food, healed)
+NPC_HIT = 15      # (damage, your_hp, npc_hp)
+EAT = 16          # (food, healed, your_hp)
+ABILITY = 17      # (template, values)              ability proc line (npcs.NPCS "msg")
+NPC_FLURRY = 18   # (name, n, damage, your_hp)
+NPC_EXTRA = 19    # (name, damage, your_hp)
+
+Event = Tuple[Any, ...]
+
+_RENDER: Dict[int, Callable[["FightLog", Event], str]] = {
+    TEXT: lambda log, e: e[1],
+    START: lambda log, e: f"👹 **{log.npc}** (HP **{log.npc_max}**) — You start **{e[1]}/{log.max_hp}**",
+    AMMO: lambda log, e: f"🏹 Used **{e[1]}**",
+    ZEROED: lambda log, e: "🕳️ Your attack is disrupted — your hit is forced to **0**!",
+    SHELL: lambda log, e: f"🪨 **{e[1]}** halves your damage! ({e[2]} hits remaining)",
+    BLEED_ON: lambda log, e: "🩸 **Bleed inflicted!** Next 3 hits deal +2 damage.",
+    BLEED: lambda log, e: f"🩸 Bleed deals +2 damage. ({e[1]} hits remaining)",
+    HIT: lambda log, e: f"🗡️ You hit **{e[1]}** | You: **{e[2]}/{log.max_hp}** | {log.npc}: **{e[3]}/{log.npc_max}**",
+    SEEP: lambda log, e: f"🩸 Amulet of Seeping heals **{e[1]}** | You: **{e[2]}/{log.max_hp}**",
+    FURY_PROC: lambda log, e: "🐾 **Paws of Fury!** Your claws slash twice more!",
+    FURY: lambda log, e: f"🐾 Fury slash #{e[1]} deals **{e[2]}** (50% reduced) | {log.npc}: **{e[3]}/{log.npc_max}**",
+    SOULFIRE: lambda log, e: f"🔥 **Soulfire Blaze!** An extra flame deals **{e[1]}** damage | {log.npc}: **{e[2]}/{log.npc_max}**",
+    BLAZE: lambda log, e: f"🔥 **{e[1]}** adds +{e[2]} damage! ({e[3]} hits remaining)",
+    SHROUD: lambda log, e: "🛡️ **Shroud of the Undying** nullifies the hit!",
+    SAVE_EAT: lambda log, e: f"🍖 **Death prevented!** Auto-ate **{e[1]}** (+{e[2]}) before taking the hit.",
+    NPC_HIT: lambda log, e: f"💥 {log.npc} hits **{e[1]}** | You: **{e[2]}/{log.max_hp}** | {log.npc}: **{e[3]}/{log.npc_max}**",
+    EAT: lambda log, e: f"🍖 Auto-eat **{e[1]}** (+{e[2]}) | You: **{e[3]}/{log.max_hp}**",
+    ABILITY: lambda log, e: e[1].format(npc=log.npc, max_hp=log.max_hp, npc_max=log.npc_max, **e[2]),
+    NPC_FLURRY: lambda log, e: f"🐾 {e[1]} hit #{e[2]} deals **{e[3]}** (50% reduced) | You: **{e[4]}/{log.max_hp}**",
+    NPC_EXTRA: lambda log, e: f"💥 {e[1]} hits **{e[2]}** | You: **{e[3]}/{log.max_hp}**",
+}
+
+
+class FightLog:
+    """Event tuples for one PvM fight plus the constants needed to render them."""
+
+    __slots__ = ("npc", "npc_max", "max_hp", "events")
+
+    def __init__(self, npc: str, npc_max: int, max_hp: int, header: Optional[List[str]] = None):
+        self.npc = npc
+        self.npc_max = npc_max
+        self.max_hp = max_hp
+        self.events: List[Event] = [(TEXT, line) for line in header or []]
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def add(self, *event: Any):
+        self.events.append(event)
+
+    def text(self, line: str):
+        self.events.append((TEXT, line))
+
+    def render(self, start: int = 0, stop: Optional[int] = None) -> str:
+        return "\n".join(_RENDER[e[0]](self, e) for e in self.events[start:stop])
+
+    def lines(self) -> List[str]:
+        return [_RENDER[e[0]](self, e) for e in self.events]
+
+    def pages(self, per_page: int = 10) -> List[Callable[[], str]]:
+        """One zero-arg renderer per page (see FightLogView)."""
+        return [partial(self.render, i, i + per_page) for i in range(0, len(self.events), per_page)]
@@ -0,0 +1,479 @@
+# Headless PvM fight simulator for balance checks
+
+import random
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, List, Union
+
+from .config_default import DEFAULT_CONFIG
+from .items import ITEMS, FOOD, FOOD_BY_HEAL, STANCE_TO_STYLE, DEFENDER_ORDER, ETHER_WEAPONS, SLAYER_HELMS
+from .loot_manager import LootManager
+from .models import PlayerState, parse_chance, sum_bonuses
+from .name_index import NPC_BY_NAME, norm
+from .npc_abilities import EFFECTS
+from .npcs import NPCS, REVENANT_TYPES
+
+# Time a player spends per round reading the fight log; with the fight
+# cooldown this gives the default seconds per fight (see FightSimulator.run)
+SECONDS_PER_ROUND = 0.6
+
+# Ammo states for a round
+AMMO_OK, AMMO_MISSING, AMMO_GONE = 0, 1, 2
+
+
+@dataclass
+class SimResult:
+    npc_name: str
+    fights: int
+    wins: int
+    rounds: int
+    food_used: int
+    hp_left: int
+    loot_per_kill: float
+    seconds_per_fight: float
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def kills_per_hour(self) -> float:
+        return self.win_rate * 3600 / self.seconds_per_fight if self.seconds_per_fight > 0 else 0.0
+
+    @property
+    def food_per_fight(self) -> float:
+        return self.food_used / self.fights if self.fights else 0.0
+
+    @property
+    def rounds_per_fight(self) -> float:
+        return self.rounds / self.fights if self.fights else 0.0
+
+    @property
+    def avg_hp_left(self) -> float:
+        return self.hp_left / self.wins if self.wins else 0.0
+
+    @property
+    def loot_per_hour(self) -> float:
+        return self.kills_per_hour * self.loot_per_kill
+
+
+def _item_value(item: str) -> int:
+    if item.startswith("Noted "):
+        item = item[len("Noted "):]
+    return int(ITEMS.get(item, {}).get("value", 0))
+
+
+class FightSimulator:
+    """Runs many independent PvM fights for one loadout without Discord or side effects.
+
+    Mirrors CombatManager.simulate_pvm_fight_and_loot round for round (NPC
+    ability records, Fury Paws, Soulfire, slayer helms, Seeping, bleed, ether and
+    ammo charges, buffs, auto-eat) but never touches the PlayerState it is
+    given. Loot value per kill is the exact expectation of the compiled
+    drop tables rather than a sample.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, *, seed: Optional[int] = None):
+        self.config = config or DEFAULT_CONFIG
+        self.rng = random.Random(seed)
+        self.loot_mgr = LootManager(self)
+        self.loot_mgr.compile_tables()
+
+    # ── Loadout ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _next_defender_drop(p: PlayerState) -> Optional[str]:
+        equipped = p.equipment.get("offhand")
+        if equipped not in DEFENDER_ORDER:
+            return DEFENDER_ORDER[0]
+        idx = DEFENDER_ORDER.index(equipped)
+        return DEFENDER_ORDER[idx + 1] if idx + 1 < len(DEFENDER_ORDER) else None
+
+    @staticmethod
+    def _bonuses(
+        equipment: Dict[str, str],
+        buffs: List[Dict[str, Any]],
+        *,
+        charged: bool,
+        ammo: int,
+        ammo_slot: Optional[str],
+    ) -> Dict[str, int]:
+        """InventoryManager.equipped_bonus(vs_npc=True) for one ammo state."""
+        mainhand = equipment.get("mainhand", "")
+        meta = ITEMS.get(mainhand, {})
+        style = STANCE_TO_STYLE.get(meta.get("stance", "slash") if mainhand else "slash", "melee")
+        return sum_bonuses(
+            equipment, buffs, style=style, charged=charged,
+            consumes_charged=False if ammo != AMMO_OK else None,
+            # Live combat unequips an emptied ammo slot
+            skip_slot=ammo_slot if ammo == AMMO_GONE else None,
+        )
+
+    def resolve_npc(self, npc: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(npc, dict):
+            return npc
+        n = NPC_BY_NAME.get(norm(npc))
+        if n is not None:
+            return n
+        key = str(npc).strip().lower()
+        for n in NPCS:
+            if n["npc_type"].lower() == key:
+                return n
+        raise KeyError(f"Unknown NPC: {npc}")
+
+    def loot_per_kill(self, p: PlayerState, npc: Dict[str, Any], wildy_level: int, on_task: bool) -> float:
+        """Expected coins + wildy loot + NPC loot + unique value for one kill."""
+        lm = self.loot_mgr
+        npc_type = npc["npc_type"]
+        drop = self.config.get("npc_drops", {}).get(npc_type, {}) or {}
+
+        lo, hi = drop.get("coins_range", [0, 0])
+        lo, hi = int(lo), int(hi)
+        hi = max(hi, lo)
+        total = (lo + hi) / 2 if hi > 0 else 0.0
+
+        wildy = self.config.get("loot_tables", {}).get(lm.band(wildy_level), [])
+        total += lm._table(wildy).expected_value(_item_value)
+        total += lm._table(drop.get("loot", []) or []).expected_value(_item_value)
+
+        unique = drop.get("unique", []) or []
+        if npc_type == "blight cyclops":
+            next_def = self._next_defender_drop(p)
+            table = lm._defenders.get((npc_type, next_def)) if next_def else None
+        elif on_task and (npc_type, "unique") in lm._on_task:
+            table = lm._on_task[(npc_type, "unique")]
+        else:
+            table = lm._table(unique)
+        if table is not None:
+            total += table.expected_value(_item_value)
+        return total
+
+    # ── Simulation ───────────────────────────────────────────────────────
+
+    def run(
+        self,
+        p: PlayerState,
+        npc: Union[str, Dict[str, Any]],
+        fights: int = 10000,
+        *,
+        wildy_level: Optional[int] = None,
+        on_task: Optional[bool] = None,
+        seconds_per_fight: Optional[float] = None,
+    ) -> SimResult:
+        """Simulate `fights` independent fights from p's current HP, gear and inventory.
+
+        seconds_per_fight (for kills/loot per hour) defaults to the fight
+        cooldown plus SECONDS_PER_ROUND for each simulated round.
+        """
+        npc = self.resolve_npc(npc)
+        cfg = self.config
+        wl = int(p.wildy_level if wildy_level is None else wildy_level)
+        max_hp = int(cfg["max_hp"])
+        eq = dict(p.equipment)
+        inv0 = p.inventory
+        npc_name = npc["name"]
+        npc_type = npc["npc_type"]
+
+        if on_task is None:
+            task = p.slayer_task
+            on_task = bool(task and task.get("npc_type") == npc_type and int(task.get("remaining", 0)) > 0)
+
+        # NPC stats
+        npc_stance = npc.get("stance", "slash")
+        npc_style = STANCE_TO_STYLE.get(npc_stance, "melee")
+        npc_max = int(npc["hp"]) + int(wl / 8)
+        npc_max_hit = 1 + npc["tier"] + (npc.get(f"str_{npc_style}", 0) // 4) + int(wl / 12)
+
+        # Weapon
+        mainhand = eq.get("mainhand", "")
+        mh_meta = ITEMS.get(mainhand, {})
+        player_stance = mh_meta.get("stance", "slash") if mainhand else "slash"
+        player_style = STANCE_TO_STYLE.get(player_stance, "melee")
+        npc_def_stat = npc["tier"] + (npc.get(f"d_{player_stance}", 0) // 4) + int(wl / 20)
+        ether_rounds = (
+            int(inv0.get("Revenant ether", 0)) // 3
+            if mh_meta.get("atk_vs_npc") and mainhand in ETHER_WEAPONS else 0
+        )
+
+        # Ammo / runes (see InventoryManager.check_and_consume_ammo)
+        rune: Optional[str] = None
+        ammo_qty0 = -1  # -1: nothing to track
+        ammo_slot: Optional[str] = None
+        ammo_missing = False
+        consumes = mh_meta.get("consumes") if mainhand else None
+        if consumes:
+            c_meta = ITEMS.get(consumes)
+            if c_meta:
+                if str(c_meta.get("type", "")).lower() == "rune":
+                    rune = consumes
+            else:
+                equipped_ammo = eq.get("ammo")
+                a_meta = ITEMS.get(equipped_ammo, {}) if equipped_ammo else {}
+                if a_meta.get("ammo_type") == "quiver":
+                    ammo_slot = "ammo2"
+                    loaded = eq.get("ammo2")
+                    ok = loaded and ITEMS.get(loaded, {}).get("ammo_type") == consumes
+                else:
+                    ammo_slot = "ammo"
+                    ok = a_meta.get("ammo_type") == consumes
+                if not equipped_ammo or not ok or p.ammo_qty <= 0:
+                    ammo_missing = True
+                else:
+                    ammo_qty0 = int(p.ammo_qty)
+
+        # Buffs tick once per round; a buff is active while rounds < its expiry
+        buff_list = sorted(
+            (dict(b) for b in (p.active_buffs or {}).values()),
+            key=lambda b: max(1, int(b.get("remaining_hits", 0))),
+        )
+        buff_expiry = [max(1, int(b.get("remaining_hits", 0))) for b in buff_list]
+        n_buffs = len(buff_expiry)
+
+        stats: Dict[Tuple[bool, int, int], Tuple[int, int]] = {}
+
+        def stat_for(charged: bool, ammo: int, expired: int) -> Tuple[int, int]:
+            key = (charged, ammo, expired)
+            s = stats.get(key)
+            if s is None:
+                b = self._bonuses(eq, buff_list[expired:], charged=charged, ammo=ammo, ammo_slot=ammo_slot)
+                power = b.get(f"a_{player_stance}", 0) + b.get(f"str_{player_style}", 0)
+                s = stats[key] = (
+                    6 + (power // 4) + int(wl / 15),
+                    6 + (b.get(f"d_{npc_stance}", 0) // 4) + int(wl / 20),
+                )
+            return s
+
+        # Food, best first (ties keep FOOD order like best_food_in_inventory)
+        foods = FOOD_BY_HEAL
+        food_heals = [h for _, h in foods]
+        food_counts0 = [int(inv0.get(name, 0)) for name, _ in foods]
+        n_foods = len(foods)
+        autoeat = int(p.autoeat or 0)
+        try:
+            r_lo, r_hi = (int(x) for x in cfg.get("auto_eat_extra_range", [1, 10]))
+        except Exception:
+            r_lo, r_hi = 1, 10
+        r_hi = max(r_hi, r_lo)
+
+        # Player effects
+        helm_mult = SLAYER_HELMS.get(eq.get("helm", ""), 0.0) if on_task else 0.0
+        wristwraps = eq.get("gloves") == "Wristwraps of the Damned"
+        seeping = eq.get("amulet") == "Amulet of Seeping"
+        fury_paws = mainhand == "Fury Paws"
+        soulfire = 0.0
+        if mainhand == "Soulfire staff":
+            soulfire = 0.75 if eq.get("offhand") == "Cindertome" else 0.50
+        ethereum = npc_type in REVENANT_TYPES and eq.get("amulet") == "Bracelet of ethereum"
+        shroud = eq.get("cape") == "Shroud of the Undying"
+
+        # NPC specials: (effect, chance, pct_lo, pct_span, hits, amount) from the ability records
+        abilities: List[Tuple[str, float, int, int, int, int]] = []
+        for ab in npc.get("abilities", []) or []:
+            if ab.get("effect") not in EFFECTS:
+                continue
+            ch = ab.get("chance", 0)
+            if isinstance(ch, (list, tuple)):
+                lo, hi = (int(round(parse_chance(c) * 100)) for c in ch)
+                chance, pct_lo, pct_span = -1.0, lo, hi - lo + 1
+            else:
+                chance, pct_lo, pct_span = parse_chance(ch), 0, 0
+            abilities.append((ab["effect"], chance, pct_lo, pct_span, int(ab.get("hits", 0)), int(ab.get("amount", 0))))
+
+        blood0 = int(inv0.get("Blood rune", 0))
+        rune0 = int(inv0.get(rune, 0)) if rune else 0
+        rune_is_blood = rune == "Blood rune"
+        start_hp = int(p.hp)
+
+        rand = self.rng.random
+        wins = rounds_total = food_total = hp_left = 0
+
+        for _ in range(fights):
+            hp = start_hp
+            # Seeping heals from the stored HP, which the live fight only writes back at the end
+            seep_hp = start_hp
+            npc_hp = npc_max
+            counts = food_counts0[:]
+            fi = 0
+            while fi < n_foods and counts[fi] <= 0:
+                fi += 1
+            blood = blood0
+            rune_n = rune0
+            ammo_qty = ammo_qty0
+            ammo_gone = False
+            expired = 0
+            r = 0
+            force_zero = False
+            bleed = 0
+            debuff_hits = 0
+            debuff_amt = 4
+            shell = 0
+            blaze = 0
+            blaze_amt = 0
+            ate = 0
+
+            while npc_hp > 0 and hp > 0:
+                charged = r < ether_rounds
+                if rune is not None:
+                    have = blood if rune_is_blood else rune_n
+                    if have <= 0:
+                        ammo = AMMO_MISSING
+                    else:
+                        ammo = AMMO_OK
+                        if rand() < 0.2:
+                            if rune_is_blood:
+                                blood -= 1
+                            else:
+                                rune_n -= 1
+                elif ammo_missing:
+                    ammo = AMMO_MISSING
+                elif ammo_qty >= 0:
+                    if ammo_gone:
+                        ammo = AMMO_GONE
+                    else:
+                        ammo = AMMO_OK
+                        if rand() < 0.2:
+                            ammo_qty -= 1
+                            if ammo_qty <= 0:
+                                ammo_gone = True
+                else:
+                    ammo = AMMO_OK
+                your_atk, your_def = stat_for(charged, ammo, expired)
+
+                hit = int(rand() * (your_atk + 1)) - int(rand() * (npc_def_stat + 1))
+                if hit < 0:
+                    hit = 0
+                if force_zero:
+                    hit = 0
+                    force_zero = False
+                if shell > 0 and hit > 0:
+                    hit = max(1, hit // 2)
+                    shell -= 1
+                if wristwraps and hit > 0 and rand() < 0.05:
+                    bleed = 3
+                if bleed > 0 and hit > 0:
+                    bleed -= 1
+                    hit += 2
+                if helm_mult and hit > 0:
+                    hit = int(hit * helm_mult)
+                npc_hp = max(0, npc_hp - hit)
+
+                r += 1
+                while expired < n_buffs and buff_expiry[expired] <= r:
+                    expired += 1
+
+                if seeping and hit > 0 and blood >= 5:
+                    blood -= 5
+                    before = seep_hp
+                    seep_hp = min(max_hp, seep_hp + 1 + int(hit * 0.02))
+                    if seep_hp > before:
+                        hp = seep_hp
+
+                if fury_paws and hit > 0 and npc_hp > 0 and rand() < 0.15:
+                    for _i in range(2):
+                        if npc_hp <= 0:
+                            break
+                        fh = int(rand() * (your_atk + 1)) - int(rand() * (npc_def_stat + 1))
+                        fh = max(1, max(0, fh) // 2)
+                        if helm_mult:
+                            fh = int(fh * helm_mult)
+                        npc_hp = max(0, npc_hp - fh)
+
+                if soulfire and hit > 0 and npc_hp > 0 and rand() < soulfire:
+                    npc_hp = max(0, npc_hp - 10)
+
+                if npc_hp <= 0:
+                    break
+
+                def_for_roll = your_def
+                if debuff_hits > 0:
+                    def_for_roll = max(0, your_def - debuff_amt)
+                    debuff_hits -= 1
+
+                npc_hit = int(rand() * (npc_max_hit + 1)) - int(rand() * (def_for_roll + 1))
+                if npc_hit < 0:
+                    npc_hit = 0
+                if blaze > 0 and npc_hit > 0:
+                    npc_hit += blaze_amt
+                    blaze -= 1
+                if ethereum:
+                    npc_hit = int(npc_hit * 0.5)
+                if shroud and npc_hit > 0 and rand() < 0.02:
+                    npc_hit = 0
+
+                # Death prevention
+                if npc_hit > 0 and hp - npc_hit <= 0 and fi < n_foods:
+                    counts[fi] -= 1
+                    hp = min(max_hp, hp + food_heals[fi])
+                    ate += 1
+                    while fi < n_foods and counts[fi] <= 0:
+                        fi += 1
+
+                hp = max(0, min(max_hp, hp - npc_hit))
+
+                # Auto-eat
+                if hp > 0 and fi < n_foods:
+                    heal = food_heals[fi]
+                    threshold = autoeat if autoeat > 0 else heal + r_lo + int(rand() * (r_hi - r_lo + 1))
+                    if hp <= threshold:
+                        counts[fi] -= 1
+                        hp = min(max_hp, hp + heal)
+                        ate += 1
+                        while fi < n_foods and counts[fi] <= 0:
+                            fi += 1
+
+                for effect, chance, pct_lo, pct_span, hits, amount in abilities:
+                    if hp <= 0 or npc_hp <= 0:
+                        break
+                    if effect == "life_steal" and npc_hit <= 0:
+                        continue
+                    if chance < 0:
+                        chance = (pct_lo + int(rand() * pct_span)) / 100
+                    if rand() >= chance:
+                        continue
+                    if effect == "force_zero":
+                        force_zero = True
+                    elif effect == "def_debuff":
+                        debuff_hits, debuff_amt = hits, amount
+                    elif effect == "life_steal":
+                        npc_hp = min(npc_hp + npc_hit, npc_max)
+                        if hits:
+                            debuff_hits, debuff_amt = hits, amount
+                    elif effect == "damage_boost":
+                        blaze, blaze_amt = hits, amount
+                    elif effect == "damage_shell":
+                        shell = hits
+                    elif effect == "flurry":
+                        for _i in range(hits):
+                            if hp <= 0:
+                                break
+                            ph = int(rand() * (npc_max_hit + 1)) - int(rand() * (def_for_roll + 1))
+                            ph = max(1, max(0, ph) // 2)
+                            if ethereum:
+                                ph = int(ph * 0.5)
+                            if shroud and ph > 0 and rand() < 0.02:
+                                ph = 0
+                            hp = max(0, min(max_hp, hp - ph))
+                    elif effect == "extra_attack":
+                        extra = int(rand() * (npc_max_hit + 1)) - int(rand() * (def_for_roll + 1))
+                        hp = max(0, min(max_hp, hp - max(0, extra)))
+                    elif effect == "flat_damage":
+                        hp = max(0, min(max_hp, hp - amount))
+
+            rounds_total += r
+            food_total += ate
+            if hp > 0:
+                wins += 1
+                hp_left += hp
+
+        if seconds_per_fight is None:
+            cooldown = float(cfg.get("fight_cooldown_sec", 1))
+            seconds_per_fight = cooldown + SECONDS_PER_ROUND * rounds_total / fights if fights else cooldown
+        return SimResult(
+            npc_name=npc_name,
+            fights=fights,
+            wins=wins,
+            rounds=rounds_total,
+            food_used=food_total,
+            hp_left=hp_left,
+            loot_per_kill=self.loot_per_kill(p, npc, wl, on_task),
+            seconds_per_fight=seconds_per_fight,
+        )
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import os
+import heapq
 import time
 from dataclasses import dataclass, asdict
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from typing import Optional, List, Tuple, Dict, TYPE_CHECKING
 
 import discord
 
@@ -16,8 +15,6 @@ from .items import ITEMS, FOOD, UNTRADEABLE
 if TYPE_CHECKING:
     from .wilderness import Wilderness
 
-DATA_DIR = "data/wilderness"
-GE_FILE = os.path.join(DATA_DIR, "ge_offers.json")
 MAX_SLOTS = 4
 
 
@@ -109,6 +106,7 @@ def _build_ge_categories():
 
 
 GE_CATEGORIES = _build_ge_categories()
+GE_ITEMS = {name for items in GE_CATEGORIES.values() for name in items}
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -172,6 +170,87 @@ class GEOffer:
         return "⬛" * length
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  Order Book  (price-time priority index)
+# ═══════════════════════════════════════════════════════════════════
+
+class GEOrderBook:
+    """Per-item buy/sell heaps plus a per-user slot index.
+
+    Sells are ordered cheapest first, buys dearest first, then oldest
+    (created_at, offer_id) within a price. Completed or removed offers are
+    dropped lazily when they reach the top of a heap.
+    """
+
+    def __init__(self):
+        self.offers: Dict[int, GEOffer] = {}
+        self._heaps: Dict[Tuple[str, str], list] = {}
+        self._in_book: set = set()
+        self._slots: Dict[int, List[Optional[GEOffer]]] = {}
+
+    @staticmethod
+    def _entry(o: GEOffer) -> tuple:
+        price = o.price_each if o.offer_type == "sell" else -o.price_each
+        return (price, o.created_at, o.offer_id, o)
+
+    def add(self, o: GEOffer):
+        self.offers[o.offer_id] = o
+        if 0 <= o.slot < MAX_SLOTS:
+            self._slots.setdefault(o.user_id, [None] * MAX_SLOTS)[o.slot] = o
+        self.rest(o)
+
+    def rest(self, o: GEOffer):
+        """(Re)list an open offer on its side of the book."""
+        if o.is_complete or o.offer_id in self._in_book or o.offer_id not in self.offers:
+            return
+        heapq.heappush(self._heaps.setdefault((o.item, o.offer_type), []), self._entry(o))
+        self._in_book.add(o.offer_id)
+
+    def remove(self, o: GEOffer):
+        self.offers.pop(o.offer_id, None)
+        slots = self._slots.get(o.user_id)
+        if slots and 0 <= o.slot < MAX_SLOTS and slots[o.slot] is o:
+            slots[o.slot] = None
+            if not any(slots):
+                self._slots.pop(o.user_id, None)
+        # Heap entry is discarded lazily
+
+    def slots(self, user_id: int) -> List[Optional[GEOffer]]:
+        return list(self._slots.get(user_id) or [None] * MAX_SLOTS)
+
+    def match(self, offer: GEOffer) -> List[Tuple[GEOffer, int, int]]:
+        """Fill *offer* against the opposite side. Returns [(counter, qty, price)]."""
+        side = "sell" if offer.offer_type == "buy" else "buy"
+        heap = self._heaps.get((offer.item, side))
+        fills: List[Tuple[GEOffer, int, int]] = []
+        skipped = []
+        while heap and not offer.is_complete:
+            o = heap[0][-1]
+            if o.is_complete or o.offer_id not in self.offers:
+                heapq.heappop(heap)
+                self._in_book.discard(o.offer_id)
+                continue
+            if side == "sell" and o.price_each > offer.price_each:
+                break
+            if side == "buy" and o.price_each < offer.price_each:
+                break
+            if o.user_id == offer.user_id:
+                skipped.append(heapq.heappop(heap))
+                continue
+            qty = min(offer.remaining, o.remaining)
+            offer.filled += qty
+            o.filled += qty
+            fills.append((o, qty, o.price_each))
+            if o.is_complete:
+                heapq.heappop(heap)
+                self._in_book.discard(o.offer_id)
+        for e in skipped:
+            heapq.heappush(heap, e)
+        if heap is not None and not heap:
+            self._heaps.pop((offer.item, side), None)
+        return fills
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  Manager  (persistence · CRUD · matching engine)
 # ═══════════════════════════════════════════════════════════════════
@@ -180,44 +259,58 @@ class GEManager:
 
     def __init__(self, cog: "Wilderness"):
         self.cog = cog
-        self.offers: List[GEOffer] = []
+        self.book = GEOrderBook()
         self.next_id: int = 1
         self._lock = asyncio.Lock()
+        self._events: List[dict] = []
+
+    @property
+    def offers(self) -> List[GEOffer]:
+        return list(self.book.offers.values())
 
     # ── Persistence ────────────────────────────────────────────────
 
     async def load(self):
-        if not os.path.exists(GE_FILE):
-            return
-        def _read():
-            with open(GE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        data = await asyncio.to_thread(_read)
+        data = await self.cog.store.load_ge()
         self.next_id = data.get("next_id", 1)
-        self.offers = [GEOffer.from_dict(d) for d in data.get("offers", [])]
+        self.book = GEOrderBook()
+        for d in data.get("offers", []):
+            self.book.add(GEOffer.from_dict(d))
 
-    async def save(self):
-        os.makedirs(DATA_DIR, exist_ok=True)
-        data = {
+    def snapshot(self) -> dict:
+        return {
             "next_id": self.next_id,
-            "offers": [o.to_dict() for o in self.offers],
+            "offers": [o.to_dict() for o in self.book.offers.values()],
         }
-        def _write():
-            tmp = GE_FILE + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            os.replace(tmp, GE_FILE)
-        await asyncio.to_thread(_write)
+
+    def _log(self, op: str, offer: GEOffer, *fields: str):
+        """Queue an offer event; fields are recorded as absolute values."""
+        ev = {"ge": op, "id": offer.offer_id}
+        if op == "create":
+            ev["offer"] = offer.to_dict()
+            ev["next_id"] = self.next_id
+        for f in fields:
+            ev[f] = getattr(offer, f)
+        self._events.append(ev)
+
+    async def save(self, user_id: int):
+        """Commit this action's offer events and the acting player as one unit of work.
+
+        Call with the player's lock held, after both sides have been mutated.
+        """
+        events, self._events = self._events, []
+        try:
+            await self.cog._commit((user_id,), ge_events=events)
+        except Exception:
+            # Requeue so the next save commits them with the player
+            self._events[:0] = events
+            raise
 
     # ── Queries ────────────────────────────────────────────────────
 
     def player_slots(self, user_id: int) -> List[Optional[GEOffer]]:
         """Return the player's 4 GE slots (None = empty)."""
-        slots: List[Optional[GEOffer]] = [None] * MAX_SLOTS
-        for o in self.offers:
-            if o.user_id == user_id and 0 <= o.slot < MAX_SLOTS:
-                slots[o.slot] = o
-        return slots
+        return self.book.slots(user_id)
 
     # ── CRUD ───────────────────────────────────────────────────────
 
@@ -234,7 +327,7 @@ class GEManager:
 
             user_obj = self.cog.bot.get_user(user_id) or discord.Object(id=user_id)
 
-            async with self.cog._mem_lock:
+            async with self.cog.lock_mgr.hold(user_id):
                 p = self.cog._get_player(user_obj)
 
                 if offer_type == "buy":
@@ -254,23 +347,22 @@ class GEManager:
                         )
                     self.cog._remove_item(p.bank, item, quantity)
 
-                await self.cog._persist()
-
-            offer = GEOffer(
-                offer_id=self.next_id,
-                user_id=user_id,
-                offer_type=offer_type,
-                item=item,
-                price_each=price_each,
-                quantity=quantity,
-                created_at=_now(),
-                slot=slot,
-            )
-            self.next_id += 1
-            self.offers.append(offer)
+                offer = GEOffer(
+                    offer_id=self.next_id,
+                    user_id=user_id,
+                    offer_type=offer_type,
+                    item=item,
+                    price_each=price_each,
+                    quantity=quantity,
+                    created_at=_now(),
+                    slot=slot,
+                )
+                self.next_id += 1
+                self.book.add(offer)
+                self._log("create", offer)
 
-            await self._match_offer(offer)
-            await self.save()
+                await self._match_offer(offer)
+                await self.save(user_id)
 
             status = "completed instantly" if offer.is_complete else "placed"
             return True, (
@@ -294,7 +386,7 @@ class GEManager:
 
             user_obj = self.cog.bot.get_user(user_id) or discord.Object(id=user_id)
 
-            async with self.cog._mem_lock:
+            async with self.cog.lock_mgr.hold(user_id):
                 p = self.cog._get_player(user_obj)
 
                 if offer.offer_type == "buy":
@@ -306,11 +398,10 @@ class GEManager:
                     if coins_to_claim > 0:
                         p.bank_coins = int(p.bank_coins) + coins_to_claim
 
-                await self.cog._persist()
-
-            offer.claimed = offer.filled
-            offer.coins_pending = 0
-            await self.save()
+                offer.claimed = offer.filled
+                offer.coins_pending = 0
+                self._log("claim", offer, "claimed", "coins_pending")
+                await self.save(user_id)
 
             parts = []
             if offer.offer_type == "buy":
@@ -347,21 +438,21 @@ class GEManager:
 
             user_obj = self.cog.bot.get_user(user_id) or discord.Object(id=user_id)
 
-            async with self.cog._mem_lock:
+            async with self.cog.lock_mgr.hold(user_id):
                 p = self.cog._get_player(user_obj)
                 for item_name, count in total_items.items():
                     self.cog._add_item(p.bank, item_name, count)
                 if total_coins > 0:
                     p.bank_coins = int(p.bank_coins) + total_coins
-                await self.cog._persist()
 
-            for offer in slots:
-                if offer is None:
-                    continue
-                offer.claimed = offer.filled
-                offer.coins_pending = 0
+                for offer in slots:
+                    if offer is None:
+                        continue
+                    offer.claimed = offer.filled
+                    offer.coins_pending = 0
+                    self._log("claim", offer, "claimed", "coins_pending")
 
-            await self.save()
+                await self.save(user_id)
 
             parts = [f"**{c}x {n}**" for n, c in total_items.items()]
             if total_coins > 0:
@@ -380,7 +471,7 @@ class GEManager:
             unclaimed_items = offer.claimable_items
             unclaimed_coins = offer.coins_pending
 
-            async with self.cog._mem_lock:
+            async with self.cog.lock_mgr.hold(user_id):
                 p = self.cog._get_player(user_obj)
 
                 if offer.offer_type == "buy":
@@ -401,10 +492,9 @@ class GEManager:
                     if unclaimed_coins > 0:
                         p.bank_coins = int(p.bank_coins) + unclaimed_coins
 
-                await self.cog._persist()
-
-            self.offers.remove(offer)
-            await self.save()
+                self.book.remove(offer)
+                self._log("remove", offer)
+                await self.save(user_id)
 
             parts = []
             if offer.offer_type == "buy":
@@ -435,9 +525,9 @@ class GEManager:
             unclaimed_items = offer.claimable_items
             unclaimed_coins = offer.coins_pending
 
-            if unclaimed_items > 0 or unclaimed_coins > 0:
-                user_obj = self.cog.bot.get_user(user_id) or discord.Object(id=user_id)
-                async with self.cog._mem_lock:
+            async with self.cog.lock_mgr.hold(user_id):
+                if unclaimed_items > 0 or unclaimed_coins > 0:
+                    user_obj = self.cog.bot.get_user(user_id) or discord.Object(id=user_id)
                     p = self.cog._get_player(user_obj)
                     if offer.offer_type == "buy":
                         if unclaimed_items > 0:
@@ -447,10 +537,10 @@ class GEManager:
                     else:
                         if unclaimed_coins > 0:
                             p.bank_coins = int(p.bank_coins) + unclaimed_coins
-                    await self.cog._persist()
 
-            self.offers.remove(offer)
-            await self.save()
+                self.book.remove(offer)
+                self._log("remove", offer)
+                await self.save(user_id)
             return True, "Slot cleared. All items & coins delivered to your bank."
 
     async def edit_quantity(
@@ -473,7 +563,7 @@ class GEManager:
             diff = new_qty - offer.quantity
             user_obj = self.cog.bot.get_user(user_id) or discord.Object(id=user_id)
 
-            async with self.cog._mem_lock:
+            async with self.cog.lock_mgr.hold(user_id):
                 p = self.cog._get_player(user_obj)
 
                 if offer.offer_type == "buy":
@@ -493,14 +583,13 @@ class GEManager:
                     else:
                         self.cog._add_item(p.bank, offer.item, abs(diff))
 
-                await self.cog._persist()
+                offer.quantity = new_qty
+                self._log("edit", offer, "quantity")
 
-            offer.quantity = new_qty
-
-            if diff > 0 and not offer.is_complete:
-                await self._match_offer(offer)
+                if diff > 0 and not offer.is_complete:
+                    await self._match_offer(offer)
 
-            await self.save()
+                await self.save(user_id)
             return True, f"Quantity updated to **{new_qty}**."
 
     # ── Matching Engine ────────────────────────────────────────────
@@ -516,60 +605,21 @@ class GEManager:
         if offer.is_complete:
             return
 
-        if offer.offer_type == "buy":
-            # Match cheapest sells first, then FIFO
-            counters = sorted(
-                (o for o in self.offers
-                 if o.offer_type == "sell"
-                 and o.item == offer.item
-                 and not o.is_complete
-                 and o.price_each <= offer.price_each
-                 and o.user_id != offer.user_id),
-                key=lambda o: (o.price_each, o.created_at),
-            )
-
-            for sell in counters:
-                if offer.is_complete:
-                    break
-                qty = min(offer.remaining, sell.remaining)
-                if qty <= 0:
-                    continue
-
-                trade_price = sell.price_each  # buyer pays seller's listed price
-
-                offer.filled += qty
-                sell.filled += qty
-
-                # Accumulate for claiming — no immediate bank transfer
+        fills = self.book.match(offer)
+        for counter, qty, trade_price in fills:
+            # Accumulate for claiming — no immediate bank transfer
+            if offer.offer_type == "buy":
+                # buyer pays seller's listed price
                 offer.coins_pending += (offer.price_each - trade_price) * qty
-                sell.coins_pending += trade_price * qty
-
-        else:  # sell
-            # Match highest buyers first, then FIFO
-            counters = sorted(
-                (o for o in self.offers
-                 if o.offer_type == "buy"
-                 and o.item == offer.item
-                 and not o.is_complete
-                 and o.price_each >= offer.price_each
-                 and o.user_id != offer.user_id),
-                key=lambda o: (-o.price_each, o.created_at),
-            )
-
-            for buy in counters:
-                if offer.is_complete:
-                    break
-                qty = min(offer.remaining, buy.remaining)
-                if qty <= 0:
-                    continue
-
-                trade_price = buy.price_each  # seller receives buyer's listed price
-
-                offer.filled += qty
-                buy.filled += qty
-
-                # Accumulate for claiming — no immediate bank transfer
+                counter.coins_pending += trade_price * qty
+            else:
+                # seller receives buyer's listed price
                 offer.coins_pending += trade_price * qty
+            self._log("fill", counter, "filled", "coins_pending")
+        if fills:
+            self._log("fill", offer, "filled", "coins_pending")
+
+        self.book.rest(offer)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -819,6 +869,10 @@ class _CategoryView(discord.ui.View):
             return False
         return True
 
+    @discord.ui.button(label="Search", style=discord.ButtonStyle.primary, row=1)
+    async def search_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(_ItemSearchModal(self.ge, self.user_id, self.slot, self.offer_type))
+
     @discord.ui.button(label="Back", style=discord.ButtonStyle.secondary, row=1)
     async def back_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
         emb = _empty_slot_embed(self.slot)
@@ -826,6 +880,38 @@ class _CategoryView(discord.ui.View):
         await interaction.response.edit_message(embed=emb, view=view)
 
 
+class _ItemSearchModal(discord.ui.Modal, title="Search Items"):
+
+    query = discord.ui.TextInput(
+        label="Item name",
+        placeholder="Type part of an item name\u2026",
+        max_length=100,
+    )
+
+    def __init__(self, ge: GEManager, user_id: int, slot: int, offer_type: str):
+        super().__init__()
+        self.ge = ge
+        self.user_id = user_id
+        self.slot = slot
+        self.offer_type = offer_type
+
+    async def on_submit(self, interaction: discord.Interaction):
+        q = self.query.value.strip()
+        items = self.ge.cog._search_items(q, limit=25, within=GE_ITEMS)
+        typ = "Buy" if self.offer_type == "buy" else "Sell"
+        emb = discord.Embed(
+            title=f"📊 Grand Exchange — Slot {self.slot + 1} ({typ})",
+            description=f"**Search:** {q}\nSelect an item:",
+            color=0x2B2D31,
+        )
+        if not items:
+            emb.description = f"No tradeable items match **{q}**.\n\nSelect a category:"
+            view = _CategoryView(self.ge, self.user_id, self.slot, self.offer_type)
+        else:
+            view = _ItemSelectView(self.ge, self.user_id, self.slot, self.offer_type, "Search", items)
+        await interaction.response.edit_message(embed=emb, view=view)
+
+
 class _CategorySelect(discord.ui.Select):
 
     def __init__(self, ge: GEManager, user_id: int, slot: int,
@@ -4,26 +4,14 @@ from typing import Dict, Optional, Tuple, List, TYPE_CHECKING
 
 import time
 
-from .items import ITEMS, FOOD, EQUIP_SLOT_SET, POTIONS, STANCE_TO_STYLE, ALL_COMBAT_KEYS, DEF_KEYS
-from .models import PlayerState, clamp
+from .items import ITEMS, FOOD, FOOD_BY_HEAL, EQUIP_SLOT_SET, POTIONS, STANCE_TO_STYLE, DEFENDER_ORDER, ETHER_WEAPONS
+from .models import PlayerState, Inventory, NOTED_PREFIX, clamp, slot_cost, sum_bonuses
 
 GROUND_ITEM_TTL = 300  # 5 minutes
-NOTED_PREFIX = "Noted "
-ETHER_WEAPONS = {"Viggora's Chainmace", "Abyssal Chainmace"}
 
 if TYPE_CHECKING:
     from .wilderness import Wilderness
 
-DEFENDER_ORDER = [
-    "Bronze Defender",
-    "Iron Defender",
-    "Steel Defender",
-    "Black Defender",
-    "Mithril Defender",
-    "Adamant Defender",
-    "Rune Defender",
-]
-
 
 class InventoryManager:
     def __init__(self, cog: "Wilderness"):
@@ -53,18 +41,9 @@ class InventoryManager:
         return bool(meta.get("stackable", False))
 
     def inv_slots_used(self, bag: Dict[str, int]) -> int:
-        used = 0
-        for name, qty in bag.items():
-            if qty <= 0:
-                continue
-            if name in FOOD:
-                used += qty
-                continue
-            if self.is_stackable(name):
-                used += 1
-            else:
-                used += qty
-        return used
+        if isinstance(bag, Inventory):
+            return bag.slots
+        return sum(slot_cost(name, qty) for name, qty in bag.items())
 
     def inv_free_slots(self, bag: Dict[str, int]) -> int:
         max_inv = int(self.cog.config["max_inventory_items"])
@@ -192,6 +171,7 @@ class InventoryManager:
                     if p.ammo_qty <= 0:
                         p.equipment.pop("ammo2", None)
                         p.ammo_qty = 0
+                        p.gear_changed()
                     return True, ammo2
                 return True, None
 
@@ -205,6 +185,7 @@ class InventoryManager:
                 if p.ammo_qty <= 0:
                     p.equipment.pop("ammo", None)
                     p.ammo_qty = 0
+                    p.gear_changed()
                 return True, equipped_ammo
             return True, None
 
@@ -216,42 +197,36 @@ class InventoryManager:
         chainmace_charged: Optional[bool] = None,
         consumes_charged: Optional[bool] = None,
     ) -> Dict[str, int]:
-        bonuses: Dict[str, int] = {k: 0 for k in ALL_COMBAT_KEYS}
-
-        for slot, item in p.equipment.items():
-            meta = ITEMS.get(item, {})
-            for key in ALL_COMBAT_KEYS:
-                # If ammo/rune not available, skip mainhand, ammo, and ammo2 str_* bonuses
-                if consumes_charged is False and slot in ("mainhand", "ammo", "ammo2") and key.startswith("str_"):
-                    continue
-                bonuses[key] += int(meta.get(key, 0))
-
-        # Ether weapon atk_vs_npc bonus (already in *4 scale)
-        if vs_npc:
-            mainhand = p.equipment.get("mainhand", "")
-            meta = ITEMS.get(mainhand, {})
-            if meta.get("atk_vs_npc") and mainhand in ETHER_WEAPONS:
-                charged = chainmace_charged
-                if charged is None:
-                    charged = (p.inventory.get("Revenant ether", 0) >= 3)
-                if charged:
-                    style = self.weapon_style(p)
-                    bonuses[f"str_{style}"] += int(meta["atk_vs_npc"])
-
-        # Active buffs
-        style = self.weapon_style(p)
-        buffs = getattr(p, "active_buffs", None) or {}
-        for buff in buffs.values():
-            str_val = int(buff.get("str", 0)) or int(buff.get("atk", 0))
-            if str_val:
-                bonuses[f"str_{style}"] += str_val * 4
-            def_val = int(buff.get("def", 0))
-            if def_val:
-                for dk in DEF_KEYS:
-                    bonuses[dk] += def_val * 4
+        """Summed combat bonuses; cached per player until p.gear_changed().
 
+        The returned dict is shared with the cache — treat it as read-only.
+        """
+        mainhand = p.equipment.get("mainhand", "")
+        meta = ITEMS.get(mainhand, {})
+        charged = None
+        if vs_npc and meta.get("atk_vs_npc") and mainhand in ETHER_WEAPONS:
+            charged = chainmace_charged
+            if charged is None:
+                charged = (p.inventory.get("Revenant ether", 0) >= 3)
+            charged = bool(charged)
+
+        version = p._gear_version
+        cache = p._bonus_cache
+        if cache is None or cache[0] != version:
+            cache = p._bonus_cache = (version, {})
+        key = (charged, consumes_charged is False)
+        bonuses = cache[1].get(key)
+        if bonuses is None:
+            bonuses = cache[1][key] = self._sum_bonuses(p, charged=charged, consumes_charged=consumes_charged)
         return bonuses
 
+    def _sum_bonuses(self, p: PlayerState, *, charged: Optional[bool], consumes_charged: Optional[bool]) -> Dict[str, int]:
+        buffs = getattr(p, "active_buffs", None) or {}
+        return sum_bonuses(
+            p.equipment, buffs.values(),
+            style=self.weapon_style(p), charged=charged, consumes_charged=consumes_charged,
+        )
+
 
     def consume_buffs_on_hit(self, p: PlayerState) -> List[str]:
         """Tick buffs, return log lines for any that expire."""
@@ -265,6 +240,8 @@ class InventoryManager:
         for name in to_remove:
             buffs.pop(name, None)
             expired_msgs.append(f"🧪 **{name}** has worn off.")
+        if to_remove:
+            p.gear_changed()
         p.active_buffs = buffs
         return expired_msgs
 
@@ -290,16 +267,9 @@ class InventoryManager:
         return int(p.hp) - before
 
     def best_food_in_inventory(self, p: PlayerState) -> Optional[str]:
-        best = None
-        best_heal = -1
-        for name, meta in FOOD.items():
-            heal = int(meta.get("heal", 0))
-            if heal <= 0:
-                continue
-            if p.inventory.get(name, 0) > 0 and heal > best_heal:
-                best = name
-                best_heal = heal
-        return best
+        if isinstance(p.inventory, Inventory):
+            return p.inventory.best_food()
+        return next((name for name, _heal in FOOD_BY_HEAL if p.inventory.get(name, 0) > 0), None)
 
     def maybe_auto_eat_after_hit(self, p: PlayerState, your_hp: int) -> Tuple[int, Optional[str], int, int]:
         """Auto-eat when HP is <= threshold (player setting or heal + random)."""
@@ -407,8 +377,11 @@ class InventoryManager:
             items = [(k, v) for (k, v) in items if self.bank_category_for_item(k) == category]
 
         if search_query:
+            # Fuzzy index ranks known items; plain substring keeps anything else findable
+            rank = {name: i for i, name in enumerate(self.cog._search_items(search_query, limit=None))}
             sq = search_query.lower()
-            items = [(k, v) for (k, v) in items if sq in k.lower()]
+            items = [(k, v) for (k, v) in items if self.unnote(k) in rank or sq in k.lower()]
+            items.sort(key=lambda kv: rank.get(self.unnote(kv[0]), len(rank)))
 
         desc = f"Category: **{category}**"
         if search_query:
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 STARTER_ITEMS = {"Starter Sword", "Starter Platebody"}
 STARTER_SHOP_COOLDOWN_SEC = 30 * 60
@@ -30,6 +30,12 @@ DEF_KEYS = tuple(f"d_{s}" for s in STANCES)
 STR_KEYS = ("str_melee", "str_range", "str_magic", "str_necro")
 ALL_COMBAT_KEYS = ATK_KEYS + DEF_KEYS + STR_KEYS
 
+# Weapons whose atk_vs_npc bonus needs 3 Revenant ether
+ETHER_WEAPONS = {"Viggora's Chainmace", "Abyssal Chainmace"}
+
+# Helm -> damage multiplier on a slayer task
+SLAYER_HELMS = {"Black Mask": 1.13, "Slayer Helmet": 1.20, "Shady Slayer Helm": 1.27}
+
 # ── User-facing display names ────────────────────────────────────────────
 COMBAT_KEY_DISPLAY: Dict[str, str] = {
     "a_stab": "Stab Attack Bonus", "a_slash": "Slash Attack Bonus", "a_crush": "Crush Attack Bonus",
@@ -49,6 +55,16 @@ STANCE_DISPLAY: Dict[str, str] = {
     "magic": "Magic", "range": "Range", "necro": "Necromancy",
 }
 
+DEFENDER_ORDER = [
+    "Bronze Defender",
+    "Iron Defender",
+    "Steel Defender",
+    "Black Defender",
+    "Mithril Defender",
+    "Adamant Defender",
+    "Rune Defender",
+]
+
 POTIONS = {
     "Strength": {"str": 2, "hits": 10, "aliases": "str,str pot"},
     "Super Strength": {"str": 4, "hits": 20, "aliases": "super str,sup str"},
@@ -62,6 +78,13 @@ FOOD: Dict[str, Dict[str, int]] = {
     "Veilfruit": {"heal": 42},
 }
 
+# Edible food, best heal first (ties keep FOOD order)
+FOOD_BY_HEAL: List[Tuple[str, int]] = sorted(
+    ((name, int(meta.get("heal", 0))) for name, meta in FOOD.items() if int(meta.get("heal", 0)) > 0),
+    key=lambda f: -f[1],
+)
+FOOD_RANK: Dict[str, int] = {name: i for i, (name, _heal) in enumerate(FOOD_BY_HEAL)}
+
 _IMG_BASE = "https://raw.githubusercontent.com/RSSaltea/PoF-Wildy-Game/main/docs/images/game/items/"
 
 ITEMS: Dict[str, Dict[str, Any]] = {
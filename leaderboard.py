@@ -0,0 +1,212 @@
+# Highscores - per-category top-K kept up to date as players change
+
+import heapq
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import PlayerState
+
+if TYPE_CHECKING:
+    from .wilderness import Wilderness
+
+HS_CATEGORIES: Dict[str, Callable[[PlayerState], int]] = {
+    "kills": lambda p: int(p.kills),
+    "deaths": lambda p: int(p.deaths),
+    "coins": lambda p: int(p.coins) + int(p.bank_coins),
+    "slayer": lambda p: int(p.slayer_xp or 0),
+    "unique": lambda p: int(p.unique_drops),
+    "pets": lambda p: len(getattr(p, "pets", []) or []),
+    "tasks": lambda p: int(p.slayer_tasks_done or 0),
+    "overall": lambda p: int(p.kills) + int(p.deaths) + int(p.escapes),
+}
+
+# Every PlayerState field read above or by the overall highscores embed;
+# archived players keep only these (see ArchiveManager)
+HS_FIELDS = (
+    "kills", "deaths", "escapes", "coins", "bank_coins", "slayer_xp", "unique_drops",
+    "pets", "slayer_tasks_done", "guild_ids",
+)
+
+
+class TopK:
+    """Scores for one category plus the exact top-L entries, L <= cap.
+
+    `top` holds (-score, uid) sorted ascending, i.e. best first, and is always
+    the exact top of `scores`. A member whose score drops below the tail is
+    dropped rather than reinserted, so the list can shrink; it is refilled
+    from `scores` only when it falls below k, which is rare.
+    """
+
+    __slots__ = ("k", "cap", "scores", "top")
+
+    def __init__(self, k: int, slack: int = 2):
+        self.k = k
+        self.cap = k * slack
+        self.scores: Dict[int, int] = {}
+        self.top: List[Tuple[int, int]] = []
+
+    def set(self, uid: int, score: int):
+        old = self.scores.get(uid, 0)
+        if score == old:
+            return
+        if score > 0:
+            self.scores[uid] = score
+        else:
+            self.scores.pop(uid, None)
+
+        top = self.top
+        if old > 0:
+            i = bisect_left(top, (-old, uid))
+            if i < len(top) and top[i] == (-old, uid):
+                del top[i]
+        if score <= 0:
+            return
+        entry = (-score, uid)
+        # Insert if it beats the tail, or if nobody else is missing from the list
+        if len(self.scores) - len(top) == 1 or (top and entry < top[-1]):
+            insort(top, entry)
+            if len(top) > self.cap:
+                top.pop()
+
+    def rebuild(self):
+        self.top = heapq.nsmallest(self.cap, ((-s, uid) for uid, s in self.scores.items()))
+
+    def best(self, n: int) -> List[Tuple[int, int]]:
+        """[(uid, score)] best first; O(n) unless the list needs a refill."""
+        if len(self.top) < min(n, len(self.scores)):
+            self.rebuild()
+        return [(uid, -neg) for neg, uid in self.top[:n]]
+
+
+class LeaderboardManager:
+    """Global boards plus one shard per guild.
+
+    guilds_of (user_id -> guild ids) is learned from command authors and
+    persisted as PlayerState.guild_ids; a guild's shard only ever holds its
+    own members, so server highscores never look at other players. Players
+    who have not acted since joining are picked up by backfill() the first
+    time a guild's board is shown.
+    """
+
+    def __init__(self, cog: "Wilderness", k: int = 50):
+        self.cog = cog
+        self.k = k
+        self.boards: Dict[str, TopK] = self._new_boards()
+        self.guild_boards: Dict[int, Dict[str, TopK]] = {}
+        self.guilds_of: Dict[int, Set[int]] = {}
+        self.backfilled: Set[int] = set()
+
+    def _new_boards(self) -> Dict[str, TopK]:
+        return {cat: TopK(self.k) for cat in HS_CATEGORIES}
+
+    def _shard(self, guild_id: int) -> Dict[str, TopK]:
+        shard = self.guild_boards.get(guild_id)
+        if shard is None:
+            shard = self.guild_boards[guild_id] = self._new_boards()
+        return shard
+
+    @staticmethod
+    def _scores(p: Optional[PlayerState]) -> Dict[str, int]:
+        scores = {}
+        for cat, score_fn in HS_CATEGORIES.items():
+            try:
+                scores[cat] = score_fn(p) if p is not None else 0
+            except Exception:
+                scores[cat] = 0
+        return scores
+
+    def rebuild(self):
+        self.boards = self._new_boards()
+        self.guild_boards = {}
+        self.guilds_of = {}
+        self.backfilled = set()
+        for uid, p in self.cog.players.summaries():
+            gids = self.guilds_of[uid] = {int(g) for g in (getattr(p, "guild_ids", None) or [])}
+            targets = [self.boards] + [self._shard(g) for g in gids]
+            for cat, score in self._scores(p).items():
+                if score > 0:
+                    for boards in targets:
+                        boards[cat].scores[uid] = score
+        for boards in [self.boards, *self.guild_boards.values()]:
+            for board in boards.values():
+                board.rebuild()
+
+    def update(self, uids: Iterable[int]):
+        """Re-score changed (or deleted) players globally and in their guilds."""
+        for uid in uids:
+            p = self.cog.players.get(uid)
+            targets = [self.boards] + [self._shard(g) for g in self.guilds_of.get(uid, ())]
+            if p is None:
+                self.guilds_of.pop(uid, None)
+            for cat, score in self._scores(p).items():
+                for boards in targets:
+                    boards[cat].set(uid, score)
+
+    def seen(self, uid: int, guild_id: int, p: PlayerState):
+        """Record that uid plays in guild_id (called from get_player)."""
+        gids = self.guilds_of.setdefault(uid, set())
+        if guild_id in gids and guild_id in p.guild_ids:
+            return
+        gids.add(guild_id)
+        if guild_id not in p.guild_ids:
+            p.guild_ids.append(guild_id)
+        shard = self._shard(guild_id)
+        for cat, score in self._scores(p).items():
+            shard[cat].set(uid, score)
+
+    def forget(self, uid: int, guild_id: int):
+        """Drop uid from a guild's shard (member left)."""
+        gids = self.guilds_of.get(uid)
+        if not gids or guild_id not in gids:
+            return
+        gids.discard(guild_id)
+        # Loaded players only; a stored record keeps the stale id until
+        # backfill() drops it or the player next acts
+        p = self.cog.players.hot.get(uid)
+        if p is not None and guild_id in p.guild_ids:
+            p.guild_ids.remove(guild_id)
+        for board in self._shard(guild_id).values():
+            board.set(uid, 0)
+
+    def backfill(self, guild: Any):
+        """Sync a guild's shard with its member list, scored from the global boards.
+
+        Nothing is loaded: every scored player is already in the global
+        boards. Runs once per guild, or on every call while the member cache
+        is still incomplete (guild.chunked False), where it only adds.
+        """
+        guild_id = guild.id
+        if guild_id in self.backfilled:
+            return
+        complete = bool(getattr(guild, "chunked", True))
+        shard = self._shard(guild_id)
+        scored = set().union(*(board.scores for board in self.boards.values()))
+        for uid in scored:
+            gids = self.guilds_of.get(uid)
+            if guild.get_member(uid) is None:
+                if complete and gids and guild_id in gids:
+                    gids.discard(guild_id)
+                    p = self.cog.players.hot.get(uid)
+                    if p is not None and guild_id in p.guild_ids:
+                        p.guild_ids.remove(guild_id)
+                    for board in shard.values():
+                        board.scores.pop(uid, None)
+                continue
+            if gids is None:
+                gids = self.guilds_of[uid] = set()
+            gids.add(guild_id)
+            for cat, board in self.boards.items():
+                score = board.scores.get(uid, 0)
+                if score > 0:
+                    shard[cat].scores[uid] = score
+        for board in shard.values():
+            board.rebuild()
+        if complete:
+            self.backfilled.add(guild_id)
+
+    def top(self, category: str, n: int, guild_id: Optional[int] = None) -> List[Tuple[int, int]]:
+        boards = self.boards if guild_id is None else self.guild_boards.get(guild_id)
+        if not boards:
+            return []
+        board = boards.get(category) or boards["kills"]
+        return board.best(n)
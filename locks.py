@@ -0,0 +1,84 @@
+# Per-player locking with a global barrier
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict
+
+
+class PlayerLockManager:
+    """Per-user locks plus a global barrier.
+
+    ``hold(*user_ids)`` serialises commands per player; several ids are always
+    taken in ascending order so two multi-player operations can't deadlock.
+    ``barrier()`` waits for every in-flight ``hold`` to finish and keeps new
+    ones out until it is released (snapshots).
+
+    Locks are not re-entrant: never nest two ``hold``s that share an id, and
+    never enter ``barrier()`` while inside a ``hold``.
+    """
+
+    def __init__(self):
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._refs: Dict[int, int] = {}
+        self._active = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._open = asyncio.Event()
+        self._open.set()
+        self._barrier_lock = asyncio.Lock()
+
+    def _ref(self, uid: int) -> asyncio.Lock:
+        lock = self._locks.get(uid)
+        if lock is None:
+            lock = self._locks[uid] = asyncio.Lock()
+        self._refs[uid] = self._refs.get(uid, 0) + 1
+        return lock
+
+    def _unref(self, uid: int):
+        n = self._refs.get(uid, 0) - 1
+        if n <= 0:
+            self._refs.pop(uid, None)
+            self._locks.pop(uid, None)
+        else:
+            self._refs[uid] = n
+
+    def is_locked(self, uid: int) -> bool:
+        lock = self._locks.get(int(uid))
+        return bool(lock and lock.locked())
+
+    @asynccontextmanager
+    async def hold(self, *user_ids: int):
+        keys = sorted({int(u) for u in user_ids})
+        while not self._open.is_set():
+            await self._open.wait()
+        self._active += 1
+        self._idle.clear()
+        held = []
+        try:
+            for uid in keys:
+                lock = self._ref(uid)
+                try:
+                    await lock.acquire()
+                except BaseException:
+                    self._unref(uid)
+                    raise
+                held.append(uid)
+            yield
+        finally:
+            for uid in reversed(held):
+                self._locks[uid].release()
+                self._unref(uid)
+            self._active -= 1
+            if self._active == 0:
+                self._idle.set()
+
+    @asynccontextmanager
+    async def barrier(self):
+        async with self._barrier_lock:
+            self._open.clear()
+            try:
+                while self._active:
+                    await self._idle.wait()
+                yield
+            finally:
+                self._open.set()
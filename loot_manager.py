@@ -1,5 +1,5 @@
 import random
-from typing import Dict, Any, Optional, Tuple, List, TYPE_CHECKING
+from typing import Callable, Dict, Any, Optional, Tuple, List, TYPE_CHECKING
 
 from .items import ITEMS
 from .models import PlayerState, parse_chance
@@ -8,9 +8,171 @@ if TYPE_CHECKING:
     from .wilderness import Wilderness
 
 
+def _poisson_binomial(qs: List[float]) -> List[float]:
+    """P(exactly k of the independent events qs succeed), k = 0..len(qs)."""
+    dist = [1.0]
+    for q in qs:
+        nxt = [0.0] * (len(dist) + 1)
+        for k, pk in enumerate(dist):
+            nxt[k] += pk * (1.0 - q)
+            nxt[k + 1] += pk * q
+        dist = nxt
+    return dist
+
+
+class CompiledTable:
+    """A loot table reduced to one categorical draw (Vose alias method).
+
+    ``rarest=True`` reproduces roll_pick_one: every entry rolls independently
+    and the rarest success wins (uniformly among equal chances).
+    ``rarest=False`` reproduces npc_roll_pet: first success in list order wins.
+    Outcome probabilities are computed exactly at compile time, so a roll costs
+    two random() calls plus the quantity roll instead of one roll per entry.
+    """
+
+    __slots__ = ("source", "outcomes", "prob", "alias", "n")
+
+    def __init__(self, entries: List[Dict[str, Any]], *, rarest: bool = True, chance_key: str = "chance"):
+        self.source = entries
+        parsed: List[Tuple[float, float, str, int, int]] = []
+        for e in entries or []:
+            try:
+                item = str(e.get("item", "")).strip()
+                if not item:
+                    continue
+                ch = parse_chance(e.get(chance_key) or e.get("chance", 0))
+                if ch <= 0:
+                    continue
+                lo = int(e.get("min", 1))
+                hi = int(e.get("max", lo))
+                if hi < lo:
+                    hi = lo
+                if rarest:
+                    # A success only counts if the rolled quantity is positive
+                    pos_lo = max(lo, 1)
+                    if hi < pos_lo:
+                        continue
+                    q = ch * (hi - pos_lo + 1) / (hi - lo + 1)
+                    if bool(e.get("noted", False)) and not bool(ITEMS.get(item, {}).get("stackable", False)):
+                        item = "Noted " + item
+                else:
+                    pos_lo, q = lo, ch
+                parsed.append((ch, q, item, pos_lo, hi))
+            except Exception:
+                continue
+
+        weights: List[float] = []
+        self.outcomes: List[Optional[Tuple[str, int, int]]] = []
+        none_p = 1.0
+        if rarest:
+            tiers: Dict[float, List[Tuple[float, str, int, int]]] = {}
+            for ch, q, item, lo, hi in parsed:
+                tiers.setdefault(ch, []).append((q, item, lo, hi))
+            for ch in sorted(tiers):
+                tier = tiers[ch]
+                for i, (q, item, lo, hi) in enumerate(tier):
+                    others = _poisson_binomial([t[0] for j, t in enumerate(tier) if j != i])
+                    share = sum(pk / (k + 1) for k, pk in enumerate(others))
+                    weights.append(none_p * q * share)
+                    self.outcomes.append((item, lo, hi))
+                for q, _item, _lo, _hi in tier:
+                    none_p *= 1.0 - q
+        else:
+            for _ch, q, item, lo, hi in parsed:
+                weights.append(none_p * q)
+                self.outcomes.append((item, lo, hi))
+                none_p *= 1.0 - q
+        weights.append(max(0.0, none_p))
+        self.outcomes.append(None)
+        self._build_alias(weights)
+
+    def _build_alias(self, weights: List[float]):
+        n = len(weights)
+        total = sum(weights) or 1.0
+        scaled = [w * n / total for w in weights]
+        self.n = n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def outcome_probs(self) -> List[float]:
+        """Exact probability of each outcome, recovered from the alias table."""
+        n = self.n
+        out = [0.0] * n
+        for i in range(n):
+            out[i] += self.prob[i] / n
+            out[self.alias[i]] += (1.0 - self.prob[i]) / n
+        return out
+
+    def expected_value(self, value_of: Callable[[str], float]) -> float:
+        """Mean of value_of(item) * qty over one roll (None counts as 0)."""
+        total = 0.0
+        for out, pr in zip(self.outcomes, self.outcome_probs()):
+            if out is not None:
+                item, lo, hi = out
+                total += pr * value_of(item) * (lo + hi) / 2
+        return total
+
+    def roll(self) -> Optional[Tuple[str, int]]:
+        i = int(random.random() * self.n)
+        if random.random() >= self.prob[i]:
+            i = self.alias[i]
+        out = self.outcomes[i]
+        if out is None:
+            return None
+        item, lo, hi = out
+        return item, random.randint(lo, hi)
+
+
 class LootManager:
     def __init__(self, cog: "Wilderness"):
         self.cog = cog
+        self._tables: Dict[int, CompiledTable] = {}
+        self._on_task: Dict[Tuple[str, str], CompiledTable] = {}
+        self._pets: Dict[str, CompiledTable] = {}
+        self._defenders: Dict[Tuple[str, str], CompiledTable] = {}
+
+    def compile_tables(self):
+        """Compile the configured loot tables, NPC drops and chest rewards once."""
+        cfg = self.cog.config
+        self._tables = {}
+        self._on_task = {}
+        self._pets = {}
+        self._defenders = {}
+
+        def reg(entries):
+            if isinstance(entries, list):
+                self._tables[id(entries)] = CompiledTable(entries)
+
+        for entries in (cfg.get("loot_tables", {}) or {}).values():
+            reg(entries)
+        reg(cfg.get("chest_rewards", []))
+        for npc_type, drop in (cfg.get("npc_drops", {}) or {}).items():
+            drop = drop or {}
+            for key in ("loot", "unique"):
+                entries = drop.get(key, [])
+                reg(entries)
+                if isinstance(entries, list) and any(e.get("on_task_chance") for e in entries):
+                    self._on_task[(npc_type, key)] = CompiledTable(entries, chance_key="on_task_chance")
+            unique = drop.get("unique", []) or []
+            self._pets[npc_type] = CompiledTable(drop.get("pet", []) or [], rarest=False)
+            if npc_type == "blight cyclops":
+                for e in unique:
+                    self._defenders.setdefault((npc_type, str(e.get("item", "")).strip()), CompiledTable([e]))
+
+    def _table(self, entries: List[Dict[str, Any]]) -> CompiledTable:
+        t = self._tables.get(id(entries))
+        if t is not None and t.source is entries:
+            return t
+        # Ad-hoc list (e.g. bone chest) — compile on the fly
+        return CompiledTable(entries)
 
     def band(self, wildy_level: int) -> str:
         if wildy_level <= 10:
@@ -23,34 +185,7 @@ class LootManager:
 
     def roll_pick_one(self, entries: List[Dict[str, Any]]) -> Optional[Tuple[str, int]]:
         """Roll each entry, keep the rarest success."""
-        successes: List[Tuple[float, str, int, bool]] = []
-        for e in entries or []:
-            try:
-                item = str(e.get("item", "")).strip()
-                if not item:
-                    continue
-                ch = parse_chance(e.get("chance", 0))
-                if ch <= 0:
-                    continue
-                if random.random() <= ch:
-                    lo = int(e.get("min", 1))
-                    hi = int(e.get("max", lo))
-                    if hi < lo:
-                        hi = lo
-                    qty = random.randint(lo, hi)
-                    noted = bool(e.get("noted", False))
-                    if qty > 0:
-                        successes.append((ch, item, qty, noted))
-            except Exception:
-                continue
-        if not successes:
-            return None
-        min_ch = min(s[0] for s in successes)
-        rarest = [s for s in successes if s[0] == min_ch]
-        _, item, qty, noted = random.choice(rarest)
-        if noted and not bool(ITEMS.get(item, {}).get("stackable", False)):
-            item = "Noted " + item
-        return item, qty
+        return self._table(entries).roll()
 
     def loot_for_level(self, wildy_level: int) -> Optional[Tuple[str, int]]:
         band = self.band(wildy_level)
@@ -66,6 +201,10 @@ class LootManager:
             if not next_def:
                 return None
 
+            compiled = self._defenders.get((npc_type, next_def))
+            if compiled is not None:
+                return compiled.roll()
+
             chosen_entry = None
             for e in entries:
                 if str(e.get("item", "")).strip() == next_def:
@@ -84,6 +223,9 @@ class LootManager:
             and p.slayer_task.get("npc_type") == npc_type
             and int(p.slayer_task.get("remaining", 0)) > 0
         )
+        compiled = self._on_task.get((npc_type, key)) if on_task else None
+        if compiled is not None and compiled.source is npc_drop.get(key):
+            return compiled.roll()
         if on_task:
             adjusted = []
             for e in entries:
@@ -101,6 +243,10 @@ class LootManager:
         return self.roll_pick_one(entries)
 
     def npc_roll_pet(self, npc_type: str) -> Optional[str]:
+        compiled = self._pets.get(npc_type)
+        if compiled is not None:
+            r = compiled.roll()
+            return r[0] if r else None
         npc_drop = self.cog.config.get("npc_drops", {}).get(npc_type, {})
         entries = npc_drop.get("pet", []) or []
         for e in entries:
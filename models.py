@@ -3,16 +3,26 @@
 import asyncio
 import json
 import os
+import struct
 import time
-from dataclasses import dataclass, asdict, field
-from typing import Dict, Any, Optional, List
+from contextlib import nullcontext
+from dataclasses import dataclass, field, fields
+from typing import AsyncContextManager, Dict, Any, Iterable, Optional, List, Callable, Tuple
 
 from .config_default import DEFAULT_CONFIG
+from .items import ALL_COMBAT_KEYS, DEF_KEYS, FOOD, FOOD_BY_HEAL, FOOD_RANK, ITEMS
+from .name_index import NamedKeys
 
 DATA_DIR = "data/wilderness"
 PLAYERS_FILE = os.path.join(DATA_DIR, "players.json")
+PLAYERS_SNAPSHOT_FILE = os.path.join(DATA_DIR, "players.snap")
+JOURNAL_FILE = os.path.join(DATA_DIR, "store.journal")
+LEGACY_PLAYERS_JOURNAL_FILE = os.path.join(DATA_DIR, "players.journal")
 CONFIG_FILE = os.path.join(DATA_DIR, "config.json")
 GUILD_CONFIG_FILE = os.path.join(DATA_DIR, "guild_config.json")
+GE_FILE = os.path.join(DATA_DIR, "ge_offers.json")
+
+NOTED_PREFIX = "Noted "
 
 
 def _now() -> int:
@@ -54,7 +64,134 @@ def parse_chance(v: Any) -> float:
         return 0.0
 
 
-@dataclass
+# ── Combat bonuses ──
+
+def sum_bonuses(
+    equipment: Dict[str, str],
+    buffs: Iterable[Dict[str, Any]],
+    *,
+    style: str,
+    charged: Optional[bool],
+    consumes_charged: Optional[bool],
+    skip_slot: Optional[str] = None,
+) -> Dict[str, int]:
+    """Worn gear plus buffs; shared by InventoryManager.equipped_bonus and FightSimulator.
+
+    consumes_charged=False drops the weapon/ammo strength (no ammo or runes);
+    skip_slot leaves out a slot whose ammo ran out mid-fight.
+    """
+    bonuses: Dict[str, int] = {k: 0 for k in ALL_COMBAT_KEYS}
+
+    for slot, item in equipment.items():
+        if slot == skip_slot:
+            continue
+        meta = ITEMS.get(item, {})
+        for key in ALL_COMBAT_KEYS:
+            # If ammo/rune not available, skip mainhand, ammo, and ammo2 str_* bonuses
+            if consumes_charged is False and slot in ("mainhand", "ammo", "ammo2") and key.startswith("str_"):
+                continue
+            bonuses[key] += int(meta.get(key, 0))
+
+    # Ether weapon atk_vs_npc bonus (already in *4 scale)
+    if charged:
+        meta = ITEMS.get(equipment.get("mainhand", ""), {})
+        bonuses[f"str_{style}"] += int(meta["atk_vs_npc"])
+
+    # Active buffs
+    for buff in buffs:
+        str_val = int(buff.get("str", 0)) or int(buff.get("atk", 0))
+        if str_val:
+            bonuses[f"str_{style}"] += str_val * 4
+        def_val = int(buff.get("def", 0))
+        if def_val:
+            for dk in DEF_KEYS:
+                bonuses[dk] += def_val * 4
+
+    return bonuses
+
+
+# ── Inventory ──
+
+_STACKABLE: Dict[str, bool] = {}
+_STALE = object()
+
+
+def slot_cost(item: str, qty: int) -> int:
+    """Inventory slots taken by qty of item. Food never stacks; noted items always do."""
+    if qty <= 0:
+        return 0
+    stack = _STACKABLE.get(item)
+    if stack is None:
+        stack = _STACKABLE[item] = item not in FOOD and (
+            item.startswith(NOTED_PREFIX) or bool(ITEMS.get(item, {}).get("stackable", False))
+        )
+    return 1 if stack else qty
+
+
+class Inventory(NamedKeys):
+    """Item -> qty dict that keeps a running slot count and its best held food.
+
+    Every mutating dict method is overridden, so direct writes like
+    p.inventory[item] = n stay counted. Serializes as a plain dict.
+    """
+
+    __slots__ = ("slots", "_best_food")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.slots = sum(slot_cost(k, v) for k, v in dict.items(self))
+        self._best_food = _STALE
+
+    def _food_changed(self, item: str, qty: int):
+        best = self._best_food
+        if best is _STALE:
+            return
+        if qty > 0:
+            if best is None or FOOD_RANK[item] < FOOD_RANK[best]:
+                self._best_food = item
+        elif item == best:
+            self._best_food = _STALE
+
+    def best_food(self) -> Optional[str]:
+        """Highest-heal food held (FOOD_BY_HEAL order), or None."""
+        best = self._best_food
+        if best is _STALE:
+            best = self._best_food = next((f for f, _heal in FOOD_BY_HEAL if dict.get(self, f, 0) > 0), None)
+        return best
+
+    def __setitem__(self, item: str, qty: int):
+        self.slots += slot_cost(item, qty) - slot_cost(item, dict.get(self, item, 0))
+        NamedKeys.__setitem__(self, item, qty)
+        if item in FOOD_RANK:
+            self._food_changed(item, qty)
+
+    def __delitem__(self, item: str):
+        self.slots -= slot_cost(item, dict.__getitem__(self, item))
+        NamedKeys.__delitem__(self, item)
+        if item in FOOD_RANK:
+            self._food_changed(item, 0)
+
+    def pop(self, item: str, *default):
+        if item in self:
+            self.slots -= slot_cost(item, dict.__getitem__(self, item))
+            if item in FOOD_RANK:
+                self._food_changed(item, 0)
+        return NamedKeys.pop(self, item, *default)
+
+    def popitem(self):
+        item, qty = NamedKeys.popitem(self)
+        self.slots -= slot_cost(item, qty)
+        if item in FOOD_RANK:
+            self._food_changed(item, 0)
+        return item, qty
+
+    def clear(self):
+        NamedKeys.clear(self)
+        self.slots = 0
+        self._best_food = None
+
+
+@dataclass(slots=True)
 class PlayerState:
 
     user_id: int
@@ -101,12 +238,16 @@ class PlayerState:
     warning_food: int = 0      # warn when total food count <= this (0 = off)
     warning_health: int = 0    # warn when HP ends below this after a fight (0 = off)
     autoeat: int = 0           # auto-eat when HP <= this (0 = use default formula)
+    guild_ids: List[int] = None  # guilds this player has used commands in (server highscores)
+    # Runtime only (never persisted): combat bonus cache, see InventoryManager
+    _gear_version: int = field(default=0, init=False, repr=False, compare=False)
+    _bonus_cache: Optional[Tuple[int, Dict]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if self.inventory is None:
-            self.inventory = {}
-        if self.bank is None:
-            self.bank = {}
+        if not isinstance(self.inventory, Inventory):
+            self.inventory = Inventory(self.inventory or {})
+        if not isinstance(self.bank, NamedKeys):
+            self.bank = NamedKeys(self.bank or {})
         if self.risk is None:
             self.risk = {}
         if self.equipment is None:
@@ -129,8 +270,8 @@ class PlayerState:
             self.ground_items = []
         if self.npc_kills is None:
             self.npc_kills = {}
-        if self.presets is None:
-            self.presets = {}
+        if not isinstance(self.presets, NamedKeys):
+            self.presets = NamedKeys(self.presets or {})
         if self.slayer_unlocks is None:
             self.slayer_unlocks = []
         if self.slayer_blocked is None:
@@ -141,17 +282,31 @@ class PlayerState:
             self.pet_counts = {}
         if self.consume_auto is None:
             self.consume_auto = []
+        if self.guild_ids is None:
+            self.guild_ids = []
+
+    def gear_changed(self) -> None:
+        """Invalidate cached combat bonuses after an equipment, ammo or buff change."""
+        self._gear_version += 1
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        """Persisted fields as plain JSON data; defaults and empty containers are left out."""
+        out: Dict[str, Any] = {"user_id": self.user_id}
+        for name, default, copy in _SERIAL_FIELDS:
+            v = getattr(self, name)
+            if copy is None:
+                if v != default:
+                    out[name] = v
+            elif v:
+                out[name] = copy(v)
+        return out
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "PlayerState":
         if not isinstance(d, dict):
             return PlayerState(user_id=0)
 
-        allowed = set(PlayerState.__dataclass_fields__.keys())
-        cleaned = {k: v for k, v in d.items() if k in allowed}
+        cleaned = {k: v for k, v in d.items() if k in _PERSISTED}
 
         if "user_id" not in cleaned:
             cleaned["user_id"] = int(d.get("user_id", 0) or 0)
@@ -159,6 +314,32 @@ class PlayerState:
         return PlayerState(**cleaned)
 
 
+# ── Serialization ──
+
+def _plain(v: Any) -> Any:
+    if isinstance(v, dict):
+        return {k: _plain(x) for k, x in v.items()}
+    if isinstance(v, (list, tuple)):
+        return [_plain(x) for x in v]
+    return v
+
+
+# Containers are copied so the store can dump records off the event loop.
+_COPIERS: Dict[str, Callable[[Any], Any]] = {
+    "inventory": dict, "bank": dict, "risk": dict, "equipment": dict, "uniques": dict,
+    "cd": dict, "npc_kills": dict, "pet_counts": dict,
+    "pets": list, "blacklist": list, "locked": list, "slayer_unlocks": list,
+    "slayer_blocked": list, "alch_auto": list, "consume_auto": list, "guild_ids": list,
+    "ground_items": lambda rows: [list(r) for r in rows],
+    "active_buffs": _plain, "presets": _plain, "slayer_task": _plain,
+}
+_PERSISTED = frozenset(f.name for f in fields(PlayerState) if f.init)
+_SERIAL_FIELDS: Tuple[Tuple[str, Any, Optional[Callable[[Any], Any]]], ...] = tuple(
+    (f.name, f.default, _COPIERS.get(f.name))
+    for f in fields(PlayerState) if f.init and f.name != "user_id"
+)
+
+
 @dataclass
 class DuelState:
 
@@ -172,10 +353,99 @@ class DuelState:
     b_acted: bool = False
 
 
+class PackedRecord:
+    """A stored player as encoded JSON plus the few decoded fields startup needs.
+
+    `summary` holds whatever the caller chose to keep readable (highscores,
+    timers); `raw` is the full record, decoded only when the player is
+    loaded and copied verbatim into snapshots otherwise.
+    """
+
+    __slots__ = ("summary", "raw")
+
+    def __init__(self, summary: Dict[str, Any], raw: bytes):
+        self.summary = summary
+        self.raw = raw
+
+    @classmethod
+    def encode(cls, d: Dict[str, Any], summary_fields: Tuple[str, ...]) -> "PackedRecord":
+        raw = json.dumps(d, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return cls({k: d[k] for k in summary_fields if k in d}, raw)
+
+    def decode(self) -> Dict[str, Any]:
+        return json.loads(self.raw)
+
+
+# Binary players snapshot, written next to players.json on compaction:
+#   magic, u32 count, count x (u64 uid, u32 offset, u32 summary_len, u32 record_len),
+#   then per player the summary JSON followed by the record JSON.
+# Startup reads the index and the summaries; records stay encoded (PackedRecord).
+_SNAP_MAGIC = b"WSNAP\x00\x01\n"
+_SNAP_COUNT = struct.Struct("<I")
+_SNAP_ENTRY = struct.Struct("<QIII")
+
+
+def fsync_dir(path: str) -> None:
+    """Make a rename into path's directory durable (skipped where directories can't be opened)."""
+    try:
+        fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_players_snapshot(path: str, players: Dict[str, PackedRecord]) -> None:
+    index = []
+    offset = 0
+    for uid, rec in players.items():
+        summary = json.dumps(rec.summary, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        index.append((int(uid), offset, summary, rec.raw))
+        offset += len(summary) + len(rec.raw)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_SNAP_MAGIC)
+        f.write(_SNAP_COUNT.pack(len(index)))
+        for uid, off, summary, raw in index:
+            f.write(_SNAP_ENTRY.pack(uid, off, len(summary), len(raw)))
+        for _uid, _off, summary, raw in index:
+            f.write(summary)
+            f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    fsync_dir(path)
+
+
+def read_players_snapshot(path: str) -> Dict[str, PackedRecord]:
+    with open(path, "rb") as f:
+        buf = f.read()
+    if not buf.startswith(_SNAP_MAGIC):
+        raise ValueError("not a players snapshot")
+    pos = len(_SNAP_MAGIC)
+    (count,) = _SNAP_COUNT.unpack_from(buf, pos)
+    pos += _SNAP_COUNT.size
+    data = pos + count * _SNAP_ENTRY.size
+    loads = json.loads
+    out: Dict[str, PackedRecord] = {}
+    for uid, off, slen, rlen in _SNAP_ENTRY.iter_unpack(buf[pos:data]):
+        start = data + off
+        out[str(uid)] = PackedRecord(loads(buf[start:start + slen]), buf[start + slen:start + slen + rlen])
+    return out
+
+
 class JsonStore:
 
     def __init__(self):
         self._lock = asyncio.Lock()
+        self.journal_records = 0
+        self.compact_every = 500
+        self.binary_snapshot = True
+        self._snapshots: Optional[Tuple[Callable[[], Dict[str, Any]], Callable[[], Dict[str, Any]]]] = None
         os.makedirs(DATA_DIR, exist_ok=True)
 
     async def _read_json(self, path: str, default: Any) -> Any:
@@ -192,7 +462,10 @@ class JsonStore:
             tmp = path + ".tmp"
             with open(tmp, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
             os.replace(tmp, path)
+            fsync_dir(path)
 
         await asyncio.to_thread(_write)
 
@@ -216,10 +489,216 @@ class JsonStore:
         async with self._lock:
             await self._write_json(GUILD_CONFIG_FILE, data)
 
-    async def load_players(self) -> Dict[str, Any]:
+    # ── Journal ──────────────────────────────────────────────────────────
+    # One append-only JSON-lines file shared by players and GE offers:
+    #   {"uid": "<id>", "p": {...} | null}            player upsert / delete
+    #   {"ge": "<op>", "id": <offer_id>, ...}          GE offer event
+    #   {"tx": [<record>, ...]}                        unit of work (all or nothing)
+    # Both snapshots are rewritten together on compaction, so a single
+    # truncate never drops the other dataset's pending records.
+
+    def set_snapshot_sources(
+        self,
+        players: Callable[[], Dict[str, PackedRecord]],
+        ge: Callable[[], Dict[str, Any]],
+    ) -> None:
+        """Register the in-memory views that compaction writes out (players already encoded)."""
+        self._snapshots = (players, ge)
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
+        for path in (LEGACY_PLAYERS_JOURNAL_FILE, JOURNAL_FILE):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        # Torn tail from a crash mid-append; everything before it is intact
+                        break
+                    if "tx" in rec:
+                        out.extend(rec["tx"])
+                    else:
+                        out.append(rec)
+        return out
+
+    async def _append_journal(self, recs: List[Dict[str, Any]], *, atomic: bool = False) -> None:
+        if atomic and len(recs) > 1:
+            # One line = one write; a torn line is dropped whole on replay
+            lines = json.dumps({"tx": recs}, separators=(",", ":"), ensure_ascii=False) + "\n"
+        else:
+            lines = "".join(
+                json.dumps(r, separators=(",", ":"), ensure_ascii=False) + "\n" for r in recs
+            )
+
+        def _append():
+            with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
         async with self._lock:
-            return await self._read_json(PLAYERS_FILE, {})
+            await asyncio.to_thread(_append)
+            self.journal_records += len(recs)
+
+    def compaction_due(self) -> bool:
+        """True once compact_every records are journaled; the cog's flusher then compacts."""
+        return self._snapshots is not None and self.journal_records >= self.compact_every
+
+    async def commit(
+        self,
+        players: Dict[str, Optional[Dict[str, Any]]],
+        ge_events: List[Dict[str, Any]],
+    ) -> None:
+        """Write player records and GE events as a single all-or-nothing journal entry."""
+        recs = [{"uid": uid, "p": data} for uid, data in players.items()] + list(ge_events)
+        if recs:
+            await self._append_journal(recs, atomic=True)
+
+    def has_journal(self) -> bool:
+        return os.path.exists(JOURNAL_FILE) or os.path.exists(LEGACY_PLAYERS_JOURNAL_FILE)
+
+    async def compact(self, barrier: Optional[Callable[[], AsyncContextManager]] = None) -> None:
+        """Fold the journal into fresh players/GE snapshots.
+
+        The snapshot sources are called inside barrier() (no command is
+        mid-change) with the store lock held; the lock is kept until the
+        journal is truncated, so no append can land in between. Commands
+        resume while the files are written.
+        """
+        if self._snapshots is None:
+            return
+        players_fn, ge_fn = self._snapshots
+        async with (barrier() if barrier is not None else nullcontext()):
+            await self._lock.acquire()
+            try:
+                players = players_fn()
+                ge = ge_fn()
+            except BaseException:
+                self._lock.release()
+                raise
+        try:
+            await asyncio.to_thread(self._write_players_files, players)
+            await self._write_json(GE_FILE, ge)
+
+            # Both snapshots are fsynced (files and directory) by now; only then
+            # drop the journal, the other durable copy
+            def _truncate():
+                for path in (JOURNAL_FILE, LEGACY_PLAYERS_JOURNAL_FILE):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+            await asyncio.to_thread(_truncate)
+            self.journal_records = 0
+        finally:
+            self._lock.release()
+
+    # ── Players ──────────────────────────────────────────────────────────
+
+    def _write_players_files(self, players: Dict[str, PackedRecord]) -> None:
+        """players.json (records spliced in without re-encoding), then the binary snapshot."""
+        tmp = PLAYERS_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"{")
+            for i, (uid, rec) in enumerate(players.items()):
+                f.write(b"," if i else b"")
+                f.write(json.dumps(str(uid)).encode("utf-8") + b":")
+                f.write(rec.raw)
+            f.write(b"}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, PLAYERS_FILE)
+        fsync_dir(PLAYERS_FILE)
+        # Written second, so a snapshot older than players.json is never trusted
+        if self.binary_snapshot:
+            write_players_snapshot(PLAYERS_SNAPSHOT_FILE, players)
+        elif os.path.exists(PLAYERS_SNAPSHOT_FILE):
+            os.remove(PLAYERS_SNAPSHOT_FILE)
+
+    def _snapshot_usable(self) -> bool:
+        if not self.binary_snapshot or not os.path.exists(PLAYERS_SNAPSHOT_FILE):
+            return False
+        if not os.path.exists(PLAYERS_FILE):
+            return True
+        return os.path.getmtime(PLAYERS_SNAPSHOT_FILE) >= os.path.getmtime(PLAYERS_FILE)
+
+    async def load_players(self, lazy: bool = False) -> Dict[str, Any]:
+        """Load the players snapshot and replay the journal on top of it.
+
+        lazy=True may return PackedRecords (from the binary snapshot) for
+        players the journal did not touch; otherwise every value is a dict.
+        """
+        async with self._lock:
+            players = None
+            if lazy and self._snapshot_usable():
+                try:
+                    players = await asyncio.to_thread(read_players_snapshot, PLAYERS_SNAPSHOT_FILE)
+                except Exception:
+                    players = None
+            if players is None:
+                players = await self._read_json(PLAYERS_FILE, {})
+            recs = await asyncio.to_thread(self._read_journal)
+            for rec in recs:
+                if "uid" not in rec:
+                    continue
+                uid = str(rec["uid"])
+                if rec.get("p") is None:
+                    players.pop(uid, None)
+                else:
+                    players[uid] = rec["p"]
+            self.journal_records = len(recs)
+            return players
 
     async def save_players(self, players: Dict[str, Any]) -> None:
         async with self._lock:
             await self._write_json(PLAYERS_FILE, players)
+
+    async def append_players(self, records: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Journal changed player records (None = deleted)."""
+        if not records:
+            return
+        await self._append_journal([{"uid": uid, "p": data} for uid, data in records.items()])
+
+    # ── Grand Exchange ───────────────────────────────────────────────────
+
+    async def load_ge(self) -> Dict[str, Any]:
+        """Load the GE snapshot and replay offer events on top of it."""
+        async with self._lock:
+            data = await self._read_json(GE_FILE, {})
+            recs = await asyncio.to_thread(self._read_journal)
+        return replay_ge_events(data, [r for r in recs if "ge" in r])
+
+    async def save_ge(self, data: Dict[str, Any]) -> None:
+        async with self._lock:
+            await self._write_json(GE_FILE, data)
+
+    async def append_ge(self, events: List[Dict[str, Any]]) -> None:
+        """Journal GE offer events (see replay_ge_events)."""
+        if not events:
+            return
+        await self._append_journal(events)
+
+
+def replay_ge_events(data: Dict[str, Any], events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply GE offer events to a {"next_id", "offers"} snapshot.
+
+    create: {"ge": "create", "id", "offer": {...}, "next_id"}
+    fill/claim/edit: {"ge": op, "id", <absolute field values>}
+    remove: {"ge": "remove", "id"}
+    """
+    if not events:
+        return data
+    next_id = int(data.get("next_id", 1))
+    offers = {int(o["offer_id"]): o for o in data.get("offers", [])}
+    for ev in events:
+        op = ev.get("ge")
+        oid = int(ev.get("id", 0))
+        if op == "create":
+            offers[oid] = dict(ev["offer"])
+            next_id = max(next_id, int(ev.get("next_id", oid + 1)))
+        elif op == "remove":
+            offers.pop(oid, None)
+        elif oid in offers:
+            offers[oid].update({k: v for k, v in ev.items() if k not in ("ge", "id")})
+    return {"next_id": next_id, "offers": list(offers.values())}
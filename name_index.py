@@ -0,0 +1,301 @@
+# Normalized name lookups: static tables built at import, per-player key indexes
+
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain, islice
+from typing import Any, Container, Dict, Iterable, List, Optional, Tuple
+
+from .items import GEM_CUTTING, ITEMS
+from .npcs import NPCS
+
+
+def norm(s: Any) -> str:
+    return " ".join(str(s).strip().lower().split())
+
+
+def build_index(names: Iterable[str]) -> Dict[str, str]:
+    """norm(name) -> name; the first name wins, like a linear scan would."""
+    out: Dict[str, str] = {}
+    for name in names:
+        out.setdefault(norm(name), name)
+    return out
+
+
+# ── Static tables ──
+
+NPC_BY_NAME: Dict[str, Dict[str, Any]] = {}
+for _npc in NPCS:
+    NPC_BY_NAME.setdefault(norm(_npc["name"]), _npc)
+
+RUNES: Dict[str, str] = build_index(name for name, meta in ITEMS.items() if meta.get("type") == "rune")
+
+# Uncut or cut gem name -> uncut gem
+UNCUT_GEMS: Dict[str, str] = build_index(GEM_CUTTING)
+for _uncut, _cut in GEM_CUTTING.items():
+    UNCUT_GEMS.setdefault(norm(_cut), _uncut)
+CUT_TO_UNCUT: Dict[str, str] = {cut: uncut for uncut, cut in GEM_CUTTING.items()}
+
+
+# ── Fuzzy search ──
+
+def _grams(s: str) -> List[str]:
+    s = f" {s} "
+    return list({s[i:i + 3] for i in range(len(s) - 2)})
+
+
+def _typo_distance(a: str, b: str) -> int:
+    """Edit distance counting an adjacent swap as one edit (optimal string alignment)."""
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+# Sorts after any name character: bisect_left(names, q + _LAST_CHAR) ends the names starting with q
+_LAST_CHAR = "\U0010ffff"
+
+
+def _one_typo(a: str, b: str) -> bool:
+    """_typo_distance(a, b) <= 1 without the table: compare what follows the first mismatch."""
+    if len(a) > len(b):
+        a, b = b, a
+    k = 0
+    while k < len(a) and a[k] == b[k]:
+        k += 1
+    if len(a) < len(b):
+        return len(b) - len(a) == 1 and a[k:] == b[k + 1:]
+    if a[k + 1:] == b[k + 1:]:
+        return True
+    return k + 1 < len(a) and a[k] == b[k + 1] and a[k + 1] == b[k] and a[k + 2:] == b[k + 2:]
+
+
+def _is_abbreviation(t: str, w: str) -> bool:
+    """t is w with letters left out, keeping the first ("bld" -> "blood")."""
+    if t[0] != w[0]:
+        return False
+    rest = iter(w)
+    return all(c in rest for c in t)
+
+
+class FuzzyIndex:
+    """Ranked name search: exact > name prefix > word-by-word matches.
+
+    Built once from (alias, canonical) pairs. Each query word is matched
+    against the distinct words of all names: exact or prefix by bisect,
+    else substring (rarest trigram's words), abbreviation ("bld" -> blood)
+    or typo ("shrak" -> shark). A name scores the mean of its best match
+    per query word, plus a bonus when its last word is matched by the
+    query's last word ("bld rune" ranks runes over rune armour), minus a
+    little per extra word. Single-word queries that start some word, what
+    a user types most, are ranked at build time and answered by lookup.
+    """
+
+    EXACT, PREFIX = 4.0, 3.0
+    WORD_EXACT, WORD_PREFIX, WORD_INSIDE, WORD_ABBREV, WORD_TYPO = 1.0, 0.9, 0.75, 0.7, 0.6
+    LAST_WORD_BONUS = 0.1
+    EXTRA_WORD_PENALTY = 0.05
+    MIN_SCORE = 0.3
+    TYPO_CANDIDATES = 8
+
+    def __init__(self, pairs: Iterable[Tuple[str, str]]):
+        self.names: List[str] = []          # normalized alias
+        self.canonical: List[str] = []
+        self.name_len: List[int] = []
+        self.word_count: List[int] = []
+        self.last_word: List[str] = []
+        self.word_ids: Dict[str, List[int]] = {}       # word -> names containing it
+        self.word_postings: Dict[str, List[str]] = {}  # trigram -> words containing it
+        seen = set()
+        for alias, canonical in pairs:
+            a = norm(alias)
+            if not a or a in seen:
+                continue
+            seen.add(a)
+            i = len(self.names)
+            self.names.append(a)
+            self.canonical.append(canonical)
+            words = a.split(" ")
+            self.name_len.append(len(a))
+            self.word_count.append(len(words))
+            self.last_word.append(words[-1])
+            for word in words:
+                ids = self.word_ids.setdefault(word, [])
+                if not ids or ids[-1] != i:
+                    ids.append(i)
+        for word in self.word_ids:
+            for g in _grams(word):
+                self.word_postings.setdefault(g, []).append(word)
+        order = sorted(range(len(self.names)), key=self.names.__getitem__)
+        self._sorted = [self.names[i] for i in order]
+        self._sorted_ids = order
+        self._words = sorted(self.word_ids)
+        self._letters = {word: frozenset(word) for word in self._words}
+        # Every prefix of every word: its word scores, then its whole ranking
+        prefixes = sorted({word[:end] for word in self._words for end in range(1, len(word) + 1)})
+        self._prefix_scores = {p: self._word_scores(p) for p in prefixes}
+        self._completions: Dict[str, List[str]] = {p: self._rank(p) for p in prefixes}
+
+    def search(self, query: str, limit: Optional[int] = 10, within: Optional[Container[str]] = None) -> List[str]:
+        """Canonical names ranked best first; `within` restricts the results."""
+        q = norm(query)
+        if not q:
+            return []
+        ranked = self._completions.get(q)
+        if ranked is None:
+            ranked = self._rank(q)
+        if within is not None:
+            return list(islice((c for c in ranked if c in within), limit))
+        return list(ranked) if limit is None else ranked[:limit]
+
+    def _word_matches(self, t: str) -> Dict[str, float]:
+        """Index words matching query word t, with their match score."""
+        words = self._words
+        lo = bisect_left(words, t)
+        hi = bisect_left(words, t + _LAST_CHAR, lo)
+        if lo < hi:
+            out = dict.fromkeys(words[lo:hi], self.WORD_PREFIX)
+            if words[lo] == t:
+                out[t] = self.WORD_EXACT
+            return out
+        out: Dict[str, float] = {}
+        if len(t) < 3:
+            return out
+        # Inside a word: every candidate holds t's rarest trigram
+        inner = [self.word_postings.get(t[k:k + 3], ()) for k in range(len(t) - 2)]
+        for w in min(inner, key=len):
+            if t in w:
+                out[w] = self.WORD_INSIDE
+        # Abbreviation: same first two letters, the rest in order
+        lo = bisect_left(words, t[:2])
+        hi = bisect_left(words, t[:2] + _LAST_CHAR, lo)
+        letters = set(t)
+        for w in words[lo:hi]:
+            if len(w) > len(t) and letters <= self._letters[w] and _is_abbreviation(t, w):
+                out.setdefault(w, self.WORD_ABBREV)
+        if out or len(t) < 4:
+            return out
+        # Typo: edit-distance check the similar words sharing the most trigrams
+        max_typos = max(1, len(t) // 4)
+        shared = Counter(chain.from_iterable(self.word_postings.get(g, ()) for g in _grams(t)))
+        near = [w for w in shared
+                if abs(len(w) - len(t)) <= max_typos and len(letters ^ self._letters[w]) <= 2 * max_typos]
+        near.sort(key=lambda w: (-shared[w], w))
+        for w in near[:self.TYPO_CANDIDATES]:
+            if _one_typo(t, w) if max_typos == 1 else _typo_distance(t, w) <= max_typos:
+                out[w] = self.WORD_TYPO
+        return out
+
+    def _word_scores(self, t: str) -> Tuple[Dict[str, float], Dict[int, float]]:
+        """Words matching query word t, and each name's best score among them."""
+        matches = self._word_matches(t)
+        best: Dict[int, float] = {}
+        for w, s in matches.items():
+            for i in self.word_ids[w]:
+                if s > best.get(i, 0.0):
+                    best[i] = s
+        return matches, best
+
+    def _rank(self, q: str) -> List[str]:
+        # Whole-name exact match or prefix
+        names = self._sorted
+        lo = bisect_left(names, q)
+        hi = bisect_left(names, q + _LAST_CHAR, lo)
+        scores: Dict[int, float] = dict.fromkeys(self._sorted_ids[lo:hi], self.PREFIX)
+        if lo < hi and names[lo] == q:
+            scores[self._sorted_ids[lo]] = self.EXACT
+
+        # Word by word: sum each name's best match per query word
+        tokens = q.split(" ")
+        totals: Dict[int, float] = {}
+        matches: Dict[str, float] = {}
+        for t in tokens:
+            matches, best = self._prefix_scores.get(t) or self._word_scores(t)
+            if not totals:
+                totals = dict(best)
+                continue
+            for i, s in best.items():
+                totals[i] = totals.get(i, 0.0) + s
+        n = len(tokens)
+        word_count, last_word = self.word_count, self.last_word
+        for i, total in totals.items():
+            if i in scores:
+                continue
+            score = total / n
+            if word_count[i] > n:
+                score -= self.EXTRA_WORD_PENALTY * (word_count[i] - n)
+            if last_word[i] in matches:
+                score += self.LAST_WORD_BONUS
+            if score >= self.MIN_SCORE:
+                scores[i] = score
+
+        # Best alias first, so each canonical name keeps its best rank
+        rows = sorted((-score, self.name_len[i], self.canonical[i]) for i, score in scores.items())
+        return list(dict.fromkeys(c for _s, _l, c in rows))
+
+
+# ── Per-player keys ──
+
+class NamedKeys(dict):
+    """A dict whose keys can be resolved case/space-insensitively in O(1).
+
+    The norm(key) -> key index is built on first lookup and dropped whenever
+    a key is added or removed; quantity updates keep it. Serializes as a
+    plain dict. Used for the bank and presets; Inventory extends it.
+    """
+
+    __slots__ = ("_names",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._names: Optional[Dict[str, str]] = None
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def resolve(self, query: str) -> Optional[str]:
+        names = self._names
+        if names is None:
+            names = self._names = build_index(dict.keys(self))
+        return names.get(norm(query))
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self:
+            self._names = None
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str):
+        dict.__delitem__(self, key)
+        self._names = None
+
+    def pop(self, key: str, *default):
+        if key in self:
+            self._names = None
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._names = None
+        return dict.popitem(self)
+
+    def clear(self):
+        dict.clear(self)
+        self._names = None
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: Any = None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
@@ -0,0 +1,209 @@
+# NPC special abilities, compiled from the "abilities" records in npcs.NPCS
+
+import random
+from typing import Any, Callable, Dict, List
+
+from .fight_log import ABILITY, NPC_EXTRA, NPC_FLURRY, SHROUD, FightLog
+from .models import clamp, parse_chance
+from .npcs import NPCS
+
+# Record keys:
+#   name    display name used in per-hit log lines
+#   effect  one of EFFECTS below
+#   chance  proc chance per NPC turn ("1/10", 0.1, or [lo, hi] rolled in whole percent each turn)
+#   hits    duration in hits (or number of extra hits for "flurry")
+#   amount  magnitude (defence lost, bonus damage, flat damage)
+#   msg     proc log line; may use {npc} {hits} {amount} {heal} {hp} {max_hp} {npc_hp} {npc_max}
+
+
+class FightState:
+    """Per-fight values shared by the PvM round loop and the ability hooks."""
+
+    __slots__ = (
+        "npc", "your_hp", "max_hp", "npc_hp", "npc_max", "npc_max_hit", "npc_hit", "def_for_roll",
+        "force_zero", "debuff_hits", "debuff_amount", "shell_hits", "shell_name",
+        "blaze_hits", "blaze_amount", "blaze_name", "ethereum", "shroud", "events",
+    )
+
+    def __init__(self, npc: str, your_hp: int, max_hp: int, npc_hp: int, npc_max_hit: int, events: FightLog):
+        self.npc = npc
+        self.your_hp = your_hp
+        self.max_hp = max_hp
+        self.npc_hp = npc_hp
+        self.npc_max = npc_hp
+        self.npc_max_hit = npc_max_hit
+        self.npc_hit = 0
+        self.def_for_roll = 0
+        self.force_zero = False
+        self.debuff_hits = 0
+        self.debuff_amount = 4
+        self.shell_hits = 0
+        self.shell_name = ""
+        self.blaze_hits = 0
+        self.blaze_amount = 0
+        self.blaze_name = ""
+        self.ethereum = False
+        self.shroud = False
+        self.events = events
+
+
+Hook = Callable[[FightState], None]
+
+
+def _proc(ab: Dict[str, Any]) -> Callable[[], bool]:
+    ch = ab.get("chance", 0)
+    if isinstance(ch, (list, tuple)):
+        lo, hi = (int(round(parse_chance(c) * 100)) for c in ch)
+        return lambda: random.random() < random.randint(lo, hi) / 100
+    p = parse_chance(ch)
+    return lambda: random.random() < p
+
+
+def _log(ab: Dict[str, Any], st: FightState, **extra: Any):
+    msg = ab.get("msg")
+    if msg:
+        st.events.add(ABILITY, msg, dict(
+            hits=int(ab.get("hits", 0)), amount=int(ab.get("amount", 0)),
+            hp=st.your_hp, npc_hp=st.npc_hp, **extra,
+        ))
+
+
+def _force_zero(ab: Dict[str, Any]) -> Hook:
+    proc = _proc(ab)
+
+    def hook(st: FightState):
+        if proc():
+            st.force_zero = True
+            _log(ab, st)
+    return hook
+
+
+def _def_debuff(ab: Dict[str, Any]) -> Hook:
+    proc = _proc(ab)
+    hits, amount = int(ab.get("hits", 0)), int(ab.get("amount", 0))
+
+    def hook(st: FightState):
+        if proc():
+            st.debuff_hits = hits
+            st.debuff_amount = amount
+            _log(ab, st)
+    return hook
+
+
+def _life_steal(ab: Dict[str, Any]) -> Hook:
+    """Heal the NPC by the damage it just dealt; optional hits/amount also lower defence."""
+    proc = _proc(ab)
+    hits, amount = int(ab.get("hits", 0)), int(ab.get("amount", 0))
+
+    def hook(st: FightState):
+        if st.npc_hit > 0 and proc():
+            heal = st.npc_hit
+            st.npc_hp = min(st.npc_hp + heal, st.npc_max)
+            if hits:
+                st.debuff_hits = hits
+                st.debuff_amount = amount
+            _log(ab, st, heal=heal)
+    return hook
+
+
+def _damage_boost(ab: Dict[str, Any]) -> Hook:
+    proc = _proc(ab)
+    hits, amount, name = int(ab.get("hits", 0)), int(ab.get("amount", 0)), ab.get("name", "")
+
+    def hook(st: FightState):
+        if proc():
+            st.blaze_hits = hits
+            st.blaze_amount = amount
+            st.blaze_name = name
+            _log(ab, st)
+    return hook
+
+
+def _damage_shell(ab: Dict[str, Any]) -> Hook:
+    proc = _proc(ab)
+    hits, name = int(ab.get("hits", 0)), ab.get("name", "")
+
+    def hook(st: FightState):
+        if proc():
+            st.shell_hits = hits
+            st.shell_name = name
+            _log(ab, st)
+    return hook
+
+
+def _flurry(ab: Dict[str, Any]) -> Hook:
+    """Extra NPC hits at 50% damage (Ethereum and Shroud still apply)."""
+    proc = _proc(ab)
+    hits, name = int(ab.get("hits", 0)), ab.get("name", "")
+
+    def hook(st: FightState):
+        if not proc():
+            return
+        _log(ab, st)
+        for i in range(hits):
+            if st.your_hp <= 0:
+                break
+            paw_hit = max(0, random.randint(0, st.npc_max_hit) - random.randint(0, st.def_for_roll))
+            paw_hit = max(1, paw_hit // 2)
+            if st.ethereum:
+                paw_hit = int(paw_hit * 0.5)
+            if st.shroud and paw_hit > 0 and random.random() < 0.02:
+                paw_hit = 0
+                st.events.add(SHROUD)
+            st.your_hp = clamp(st.your_hp - paw_hit, 0, st.max_hp)
+            st.events.add(NPC_FLURRY, name, i + 2, paw_hit, st.your_hp)
+    return hook
+
+
+def _extra_attack(ab: Dict[str, Any]) -> Hook:
+    proc = _proc(ab)
+    name = ab.get("name", "")
+
+    def hook(st: FightState):
+        if not proc():
+            return
+        _log(ab, st)
+        extra = max(0, random.randint(0, st.npc_max_hit) - random.randint(0, st.def_for_roll))
+        st.your_hp = clamp(st.your_hp - extra, 0, st.max_hp)
+        st.events.add(NPC_EXTRA, name, extra, st.your_hp)
+    return hook
+
+
+def _flat_damage(ab: Dict[str, Any]) -> Hook:
+    proc = _proc(ab)
+    amount = int(ab.get("amount", 0))
+
+    def hook(st: FightState):
+        if proc():
+            st.your_hp = clamp(st.your_hp - amount, 0, st.max_hp)
+            _log(ab, st)
+    return hook
+
+
+EFFECTS: Dict[str, Callable[[Dict[str, Any]], Hook]] = {
+    "force_zero": _force_zero,        # player's next hit deals 0
+    "def_debuff": _def_debuff,        # player defence -amount for hits
+    "life_steal": _life_steal,        # NPC heals the damage it just dealt
+    "damage_boost": _damage_boost,    # NPC hits deal +amount for hits
+    "damage_shell": _damage_shell,    # player damage halved for hits
+    "flurry": _flurry,                # hits extra NPC hits at 50% damage
+    "extra_attack": _extra_attack,    # one immediate extra NPC attack
+    "flat_damage": _flat_damage,      # amount unavoidable damage
+}
+
+
+def compile_abilities(npc: Dict[str, Any]) -> List[Hook]:
+    hooks: List[Hook] = []
+    for ab in npc.get("abilities", []) or []:
+        make = EFFECTS.get(ab.get("effect"))
+        if make:
+            hooks.append(make(ab))
+    return hooks
+
+
+NPC_HOOKS: Dict[str, List[Hook]] = {n["name"]: compile_abilities(n) for n in NPCS}
+
+
+def hooks_for(npc: Dict[str, Any]) -> List[Hook]:
+    hooks = NPC_HOOKS.get(npc.get("name"))
+    return hooks if hooks is not None else compile_abilities(npc)
@@ -1,6 +1,7 @@
 from typing import Dict, Any, List
 
 # Optional slayer keys: slayer_level, slayer_xp, task_range
+# Optional "abilities": special attack records, compiled by npc_abilities.py
 _IMG_BASE = "https://raw.githubusercontent.com/RSSaltea/PoF-Wildy-Game/main/docs/images/game/npcs/"
 
 NPCS: List[Dict[str, Any]] = [
@@ -43,6 +44,8 @@ NPCS: List[Dict[str, Any]] = [
     {"name": "Fury Bunny", "hp": 85, "tier": 3, "min_wildy": 23, "npc_type": "fury_bunny",
      "stance": "slash", "str_melee": 26, "d_stab": 8, "d_slash": 12, "d_crush": 4, "d_magic": -4, "d_range": 8, "slayer_level": 16, "slayer_xp": 55, "task_range": [10, 20],
      "guild_id": 1327651830133690439,
+     "abilities": [{"name": "Paws of Fury", "effect": "flurry", "chance": [0.02, 0.12], "hits": 2,
+                    "msg": "🐾 **{npc}** unleashes **Paws of Fury**!"}],
      "image": _IMG_BASE + "fury-bunny.png"},
     {"name": "Chaos fanatic", "hp": 90, "tier": 3, "min_wildy": 24, "npc_type": "chaos_fanatic",
      "stance": "magic", "str_magic": 28, "d_stab": 8, "d_slash": 8, "d_crush": 4, "d_magic": 20, "d_range": 16, "slayer_level": 15, "slayer_xp": 60, "task_range": [10, 20],
@@ -52,9 +55,13 @@ NPCS: List[Dict[str, Any]] = [
      "image": _IMG_BASE + "risen-bonecaller.png"},
     {"name": "Windstrider", "hp": 120, "tier": 3, "min_wildy": 28, "npc_type": "windstrider",
      "stance": "range", "str_range": 32, "d_stab": 8, "d_slash": 8, "d_crush": 4, "d_magic": -8, "d_range": 24, "slayer_level": 20, "slayer_xp": 60, "task_range": [10, 20],
+     "abilities": [{"name": "Evasive Dash", "effect": "force_zero", "chance": 0.10,
+                    "msg": "💨 **{npc}** dashes aside! Your **next hit will deal 0**."}],
      "image": _IMG_BASE + "windstrider.png"},
     {"name": "Infernal Warlock", "hp": 130, "tier": 3, "min_wildy": 30, "npc_type": "infernal_warlock",
      "stance": "magic", "str_magic": 36, "d_stab": 12, "d_slash": 12, "d_crush": 8, "d_magic": 20, "d_range": 4, "slayer_level": 22, "slayer_xp": 65, "task_range": [10, 20],
+     "abilities": [{"name": "Infernal Blaze", "effect": "damage_boost", "chance": 0.08, "hits": 3, "amount": 3,
+                    "msg": "🔥 **{npc}** ignites! NPC hits deal **+{amount} damage** for **{hits}** hits."}],
      "image": _IMG_BASE + "infernal-warlock.png"},
     # ── Tier 4 (Wildy 31-40) ──
     {"name": "Revenant necromancer", "hp": 140, "tier": 4, "min_wildy": 31, "npc_type": "revenant necro",
@@ -68,12 +75,16 @@ NPCS: List[Dict[str, Any]] = [
      "image": _IMG_BASE + "revenant-abyssal-demon.png"},
     {"name": "Hollow Warden", "hp": 220, "tier": 4, "min_wildy": 36, "npc_type": "hollow_warden",
      "stance": "crush", "str_melee": 42, "d_stab": 20, "d_slash": 20, "d_crush": 24, "d_magic": -8, "d_range": 16, "slayer_level": 40, "slayer_xp": 140, "task_range": [30, 60],
+     "abilities": [{"name": "Stone Shell", "effect": "damage_shell", "chance": 0.10, "hits": 3,
+                    "msg": "🪨 **{npc}** raises a Stone Shell! Your damage is **halved** for **{hits}** hits."}],
      "image": _IMG_BASE + "hollow-warden.png"},
     {"name": "Revenant Archon", "hp": 200, "tier": 4, "min_wildy": 37, "npc_type": "revenant archon",
      "stance": "slash", "str_melee": 52, "d_stab": 32, "d_slash": 32, "d_crush": 28, "d_magic": -8, "d_range": 24, "slayer_level": 45, "slayer_xp": 132, "task_range": [40, 80],
      "image": _IMG_BASE + "revenant-archon.png"},
     {"name": "Lord Valthyros", "hp": 250, "tier": 4, "min_wildy": 38, "npc_type": "valthyros",
      "stance": "magic", "str_magic": 24, "d_stab": 16, "d_slash": 16, "d_crush": 8, "d_magic": 48, "d_range": 32, "slayer_level": 40, "slayer_xp": 156, "task_range": [40, 80],
+     "abilities": [{"name": "Blood Drain", "effect": "life_steal", "chance": 0.10,
+                    "msg": "🩸 **{npc}** drains your blood! Heals **{heal} HP** | {npc}: **{npc_hp}/{npc_max}**"}],
      "image": _IMG_BASE + "lord-valthyros.png"},
     {"name": "Abyssal Overlord", "hp": 280, "tier": 4, "min_wildy": 40, "npc_type": "overlord",
      "stance": "crush", "str_melee": 44, "d_stab": 28, "d_slash": 28, "d_crush": 24, "d_magic": -8, "d_range": 24, "slayer_level": 40, "slayer_xp": 180, "task_range": [40, 80],
@@ -81,24 +92,36 @@ NPCS: List[Dict[str, Any]] = [
     # ── Tier 5 (Wildy 41-50) ──
     {"name": "Zarveth the Veilbreaker", "hp": 420, "tier": 5, "min_wildy": 41, "npc_type": "veilbreaker",
      "stance": "slash", "str_melee": 88, "d_stab": 8, "d_slash": 8, "d_crush": 12, "d_magic": 8, "d_range": 4, "d_necro": 16, "slayer_level": 55, "slayer_xp": 264, "task_range": [60, 120],
+     "abilities": [{"name": "Veil Shatter", "effect": "force_zero", "chance": 0.05,
+                    "msg": "🌀 **{npc}** shatters the veil! Your **next hit will deal 0**."}],
      "image": _IMG_BASE + "zarveth-the-veilbreaker.png"},
     {"name": "Duskwalker", "hp": 480, "tier": 5, "min_wildy": 43, "npc_type": "duskwalker",
      "stance": "range", "str_range": 72, "d_stab": 20, "d_slash": 20, "d_crush": 12, "d_magic": -16, "d_range": 48, "d_necro": 8, "slayer_level": 65, "slayer_xp": 300, "task_range": [60, 120],
+     "abilities": [{"name": "Shadow Volley", "effect": "extra_attack", "chance": 0.08,
+                    "msg": "🌑 **{npc}** unleashes a Shadow Volley!"}],
      "image": _IMG_BASE + "duskwalker.png"},
     {"name": "Masked Figure", "hp": 460, "tier": 5, "min_wildy": 45, "npc_type": "masked_figure",
      "stance": "stab", "str_melee": 64, "d_stab": 40, "d_slash": 40, "d_crush": 36, "d_magic": -12, "d_range": 32, "slayer_level": 70, "slayer_xp": 288, "task_range": [60, 120],
      "image": _IMG_BASE + "masked-figure.png"},
     {"name": "Emberlord Kael", "hp": 500, "tier": 5, "min_wildy": 47, "npc_type": "emberlord",
      "stance": "magic", "str_magic": 80, "d_stab": 16, "d_slash": 16, "d_crush": 8, "d_magic": 56, "d_range": 12, "d_necro": 12, "slayer_level": 75, "slayer_xp": 330, "task_range": [60, 120],
+     "abilities": [{"name": "Flame Burst", "effect": "flat_damage", "chance": 0.10, "amount": 5,
+                    "msg": "🌋 **{npc}** unleashes a Flame Burst! **{amount}** unavoidable damage | You: **{hp}/{max_hp}**"}],
      "image": _IMG_BASE + "emberlord-kael.png"},
     {"name": "Gravekeeper Azriel", "hp": 520, "tier": 5, "min_wildy": 49, "npc_type": "gravekeeper",
      "stance": "necro", "str_necro": 76, "d_stab": 24, "d_slash": 24, "d_crush": 16, "d_magic": 24, "d_range": 16, "d_necro": 48, "slayer_level": 70, "slayer_xp": 320, "task_range": [60, 120],
+     "abilities": [{"name": "Soul Siphon", "effect": "life_steal", "chance": 0.12, "hits": 4, "amount": 3,
+                    "msg": "👻 **{npc}** siphons your soul! Heals **{heal} HP** and reduces your defence by **{amount}** for **{hits}** hits. | {npc}: **{npc_hp}/{npc_max}**"}],
      "image": _IMG_BASE + "gravekeeper-azriel.png"},
     {"name": "Netharis the Undying", "hp": 550, "tier": 5, "min_wildy": 50, "npc_type": "netharis",
      "stance": "necro", "str_necro": 72, "d_stab": 28, "d_slash": 28, "d_crush": 40, "d_magic": 32, "d_range": 16, "d_necro": 56, "slayer_level": 85, "slayer_xp": 360, "task_range": [90, 140],
+     "abilities": [{"name": "Curse", "effect": "def_debuff", "chance": 0.15, "hits": 5, "amount": 4,
+                    "msg": "💀 **{npc}** curses you! Your defence is reduced by **{amount}** for **{hits}** hits."}],
      "image": _IMG_BASE + "netharis-the-undying.png"},
 ]
 
+REVENANT_TYPES = {"revenant goblin", "revenant knight", "revenant demon", "revenant necro", "revenant archon", "revenant imp", "revenant pyromancer"}
+
 # Auto-generated from NPCS — do not edit manually
 NPC_SLAYER: Dict[str, Dict[str, Any]] = {}
 for _npc in NPCS:
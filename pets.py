@@ -1,10 +1,9 @@
 from typing import Dict, List, Optional, Tuple
+from .name_index import norm as _norm
 from .npcs import NPC_DROPS
 
-def _norm(s: str) -> str:
-    return " ".join(str(s).strip().lower().split())
 
-def get_all_pets() -> List[str]:
+def _collect_pets() -> List[str]:
     pets = set()
 
     for npc_type, data in (NPC_DROPS or {}).items():
@@ -15,6 +14,11 @@ def get_all_pets() -> List[str]:
 
     return sorted(pets, key=lambda s: s.lower())
 
+_ALL_PETS: Tuple[str, ...] = tuple(_collect_pets())
+
+def get_all_pets() -> List[str]:
+    return list(_ALL_PETS)
+
 def get_pet_sources() -> Dict[str, List[Tuple[str, str]]]:
     sources: Dict[str, List[Tuple[str, str]]] = {}
 
@@ -68,18 +72,14 @@ PET_ALIASES: Dict[str, str] = {
     "fanatic pet": "Baby Chaos Fanatic",
 }
 
+# Aliases take precedence over pet names
+PET_INDEX: Dict[str, str] = {}
+for _alias, _name in PET_ALIASES.items():
+    PET_INDEX.setdefault(_norm(_alias), _name)
+for _pet in _ALL_PETS:
+    PET_INDEX.setdefault(_norm(_pet), _pet)
+
 def resolve_pet(query: str) -> Optional[str]:
     if not query:
         return None
-
-    q = _norm(query)
-
-    for alias, name in PET_ALIASES.items():
-        if _norm(alias) == q:
-            return name
-
-    for pet in get_all_pets():
-        if _norm(pet) == q:
-            return pet
-
-    return None
\ No newline at end of file
+    return PET_INDEX.get(_norm(query))
@@ -2,9 +2,9 @@
 
 from typing import Dict, Any, Optional, Tuple, List
 
-from .models import PlayerState, _now, clamp
+from .models import Inventory, PlayerState, _now, clamp
+from .name_index import NPC_BY_NAME, FuzzyIndex, NamedKeys, norm
 from .items import ITEMS, FOOD
-from .npcs import NPCS
 
 
 class PlayerManager:
@@ -12,9 +12,10 @@ class PlayerManager:
     def __init__(self, cog):
         self.cog = cog
         self._item_alias_map: Dict[str, str] = {}
+        self._item_search = FuzzyIndex(())
 
     def norm(self, s: str) -> str:
-        return " ".join(str(s).strip().lower().split())
+        return norm(s)
 
     def build_item_alias_map(self):
         m: Dict[str, str] = {}
@@ -49,11 +50,25 @@ class PlayerManager:
                     add(str(part).strip(), canonical)
 
         self._item_alias_map = m
+        self._item_search = FuzzyIndex(m.items())
 
     def resolve_item(self, query: str) -> Optional[str]:
         return self._item_alias_map.get(self.norm(query))
 
+    def search_items(self, query: str, limit: Optional[int] = 10, within=None) -> List[str]:
+        """Ranked fuzzy matches over item/food names and aliases."""
+        return self._item_search.search(query, limit=limit, within=within)
+
+    def did_you_mean(self, query: str, limit: int = 3) -> str:
+        matches = self.search_items(query, limit=limit)
+        if not matches:
+            return ""
+        return "\nDid you mean " + ", ".join(f"**{m}**" for m in matches) + "?"
+
     def resolve_from_keys_case_insensitive(self, query: str, keys) -> Optional[str]:
+        """Pass the container itself (p.inventory, p.bank), not .keys(), to use its index."""
+        if isinstance(keys, NamedKeys):
+            return keys.resolve(query)
         q = self.norm(query)
         for k in keys:
             if self.norm(k) == q:
@@ -67,21 +82,23 @@ class PlayerManager:
         return None
 
     def resolve_npc(self, query: str) -> Optional[Dict[str, Any]]:
-        q = self.norm(query)
-        for n in NPCS:
-            if self.norm(n["name"]) == q:
-                return n
-        return None
+        return NPC_BY_NAME.get(self.norm(query))
 
     def get_player(self, user) -> PlayerState:
         p = self.cog.players.get(user.id)
         if p is None:
             p = PlayerState(user_id=user.id)
             self.cog.players[user.id] = p
+        self.cog._mark_changed(user.id)
+        guild = getattr(user, "guild", None)
+        if guild is not None:
+            self.cog.hs_mgr.seen(user.id, guild.id, p)
 
-        p.inventory = p.inventory or {}
+        if not isinstance(p.inventory, Inventory):
+            p.inventory = Inventory(p.inventory or {})
         p.active_buffs = p.active_buffs or {}
-        p.bank = p.bank or {}
+        if not isinstance(p.bank, NamedKeys):
+            p.bank = NamedKeys(p.bank or {})
         p.risk = p.risk or {}
         p.equipment = p.equipment or {}
         p.uniques = p.uniques or {}
@@ -0,0 +1,215 @@
+# Player repository: a bounded LRU of live PlayerStates over the stored and archived records
+
+from collections import OrderedDict
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple, Union
+
+from .archive import unpack
+from .leaderboard import HS_FIELDS
+from .models import PackedRecord, PlayerState
+
+if TYPE_CHECKING:
+    from .wilderness import Wilderness
+
+_BLANK = PlayerState(user_id=0)
+
+# Fields kept decoded for packed cold players: highscores plus what the
+# timer deadlines read (see timers.py)
+SUMMARY_FIELDS = HS_FIELDS + ("in_wilderness", "last_action", "ground_items", "cd")
+
+Record = Union[Dict[str, Any], PackedRecord]
+
+
+def _fields(d: Record) -> Dict[str, Any]:
+    return d.summary if isinstance(d, PackedRecord) else d
+
+
+class RecordView:
+    """Read-only attribute view of a stored player record.
+
+    Missing keys read as PlayerState defaults, so leaderboard scores and
+    timer deadlines can be computed without building the full object.
+    """
+
+    __slots__ = ("_d",)
+
+    def __init__(self, d: Dict[str, Any]):
+        self._d = d
+
+    def __getattr__(self, name: str) -> Any:
+        d = self._d
+        return d[name] if name in d else getattr(_BLANK, name)
+
+
+class PlayerRepository:
+    """Dict-like store for self.players: hot PlayerStates plus cold records.
+
+    Records loaded at startup stay as dicts or PackedRecords until the player acts;
+    get() then builds the PlayerState and keeps it in an LRU of
+    config["player_cache_size"]. When the LRU overflows, the least recently
+    used players that are persisted and not mid-command go back to being
+    records. Archived players (see ArchiveManager) are unpacked by get()
+    and marked changed so the flusher writes them back to the main store.
+    """
+
+    # LRU entries looked at per eviction pass beyond the overflow
+    EVICT_SCAN = 32
+
+    def __init__(self, cog: "Wilderness"):
+        self.cog = cog
+        self.hot: "OrderedDict[int, PlayerState]" = OrderedDict()
+        self.cold: Dict[int, Record] = {}
+        self.archived: Dict[int, Tuple[Dict[str, Any], bytes]] = {}  # uid -> (summary, packed record)
+        self.archive_zdict = b""
+        self.archive_dirty = False
+
+    def load(self, records: Dict[str, Any]):
+        self.hot = OrderedDict()
+        self.cold = {}
+        self.archived = {}
+        for uid, d in records.items():
+            try:
+                self.cold[int(uid)] = d if isinstance(d, (dict, PackedRecord)) else {}
+            except Exception:
+                continue
+
+    # ── Mapping ──
+
+    def get(self, uid: int, default: Optional[PlayerState] = None) -> Optional[PlayerState]:
+        p = self.hot.get(uid)
+        if p is not None:
+            self.hot.move_to_end(uid)
+            return p
+        d = self.cold.pop(uid, None)
+        if d is None:
+            return self._restore(uid, default)
+        try:
+            p = PlayerState.from_dict(d.decode() if isinstance(d, PackedRecord) else d)
+        except Exception:
+            self.cold[uid] = d
+            return default
+        self.hot[uid] = p
+        self._evict(keep=uid)
+        return p
+
+    def _restore(self, uid: int, default: Optional[PlayerState]) -> Optional[PlayerState]:
+        entry = self.archived.get(uid)
+        if entry is None:
+            return default
+        try:
+            p = PlayerState.from_dict(unpack(entry[1], self.archive_zdict))
+        except Exception:
+            return default
+        del self.archived[uid]
+        self.archive_dirty = True
+        self.hot[uid] = p
+        self.cog._mark_changed(uid)
+        self._evict(keep=uid)
+        return p
+
+    def __getitem__(self, uid: int) -> PlayerState:
+        p = self.get(uid)
+        if p is None:
+            raise KeyError(uid)
+        return p
+
+    def __setitem__(self, uid: int, p: PlayerState):
+        self.cold.pop(uid, None)
+        self.hot[uid] = p
+        self.hot.move_to_end(uid)
+        self._evict(keep=uid)
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self.hot or uid in self.cold or uid in self.archived
+
+    def __len__(self) -> int:
+        return len(self.hot) + len(self.cold) + len(self.archived)
+
+    def __iter__(self) -> Iterator[int]:
+        return chain(list(self.hot), list(self.cold), list(self.archived))
+
+    def pop(self, uid: int, *default: Any) -> Any:
+        if uid in self.hot:
+            return self.hot.pop(uid)
+        if uid in self.cold:
+            d = self.cold.pop(uid)
+            return PlayerState.from_dict(d.decode() if isinstance(d, PackedRecord) else d)
+        if uid in self.archived:
+            self.archive_dirty = True
+            return PlayerState.from_dict(unpack(self.archived.pop(uid)[1], self.archive_zdict))
+        if default:
+            return default[0]
+        raise KeyError(uid)
+
+    def peek(self, uid: int) -> Optional[PlayerState]:
+        """Read-only copy of a player for viewing someone else.
+
+        Cold players stay out of the LRU and archived players stay archived;
+        only the player's own commands (get()) load or restore them.
+        """
+        p = self.hot.get(uid)
+        if p is not None:
+            return p
+        try:
+            d = self.cold.get(uid)
+            if d is not None:
+                return PlayerState.from_dict(d.decode() if isinstance(d, PackedRecord) else d)
+            entry = self.archived.get(uid)
+            if entry is not None:
+                return PlayerState.from_dict(unpack(entry[1], self.archive_zdict))
+        except Exception:
+            pass
+        return None
+
+    # ── Bulk reads (never load cold or archived players) ──
+
+    def summary(self, uid: int) -> Optional[Union[PlayerState, RecordView]]:
+        """Player-like view for display; archived players only carry HS_FIELDS."""
+        p = self.hot.get(uid)
+        if p is not None:
+            return p
+        d = self.cold.get(uid)
+        if d is not None:
+            return RecordView(_fields(d))
+        entry = self.archived.get(uid)
+        return RecordView(entry[0]) if entry is not None else None
+
+    def summaries(self) -> Iterator[Tuple[int, Union[PlayerState, RecordView]]]:
+        """(user_id, player-like) for everyone; cold and archived players are RecordViews."""
+        for uid, p in list(self.hot.items()):
+            yield uid, p
+        for uid, d in list(self.cold.items()):
+            yield uid, RecordView(_fields(d))
+        for uid, (s, _z) in list(self.archived.items()):
+            yield uid, RecordView(s)
+
+    def snapshot(self) -> Dict[str, PackedRecord]:
+        """Every main-store player, encoded; packed cold players are reused as they are."""
+        out = {str(uid): PackedRecord.encode(p.to_dict(), SUMMARY_FIELDS) for uid, p in self.hot.items()}
+        for uid, d in list(self.cold.items()):
+            if not isinstance(d, PackedRecord):
+                d = self.cold[uid] = PackedRecord.encode(d, SUMMARY_FIELDS)
+            out[str(uid)] = d
+        return out
+
+    # ── Eviction ──
+
+    def _evictable(self, uid: int) -> bool:
+        cog = self.cog
+        return (
+            uid not in cog._changed_uids
+            and uid not in cog._dirty_uids
+            and not cog.lock_mgr.is_locked(uid)
+        )
+
+    def _evict(self, keep: int):
+        over = len(self.hot) - int(self.cog.config.get("player_cache_size", 2000))
+        if over <= 0:
+            return
+        for uid in list(islice(self.hot, over + self.EVICT_SCAN)):
+            if over <= 0:
+                break
+            if uid == keep or not self._evictable(uid):
+                continue
+            self.cold[uid] = PackedRecord.encode(self.hot.pop(uid).to_dict(), SUMMARY_FIELDS)
+            over -= 1
@@ -96,6 +96,7 @@ class PresetManager:
                 p.equipment[slot] = item
             else:
                 missing.append(item)
+        p.gear_changed()
 
         for item, qty in target_inv.items():
             if qty <= 0:
@@ -128,8 +129,4 @@ class PresetManager:
         return list(p.presets.keys())
 
     def _find_key(self, p: PlayerState, name: str) -> Optional[str]:
-        lower = name.strip().lower()
-        for k in p.presets:
-            if k.lower() == lower:
-                return k
-        return None
+        return p.presets.resolve(name)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Tuple, Optional
 
 from .items import ITEMS
 from .models import PlayerState, _now
+from .name_index import RUNES
 
 if TYPE_CHECKING:
     from .wilderness import Wilderness
@@ -22,11 +23,8 @@ class RunecraftManager:
             meta = ITEMS.get(resolved, {})
             if meta.get("type") == "rune" and resolved not in RC_BLOCKED:
                 return resolved
-        norm_q = self.cog._norm(query)
-        for name, meta in ITEMS.items():
-            if meta.get("type") == "rune" and name not in RC_BLOCKED and self.cog._norm(name) == norm_q:
-                return name
-        return None
+        name = RUNES.get(self.cog._norm(query))
+        return name if name not in RC_BLOCKED else None
 
     def _pouch_bonus(self, p: PlayerState) -> int:
         """Extra essence from pouches in inv."""
@@ -40,23 +38,7 @@ class RunecraftManager:
         return bonus
 
     def _count_non_pouch_items(self, p: PlayerState) -> int:
-        from .items import FOOD
-        slots = 0
-        for item_name, qty in p.inventory.items():
-            if qty <= 0:
-                continue
-            meta = ITEMS.get(item_name, {})
-            if meta.get("type") == "esspouch":
-                # Pouches take slots but we count them
-                slots += int(qty)
-                continue
-            if item_name in FOOD:
-                slots += int(qty)
-            elif meta.get("stackable") or self.cog._is_stackable(item_name):
-                slots += 1
-            else:
-                slots += int(qty)
-        return slots
+        return self.cog._inv_slots_used(p.inventory)
 
     def is_busy(self, p: PlayerState) -> Tuple[bool, int, str]:
         """Returns (busy, secs_left, rune_name)."""
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Tuple, Optional, List, Dict, Any
 
 from .npcs import NPCS, NPC_SLAYER
 from .models import PlayerState
+from .name_index import NPC_BY_NAME, norm
 
 if TYPE_CHECKING:
     from .wilderness import Wilderness
@@ -189,11 +190,7 @@ class SlayerManager:
             p.slayer_blocked = []
 
         # Resolve npc_name to npc_type
-        matched = None
-        for npc in NPCS:
-            if npc["name"].lower() == npc_name.lower():
-                matched = npc
-                break
+        matched = NPC_BY_NAME.get(norm(npc_name))
         if not matched:
             for npc in NPCS:
                 if npc_name.lower() in npc["name"].lower():
@@ -222,11 +219,9 @@ class SlayerManager:
             return False, "Your block list is empty."
 
         # Resolve npc_name to npc_type
-        matched = None
-        for npc in NPCS:
-            if npc["npc_type"] in p.slayer_blocked and npc["name"].lower() == npc_name.lower():
-                matched = npc
-                break
+        matched = NPC_BY_NAME.get(norm(npc_name))
+        if matched and matched["npc_type"] not in p.slayer_blocked:
+            matched = None
         if not matched:
             for npc in NPCS:
                 if npc["npc_type"] in p.slayer_blocked and npc_name.lower() in npc["name"].lower():
@@ -0,0 +1,285 @@
+# SQLite storage backend (players, GE offers, guild config)
+
+import asyncio
+import json
+import os
+import sqlite3
+from typing import Dict, Any, Optional, List
+
+from .models import (
+    DATA_DIR,
+    PLAYERS_FILE,
+    GUILD_CONFIG_FILE,
+    GE_FILE,
+    JsonStore,
+)
+
+SQLITE_FILE = os.path.join(DATA_DIR, "wilderness.db")
+
+GE_COLUMNS = (
+    "offer_id", "user_id", "offer_type", "item", "price_each", "quantity",
+    "filled", "claimed", "coins_pending", "created_at", "slot",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    user_id INTEGER PRIMARY KEY,
+    data    TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS guild_config (
+    guild_id INTEGER PRIMARY KEY,
+    data     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ge_offers (
+    offer_id      INTEGER PRIMARY KEY,
+    user_id       INTEGER NOT NULL,
+    offer_type    TEXT NOT NULL,
+    item          TEXT NOT NULL,
+    price_each    INTEGER NOT NULL,
+    quantity      INTEGER NOT NULL,
+    filled        INTEGER NOT NULL DEFAULT 0,
+    claimed       INTEGER NOT NULL DEFAULT 0,
+    coins_pending INTEGER NOT NULL DEFAULT 0,
+    created_at    INTEGER NOT NULL DEFAULT 0,
+    slot          INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ge_offers_book ON ge_offers (item, offer_type, price_each, created_at);
+CREATE INDEX IF NOT EXISTS ge_offers_user ON ge_offers (user_id, slot);
+"""
+
+
+class SqliteStore(JsonStore):
+    """Drop-in replacement for JsonStore backed by a WAL-mode SQLite file.
+
+    Bot config stays in config.json (it is edited by hand); players, GE
+    offers and guild config live in indexed tables and are updated per row.
+    """
+
+    def __init__(self, path: str = SQLITE_FILE):
+        super().__init__()
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # FULL: every commit is fsynced, so _persist(durable=True) survives power loss
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(SCHEMA)
+
+    async def _run(self, fn):
+        # One connection shared across threads; the store lock serialises access.
+        async with self._lock:
+            return await asyncio.to_thread(fn)
+
+    def _tx(self, fn):
+        """Run fn(db) inside a single IMMEDIATE transaction."""
+        db = self._db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            out = fn(db)
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+        return out
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ── Guild config ─────────────────────────────────────────────────────
+
+    async def load_guild_configs(self) -> Dict[str, Any]:
+        def _load():
+            rows = self._db.execute("SELECT guild_id, data FROM guild_config").fetchall()
+            return {str(gid): json.loads(data) for gid, data in rows}
+
+        return await self._run(_load)
+
+    async def save_guild_configs(self, data: Dict[str, Any]) -> None:
+        def _save(db):
+            db.execute("DELETE FROM guild_config")
+            db.executemany(
+                "INSERT INTO guild_config (guild_id, data) VALUES (?, ?)",
+                [(int(gid), json.dumps(cfg, ensure_ascii=False)) for gid, cfg in data.items()],
+            )
+
+        await self._run(lambda: self._tx(_save))
+
+    # ── Players ──────────────────────────────────────────────────────────
+
+    async def load_players(self, lazy: bool = False) -> Dict[str, Any]:
+        # Rows are always decoded; lazy is accepted for parity with JsonStore.
+        def _load():
+            rows = self._db.execute("SELECT user_id, data FROM players").fetchall()
+            return {str(uid): json.loads(data) for uid, data in rows}
+
+        return await self._run(_load)
+
+    def has_journal(self) -> bool:
+        # WAL replaces the journal; there is nothing to compact on load.
+        return False
+
+    async def compact(self, barrier=None) -> None:
+        # Rows are updated in place; there is no journal to fold.
+        return
+
+    @staticmethod
+    def _put_players(db, records: Dict[str, Optional[Dict[str, Any]]]):
+        upserts = [
+            (int(uid), json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+            for uid, data in records.items() if data is not None
+        ]
+        deletes = [(int(uid),) for uid, data in records.items() if data is None]
+        if upserts:
+            db.executemany(
+                "INSERT INTO players (user_id, data) VALUES (?, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET data = excluded.data",
+                upserts,
+            )
+        if deletes:
+            db.executemany("DELETE FROM players WHERE user_id = ?", deletes)
+
+    async def append_players(self, records: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Upsert/delete only the changed rows."""
+        if not records:
+            return
+        await self._run(lambda: self._tx(lambda db: self._put_players(db, records)))
+
+    async def save_players(self, players: Dict[str, Any]) -> None:
+        def _write(db):
+            db.execute("DELETE FROM players")
+            db.executemany(
+                "INSERT INTO players (user_id, data) VALUES (?, ?)",
+                [
+                    (int(uid), json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+                    for uid, data in players.items()
+                ],
+            )
+
+        await self._run(lambda: self._tx(_write))
+
+    # ── Grand Exchange ───────────────────────────────────────────────────
+
+    async def load_ge(self) -> Dict[str, Any]:
+        def _load():
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'ge_next_id'").fetchone()
+            rows = self._db.execute(
+                f"SELECT {', '.join(GE_COLUMNS)} FROM ge_offers ORDER BY offer_id"
+            ).fetchall()
+            if row is None and not rows:
+                return {}
+            return {
+                "next_id": int(row[0]) if row else 1,
+                "offers": [dict(zip(GE_COLUMNS, r)) for r in rows],
+            }
+
+        return await self._run(_load)
+
+    async def save_ge(self, data: Dict[str, Any]) -> None:
+        offers: List[Dict[str, Any]] = list(data.get("offers", []))
+        placeholders = ", ".join("?" for _ in GE_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in GE_COLUMNS[1:])
+
+        def _save(db):
+            db.execute(
+                "INSERT INTO meta (key, value) VALUES ('ge_next_id', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (str(int(data.get("next_id", 1))),),
+            )
+            db.executemany(
+                f"INSERT INTO ge_offers ({', '.join(GE_COLUMNS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(offer_id) DO UPDATE SET {updates}",
+                [tuple(o.get(c, 0) for c in GE_COLUMNS) for o in offers],
+            )
+            live = {int(o["offer_id"]) for o in offers}
+            existing = {r[0] for r in db.execute("SELECT offer_id FROM ge_offers")}
+            db.executemany(
+                "DELETE FROM ge_offers WHERE offer_id = ?",
+                [(oid,) for oid in existing - live],
+            )
+
+        await self._run(lambda: self._tx(_save))
+
+    @staticmethod
+    def _apply_ge(db, events: List[Dict[str, Any]]):
+        placeholders = ", ".join("?" for _ in GE_COLUMNS)
+        for ev in events:
+            op = ev.get("ge")
+            oid = int(ev.get("id", 0))
+            if op == "create":
+                o = ev["offer"]
+                db.execute(
+                    f"INSERT OR REPLACE INTO ge_offers ({', '.join(GE_COLUMNS)}) VALUES ({placeholders})",
+                    tuple(o.get(c, 0) for c in GE_COLUMNS),
+                )
+                db.execute(
+                    "INSERT INTO meta (key, value) VALUES ('ge_next_id', ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                    (str(int(ev["next_id"])),),
+                )
+            elif op == "remove":
+                db.execute("DELETE FROM ge_offers WHERE offer_id = ?", (oid,))
+            else:
+                cols = [c for c in ev if c in GE_COLUMNS and c != "offer_id"]
+                if cols:
+                    db.execute(
+                        f"UPDATE ge_offers SET {', '.join(f'{c} = ?' for c in cols)} WHERE offer_id = ?",
+                        tuple(ev[c] for c in cols) + (oid,),
+                    )
+
+    async def append_ge(self, events: List[Dict[str, Any]]) -> None:
+        """Apply GE offer events as row updates in one transaction."""
+        if not events:
+            return
+        await self._run(lambda: self._tx(lambda db: self._apply_ge(db, events)))
+
+    async def commit(
+        self,
+        players: Dict[str, Optional[Dict[str, Any]]],
+        ge_events: List[Dict[str, Any]],
+    ) -> None:
+        """Player rows and GE rows in a single transaction."""
+        if not players and not ge_events:
+            return
+
+        def _write(db):
+            self._put_players(db, players)
+            self._apply_ge(db, ge_events)
+
+        await self._run(lambda: self._tx(_write))
+
+    # ── Migration ────────────────────────────────────────────────────────
+
+    async def migrate_from_json(self, src: Optional[JsonStore] = None) -> bool:
+        """One-shot import of players/guild config/GE offers from the JSON files.
+
+        Runs only once per database; returns True if anything was imported.
+        """
+        def _done() -> bool:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+            return row is not None
+
+        if await self._run(_done):
+            return False
+
+        src = src or JsonStore()
+        found = any(os.path.exists(p) for p in (PLAYERS_FILE, GUILD_CONFIG_FILE, GE_FILE))
+        players = await src.load_players()
+        guilds = await src.load_guild_configs()
+        ge = await src.load_ge()
+
+        await self.save_players(players)
+        await self.save_guild_configs(guilds)
+        if ge:
+            await self.save_ge(ge)
+
+        def _mark(db):
+            db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                (str(len(players)),),
+            )
+
+        await self._run(lambda: self._tx(_mark))
+        return found
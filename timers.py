@@ -0,0 +1,161 @@
+# Deadline scheduler for AFK teleports, ground-item expiry and busy timers
+
+import asyncio
+import heapq
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .combat_manager import AFK_TIMEOUT_SEC
+from .inventory_manager import GROUND_ITEM_TTL
+from .models import PlayerState
+from .runecraft import RC_COOLDOWN_SEC
+
+if TYPE_CHECKING:
+    from .wilderness import Wilderness
+
+log = logging.getLogger(__name__)
+
+# A timer whose callback raised is retried this long after the failure
+RETRY_BACKOFF_SEC = 30
+
+DeadlineFn = Callable[[PlayerState], Optional[float]]
+FireFn = Callable[[int, PlayerState], Awaitable[None]]
+
+
+def _afk_deadline(p: PlayerState) -> Optional[float]:
+    last = int(p.last_action or 0)
+    return last + AFK_TIMEOUT_SEC if p.in_wilderness and last else None
+
+
+def _ground_deadline(p: PlayerState) -> Optional[float]:
+    if not p.ground_items:
+        return None
+    return min(int(entry[2]) for entry in p.ground_items) + GROUND_ITEM_TTL
+
+
+def _gem_deadline(p: PlayerState) -> Optional[float]:
+    start = p.cd.get("gem_cutting")
+    # Rounded up to whole seconds like the elapsed check in _finish_gem_cutting
+    return int(start) + math.ceil(int(p.cd.get("gem_cutting_total", 0)) * 1.2) if start else None
+
+
+def _runecraft_deadline(p: PlayerState) -> Optional[float]:
+    return int(p.cd.get("runecraft", 0)) + RC_COOLDOWN_SEC if p.cd.get("runecraft_rune") else None
+
+
+class TimerManager:
+    """One heap of (deadline, kind, user_id) for players with something expiring.
+
+    track() is called for every changed player (see Wilderness._take_changed)
+    and only pushes when a kind's deadline moves earlier; a deadline that has
+    moved later (e.g. an AFK timer after a new command) is re-checked when it
+    fires and pushed back. Idle players outside the wilderness cost nothing.
+    """
+
+    def __init__(self, cog: "Wilderness"):
+        self.cog = cog
+        self.heap: List[Tuple[float, str, int]] = []
+        self.pending: Dict[Tuple[str, int], float] = {}
+        self.kinds: Dict[str, Tuple[DeadlineFn, FireFn]] = {
+            "afk": (_afk_deadline, self._fire_afk),
+            "ground": (_ground_deadline, self._fire_ground),
+            "gem": (_gem_deadline, self._fire_gem),
+            "runecraft": (_runecraft_deadline, self._fire_runecraft),
+        }
+        self._wake = asyncio.Event()
+
+    def _schedule(self, kind: str, uid: int, when: float):
+        key = (kind, uid)
+        cur = self.pending.get(key)
+        if cur is not None and cur <= when:
+            return
+        self.pending[key] = when
+        wake = not self.heap or when < self.heap[0][0]
+        heapq.heappush(self.heap, (when, kind, uid))
+        if wake:
+            self._wake.set()
+
+    def track(self, uid: int, p: Optional[PlayerState] = None):
+        if p is None:
+            p = self.cog.players.get(uid)
+        if p is None:
+            return
+        for kind, (deadline, _fire) in self.kinds.items():
+            try:
+                when = deadline(p)
+            except Exception:
+                continue
+            if when is not None:
+                self._schedule(kind, uid, when)
+
+    def rebuild(self):
+        self.heap = []
+        self.pending = {}
+        for uid, p in self.cog.players.summaries():
+            self.track(uid, p)
+
+    def _pop_due(self, now: float) -> List[Tuple[str, int]]:
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            when, kind, uid = heapq.heappop(self.heap)
+            # Superseded by an earlier push for the same timer
+            if self.pending.get((kind, uid)) != when:
+                continue
+            del self.pending[(kind, uid)]
+            due.append((kind, uid))
+        return due
+
+    async def run(self):
+        try:
+            while True:
+                self._wake.clear()
+                delay = self.heap[0][0] - time.time() if self.heap else None
+                if delay is None or delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if not self.cog._ready:
+                    await asyncio.sleep(1)
+                    continue
+                fired = False
+                for kind, uid in self._pop_due(time.time()):
+                    deadline, fire = self.kinds[kind]
+                    try:
+                        async with self.cog.lock_mgr.hold(uid):
+                            p = self.cog.players.get(uid)
+                            when = deadline(p) if p is not None else None
+                            if when is None:
+                                continue
+                            if when > time.time():
+                                self._schedule(kind, uid, when)
+                                continue
+                            await fire(uid, p)
+                            fired = True
+                    except Exception:
+                        log.exception("%s timer for %s failed; retrying in %ds", kind, uid, RETRY_BACKOFF_SEC)
+                        self._schedule(kind, uid, time.time() + RETRY_BACKOFF_SEC)
+                if fired:
+                    await self.cog._persist()
+        except asyncio.CancelledError:
+            return
+
+    # ── Expiry callbacks (run under the player's lock) ──
+
+    async def _fire_afk(self, uid: int, p: PlayerState):
+        await self.cog.combat_mgr.afk_teleport(uid, p)
+
+    async def _fire_ground(self, uid: int, p: PlayerState):
+        self.cog._prune_ground_items(p)
+        self.cog._mark_changed(uid)
+
+    async def _fire_gem(self, uid: int, p: PlayerState):
+        if self.cog._finish_gem_cutting(p):
+            self.cog._mark_changed(uid)
+
+    async def _fire_runecraft(self, uid: int, p: PlayerState):
+        p.cd.pop("runecraft_rune", None)
+        self.cog._mark_changed(uid)
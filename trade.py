@@ -101,7 +101,7 @@ class TradeManager:
             await ctx.reply("Pick a real person (not yourself, not a bot).")
             return
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(ctx.author.id, target.id):
             a = self.cog._get_player(ctx.author)
             b = self.cog._get_player(target)
 
@@ -138,7 +138,7 @@ class TradeManager:
             f"{target.mention}, type `!w trade accept` within **30s**."
         )
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if not trade or trade.status != "pending":
                 return
@@ -150,12 +150,12 @@ class TradeManager:
         if ch is None:
             return
 
-        async with self.cog._mem_lock:
-            key = self.trades_by_user.get(ctx.author.id)
-            if not key:
-                await ctx.reply("You have no pending trade to accept.")
-                return
+        key = self.trades_by_user.get(ctx.author.id)
+        if not key:
+            await ctx.reply("You have no pending trade to accept.")
+            return
 
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if not trade or trade.status != "pending":
                 await ctx.reply("You have no pending trade to accept.")
@@ -181,7 +181,7 @@ class TradeManager:
 
         trade_msg = await ctx.reply(embed=emb, view=view)
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if trade and trade.status == "active":
                 trade.trade_message_id = trade_msg.id
@@ -193,7 +193,7 @@ class TradeManager:
         await self._mutate_offer(ctx, qty, itemname, mode="remove")
 
     async def cancel_trade_by_command(self, ctx) -> None:
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(ctx.author.id):
             key = self.trades_by_user.get(ctx.author.id)
         if not key:
             await ctx.reply("You are not in a trade.")
@@ -201,7 +201,7 @@ class TradeManager:
         await self.cancel_trade(key, reason="❌ Trade cancelled.")
 
     async def on_confirm_pressed(self, interaction: discord.Interaction, trade_key: FrozenSet[int]):
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*trade_key):
             trade = self.trades_by_pair.get(trade_key)
             if not trade or trade.status != "active":
                 await self._safe_ephemeral(interaction, "This trade is no longer active.")
@@ -226,7 +226,7 @@ class TradeManager:
                     return
 
                 trade.status = "done"
-                await self.cog._persist()
+                await self.cog._persist(trade.a_id, trade.b_id, durable=True)
 
                 done_emb = await self._render_trade_embed(interaction.guild, trade, footer_override="✅ Trade completed!")
                 await self._safe_edit(interaction, embed=done_emb, view=None)
@@ -264,7 +264,7 @@ class TradeManager:
         except asyncio.CancelledError:
             return
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if not trade or trade.status != "pending":
                 return
@@ -275,7 +275,7 @@ class TradeManager:
         except Exception:
             pass
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             self._cleanup_trade_locked(key)
 
     async def _edit_request_message(self, trade: TradeState, *, content: str):
@@ -291,7 +291,7 @@ class TradeManager:
             pass
 
     async def cancel_trade(self, key: FrozenSet[int], *, reason: str):
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if not trade or trade.status not in ("pending", "active"):
                 self._cleanup_trade_locked(key)
@@ -312,7 +312,7 @@ class TradeManager:
                 except Exception:
                     pass
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             self._cleanup_trade_locked(key)
 
     async def _mutate_offer(self, ctx, qty: int, itemname: str, *, mode: str):
@@ -324,11 +324,12 @@ class TradeManager:
         if ch is None:
             return
 
-        async with self.cog._mem_lock:
-            key = self.trades_by_user.get(ctx.author.id)
-            if not key:
-                await ctx.reply("You are not in an active trade.")
-                return
+        key = self.trades_by_user.get(ctx.author.id)
+        if not key:
+            await ctx.reply("You are not in an active trade.")
+            return
+
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if not trade or trade.status != "active":
                 await ctx.reply("You are not in an active trade.")
@@ -339,7 +340,7 @@ class TradeManager:
 
             is_coins, canonical_item = self._resolve_trade_asset(ctx.author, itemname)
             if not is_coins and not canonical_item:
-                await ctx.reply("Unknown item. Try `!w inspect <itemname>` to check names/aliases.")
+                await ctx.reply("Unknown item." + (self.cog._did_you_mean(itemname) or " Try `!w inspect <itemname>` to check names/aliases."))
                 return
 
             if not is_coins and canonical_item in UNTRADEABLE:
@@ -399,7 +400,7 @@ class TradeManager:
         await self._update_trade_message(key)
 
     async def _update_trade_message(self, key: FrozenSet[int], *, footer_override: Optional[str] = None):
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if not trade or trade.status != "active":
                 return
@@ -417,7 +418,7 @@ class TradeManager:
         except Exception:
             return
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(*key):
             trade = self.trades_by_pair.get(key)
             if not trade or trade.status != "active":
                 return
@@ -446,11 +447,11 @@ class TradeManager:
 
         p = self.cog._get_player(user)
 
-        inv_key = self.cog._resolve_from_keys_case_insensitive(itemname, p.inventory.keys())
+        inv_key = self.cog._resolve_from_keys_case_insensitive(itemname, p.inventory)
         if inv_key:
             return False, inv_key
 
-        bank_key = self.cog._resolve_from_keys_case_insensitive(itemname, p.bank.keys())
+        bank_key = self.cog._resolve_from_keys_case_insensitive(itemname, p.bank)
         if bank_key:
             return False, bank_key
 
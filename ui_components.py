@@ -1,6 +1,6 @@
 # UI views, buttons, dropdowns for the wilderness game
 
-from typing import TYPE_CHECKING, Optional, List, Tuple, Dict
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict, Union, Callable
 import discord
 
 from .models import DuelState
@@ -40,7 +40,7 @@ class GroundPickupButton(discord.ui.Button):
             await interaction.response.send_message("Only the fighter can pick this up.", ephemeral=True)
             return
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(interaction.user.id):
             p = self.cog._get_player(interaction.user)
 
             # Invalidate if they teleported/died since the drop
@@ -95,7 +95,7 @@ class FightLogView(discord.ui.View):
         self,
         *,
         author_id: int,
-        pages: List[str],
+        pages: List[Union[str, Callable[[], str]]],
         title: str = "Fight Log",
         cog: Optional["Wilderness"] = None,
         ground_drops: Optional[List[Tuple[str, int, int]]] = None,
@@ -130,11 +130,18 @@ class FightLogView(discord.ui.View):
         self.next_btn.disabled = (self.page >= last)
         self.last_btn.disabled = (self.page >= last)
 
+    def _page_text(self, i: int) -> str:
+        """Pages may be lazy renderers (FightLog.pages); render once on first view."""
+        page = self.pages[i]
+        if callable(page):
+            page = self.pages[i] = page()
+        return page
+
     def _render_embed(self) -> discord.Embed:
         total = max(1, len(self.pages))
         emb = discord.Embed(
             title=f"📜 {self.title} — Page {self.page + 1}/{total}",
-            description=self.pages[self.page],
+            description=self._page_text(self.page),
             color=self.embed_color,
         )
         if self.npc_image:
@@ -572,7 +579,7 @@ class GroundPickupViewButton(discord.ui.Button):
             await interaction.response.send_message("Only the owner can pick this up.", ephemeral=True)
             return
 
-        async with self.cog._mem_lock:
+        async with self.cog.lock_mgr.hold(interaction.user.id):
             p = self.cog._get_player(interaction.user)
 
             # Check item still exists on ground
@@ -8,9 +8,10 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
+import logging
 import random
 import time
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Iterable, Optional, Tuple, List, Set
 import re
 
 from .items import (
@@ -34,6 +35,7 @@ from .npcs import NPCS
 from .config_default import DEFAULT_CONFIG
 from .trade import TradeManager
 from .pets import get_all_pets, get_pet_sources, resolve_pet
+from .name_index import CUT_TO_UNCUT, UNCUT_GEMS
 
 from .models import (
     PlayerState,
@@ -69,6 +71,12 @@ from .preset import PresetManager
 from .slayer import SlayerManager, SLAYER_SHOP, SLAYER_BLOCK_COST, MAX_SLAYER_BLOCKS
 from .npcs import NPC_SLAYER
 from .grand_exchange import GEManager, GEOpenView
+from .leaderboard import LeaderboardManager
+from .timers import TimerManager
+from .player_repository import PlayerRepository
+from .archive import ArchiveManager
+from .sqlite_store import SqliteStore
+from .locks import PlayerLockManager
 
 ALLOWED_CHANNEL_IDS = {1465451116803391529, 1472610522313523323, 1472942650381570171, 1472986472700448768, 1473103361862664338}
 TRADE_ONLY_CHANNEL_IDS = {1472986668695814277}
@@ -80,19 +88,26 @@ INFO_CHANNEL_CMDS = {"w stats", "w examine", "w inspect", "w insp", "w npcs", "w
 
 REVENANT_TYPES = {"revenant goblin", "revenant knight", "revenant demon", "revenant necro", "revenant archon", "revenant imp", "revenant pyromancer"}
 
+log = logging.getLogger(__name__)
+
 class Wilderness(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.store = JsonStore()
         self.config: Dict[str, Any] = DEFAULT_CONFIG.copy()
-        self.players: Dict[int, PlayerState] = {}
+        self.players = PlayerRepository(self)
+        self._changed_uids: Set[int] = set()
+        self._dirty_uids: Set[int] = set()
+        self._flush_wake = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
         self._ready = False
-        self._mem_lock = asyncio.Lock()
+        self.lock_mgr = PlayerLockManager()
 
         self.duels_by_pair: Dict[frozenset, DuelState] = {}
         self.duels_by_channel: Dict[int, DuelState] = {}
 
-        self._afk_task: Optional[asyncio.Task] = None
+        self._timer_task: Optional[asyncio.Task] = None
+        self._archive_task: Optional[asyncio.Task] = None
 
         self.guild_configs: Dict[int, Dict] = {}
         self.ALLOWED_CHANNEL_IDS = ALLOWED_CHANNEL_IDS
@@ -109,6 +124,9 @@ class Wilderness(commands.Cog):
         self.preset_mgr = PresetManager(self)
         self.slayer_mgr = SlayerManager(self)
         self.ge_mgr = GEManager(self)
+        self.hs_mgr = LeaderboardManager(self)
+        self.timer_mgr = TimerManager(self)
+        self.archive_mgr = ArchiveManager(self)
 
 
     # ── Per-guild channel helpers ────────────────────────────────────────
@@ -159,6 +177,12 @@ class Wilderness(commands.Cog):
     def _resolve_item(self, query: str) -> Optional[str]:
         return self.player_mgr.resolve_item(query)
 
+    def _search_items(self, query: str, limit: Optional[int] = 10, within=None) -> List[str]:
+        return self.player_mgr.search_items(query, limit=limit, within=within)
+
+    def _did_you_mean(self, query: str) -> str:
+        return self.player_mgr.did_you_mean(query)
+
     def _resolve_from_keys_case_insensitive(self, query: str, keys) -> Optional[str]:
         return self.player_mgr.resolve_from_keys_case_insensitive(query, keys)
 
@@ -172,26 +196,66 @@ class Wilderness(commands.Cog):
     def _hp_line_pvp(self, a_name, a_hp, b_name, b_hp): return self.combat_mgr.hp_line_pvp(a_name, a_hp, b_name, b_hp)
 
     async def cog_load(self):
+        started = time.perf_counter()
         self.config = await self.store.load_config()
+        if self.config.get("storage_backend") == "sqlite" and not isinstance(self.store, SqliteStore):
+            self.store = SqliteStore()
+            await self.store.migrate_from_json()
+        if isinstance(self.store, JsonStore):
+            self.store.binary_snapshot = bool(self.config.get("binary_player_snapshot", True))
         raw_guild = await self.store.load_guild_configs()
         self.guild_configs = {int(k): v for k, v in raw_guild.items()}
         self._refresh_allowed_channels()
-        raw_players = await self.store.load_players()
-        self.players = {}
-        for user_id_str, pdata in raw_players.items():
-            try:
-                self.players[int(user_id_str)] = PlayerState.from_dict(pdata)
-            except Exception:
-                continue
+        # Players stay stored records until they act (see PlayerRepository)
+        self.players.load(await self.store.load_players(lazy=True))
+        await self.archive_mgr.load()
+        await self.archive_mgr.archive_inactive()
         self.player_mgr.build_item_alias_map()
+        self.loot_mgr.compile_tables()
+        self.hs_mgr.rebuild()
+        self.timer_mgr.rebuild()
         await self.ge_mgr.load()
+        self.store.compact_every = int(self.config.get("journal_compact_records", 500))
+        self.store.set_snapshot_sources(
+            self.players.snapshot,
+            self.ge_mgr.snapshot,
+        )
+        if self.store.has_journal():
+            await self.store.compact(self.lock_mgr.barrier)
         self._ready = True
-        if self._afk_task is None or self._afk_task.done():
-            self._afk_task = asyncio.create_task(self.combat_mgr.afk_sweeper())
+        log.info(
+            "Wilderness ready in %.2fs: %d players (%d archived)",
+            time.perf_counter() - started, len(self.players), len(self.players.archived),
+        )
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self.timer_mgr.run())
+        if self._archive_task is None or self._archive_task.done():
+            self._archive_task = asyncio.create_task(self.archive_mgr.run())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._persist_flusher())
 
     async def cog_unload(self):
-        if self._afk_task and not self._afk_task.done():
-            self._afk_task.cancel()
+        if self._timer_task and not self._timer_task.done():
+            self._timer_task.cancel()
+        if self._archive_task and not self._archive_task.done():
+            self._archive_task.cancel()
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        try:
+            if self._ready:
+                await self._flush_players()
+        finally:
+            if isinstance(self.store, SqliteStore):
+                self.store.close()
+                # A later cog_load opens a fresh connection
+                self.store = JsonStore()
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.hs_mgr.forget(member.id, member.guild.id)
+        # Only a loaded player's guild_ids changed; marking a stored one would load it
+        if member.id in self.players.hot:
+            self._mark_changed(member.id)
 
     async def _ensure_ready(self, ctx: commands.Context) -> bool:
         ch = getattr(ctx, "channel", None)
@@ -247,15 +311,10 @@ class Wilderness(commands.Cog):
                     elapsed = _now() - int(gc_start)
                     needed = total * 1.2
                     if elapsed >= needed:
-                        # Auto-complete: add cut gems to bank, clear state
-                        result_gem = p.cd.get("gem_cutting_result", "")
-                        if result_gem and total > 0:
-                            self._add_item(p.bank, result_gem, total)
-                        p.cd.pop("gem_cutting", None)
-                        p.cd.pop("gem_cutting_gem", None)
-                        p.cd.pop("gem_cutting_total", None)
-                        p.cd.pop("gem_cutting_result", None)
+                        # Normally completed by the gem timer already
+                        self._finish_gem_cutting(p)
                         self._touch(p)
+                        self._mark_changed(uid)
                         await self._persist()
                     else:
                         cut_so_far = int(elapsed / 1.2)
@@ -270,9 +329,102 @@ class Wilderness(commands.Cog):
 
         return True
 
-    async def _persist(self):
-        raw = {str(uid): p.to_dict() for uid, p in self.players.items()}
-        await self.store.save_players(raw)
+    async def _persist(self, *uids: int, durable: bool = False):
+        """Mark the players touched by this command dirty for the background flusher.
+
+        durable=True is a barrier for money-moving paths (trades, PvP loot):
+        uids, the players whose locks the caller holds, are written before this returns.
+        """
+        if durable:
+            await self._commit(uids)
+            return
+        self._take_changed()
+        if len(self._dirty_uids) >= int(self.config.get("persist_flush_max_dirty", 50)):
+            self._flush_wake.set()
+
+    async def _commit(self, uids: Iterable[int], ge_events: Optional[List[Dict[str, Any]]] = None):
+        """Durably write the held players in uids plus any GE events as one atomic batch.
+
+        Other dirty players stay queued for the flusher, which snapshots them
+        behind the barrier; their commands may still be half-way through.
+        """
+        held = {int(uid) for uid in uids}
+        self._take_changed(held)
+        records = self._take_dirty(held)
+        try:
+            await self.store.commit(records, ge_events or [])
+        except Exception:
+            self._dirty_uids.update(int(uid) for uid in records)
+            raise
+
+    def _mark_changed(self, uid: int):
+        self._changed_uids.add(int(uid))
+
+    def _take_changed(self, uids: Optional[Set[int]] = None):
+        """Move changed players (all, or just uids) to the dirty set, re-rank and re-time them."""
+        if uids is None:
+            changed, self._changed_uids = self._changed_uids, set()
+        else:
+            changed = self._changed_uids & uids
+            self._changed_uids -= changed
+        self.hs_mgr.update(changed)
+        for uid in changed:
+            self.timer_mgr.track(uid)
+        self._dirty_uids |= changed
+
+    def _take_dirty(self, uids: Optional[Set[int]] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        if uids is None:
+            uids, self._dirty_uids = self._dirty_uids, set()
+        else:
+            uids = self._dirty_uids & uids
+            self._dirty_uids -= uids
+        records = {}
+        for uid in uids:
+            p = self.players.get(uid)
+            records[str(uid)] = p.to_dict() if p is not None else None
+        return records
+
+    async def _write_players(self, records: Dict[str, Optional[Dict[str, Any]]]):
+        # Records must reach append_players without an await in between so the
+        # store lock keeps journal order equal to snapshot order.
+        await self.store.append_players(records)
+
+    async def _flush_players(self):
+        """Write every dirty player now (snapshot taken behind the lock barrier)."""
+        async with self.lock_mgr.barrier():
+            self._take_changed()
+            records = self._take_dirty()
+        try:
+            await self._write_players(records)
+        except Exception:
+            # Requeue so the next flush retries them
+            self._dirty_uids.update(int(uid) for uid in records)
+            raise
+        # Restored players are in the main store now; drop them from the archive file
+        if self.players.archive_dirty:
+            await self.archive_mgr.save()
+        # Compacted here rather than inside an append: a durable commit runs
+        # under hold(), and the snapshot needs the barrier
+        if self.store.compaction_due():
+            await self.store.compact(self.lock_mgr.barrier)
+
+    async def _persist_flusher(self):
+        try:
+            while True:
+                interval = float(self.config.get("persist_flush_interval_sec", 5))
+                try:
+                    await asyncio.wait_for(self._flush_wake.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_wake.clear()
+                if not self._dirty_uids and not self.players.archive_dirty and not self.store.compaction_due():
+                    continue
+                try:
+                    await self._flush_players()
+                except Exception:
+                    continue
+        except asyncio.CancelledError:
+            return
 
     def _get_player(self, user: discord.abc.User) -> PlayerState:
         return self.player_mgr.get_player(user)
@@ -351,6 +503,7 @@ class Wilderness(commands.Cog):
     def _pvp_transfer_all_items(self, winner, loser): return self.combat_mgr.pvp_transfer_all_items(winner, loser)
     def _food_summary_lines(self, eaten, inv): return self.combat_mgr.food_summary_lines(eaten, inv)
     def _format_items_short(self, items, max_lines=12): return self.combat_mgr.format_items_short(items, max_lines)
+    def _ground_drop_lines(self, ground_drops): return self.combat_mgr.ground_drop_lines(ground_drops)
     def _fmt_entry(self, e): return self.combat_mgr.fmt_entry(e)
     def _npc_info_embed(self, npc_name, guild): return self.combat_mgr.npc_info_embed(npc_name, guild)
 
@@ -426,8 +579,8 @@ class Wilderness(commands.Cog):
 
         return emb
 
-    async def _afk_sweeper(self):
-        await self.combat_mgr.afk_sweeper()
+    async def _afk_teleport(self, uid: int, p: PlayerState):
+        await self.combat_mgr.afk_teleport(uid, p)
 
     async def _duel_action(self, interaction: discord.Interaction, duel: DuelState, action: str):
         await self.combat_mgr.duel_action(interaction, duel, action)
@@ -436,26 +589,22 @@ class Wilderness(commands.Cog):
     def _simulate_pvm_fight_and_loot(self, p, chosen_npc, *, header_lines=None): return self.combat_mgr.simulate_pvm_fight_and_loot(p, chosen_npc, header_lines=header_lines)
 
     def _highscores_embed(self, category: str, guild: Optional[discord.Guild]) -> discord.Embed:
+        gid = guild.id if guild else None  # server-local board inside a guild
+        if guild is not None:
+            self.hs_mgr.backfill(guild)
         CATS = {
-            "kills": ("⚔️ Highscores — Kills", lambda p: int(p.kills), lambda uid, v: f"{v:,} kills"),
-            "deaths": ("💀 Highscores — Deaths", lambda p: int(p.deaths), lambda uid, v: f"{v:,} deaths"),
-            "coins": ("💰 Highscores — Wealth", lambda p: int(p.coins) + int(p.bank_coins), lambda uid, v: f"{v:,} coins"),
-            "slayer": ("🗡️ Highscores — Slayer", lambda p: int(p.slayer_xp or 0),
-                       lambda uid, v: f"Level {self.slayer_mgr.level_for_xp(v)} ({v:,} XP)"),
-            "unique": ("✨ Highscores — Unique Drops", lambda p: int(p.unique_drops), lambda uid, v: f"{v:,} uniques"),
-            "pets": ("🐾 Highscores — Pets", lambda p: len(getattr(p, "pets", []) or []), lambda uid, v: f"{v} pets"),
-            "tasks": ("🗡️ Highscores — Slayer Tasks", lambda p: int(p.slayer_tasks_done or 0), lambda uid, v: f"{v:,} tasks"),
+            "kills": ("⚔️ Highscores — Kills", lambda uid, v: f"{v:,} kills"),
+            "deaths": ("💀 Highscores — Deaths", lambda uid, v: f"{v:,} deaths"),
+            "coins": ("💰 Highscores — Wealth", lambda uid, v: f"{v:,} coins"),
+            "slayer": ("🗡️ Highscores — Slayer", lambda uid, v: f"Level {self.slayer_mgr.level_for_xp(v)} ({v:,} XP)"),
+            "unique": ("✨ Highscores — Unique Drops", lambda uid, v: f"{v:,} uniques"),
+            "pets": ("🐾 Highscores — Pets", lambda uid, v: f"{v} pets"),
+            "tasks": ("🗡️ Highscores — Slayer Tasks", lambda uid, v: f"{v:,} tasks"),
         }
 
         if category == "overall":
             # Rank by total actions, show top 5 with all stats
-            scored = []
-            for uid, p in self.players.items():
-                total = int(p.kills) + int(p.deaths) + int(p.escapes)
-                if total > 0:
-                    scored.append((uid, total, p))
-            scored.sort(key=lambda x: x[1], reverse=True)
-            top = scored[:5]
+            top = [(uid, total, self.players.summary(uid)) for uid, total in self.hs_mgr.top("overall", 5, gid) if uid in self.players]
 
             emb = discord.Embed(title="🏆 Highscores — Overall", color=0xFFD700)
             if not top:
@@ -479,15 +628,10 @@ class Wilderness(commands.Cog):
                 emb.add_field(name=f"{medal} {name}", value=lines, inline=False)
             return emb
 
-        title, score_fn, fmt_fn = CATS.get(category, CATS["kills"])
-
-        scored = []
-        for uid, p in self.players.items():
-            score = score_fn(p)
-            if score > 0:
-                scored.append((uid, score))
-        scored.sort(key=lambda x: x[1], reverse=True)
-        top = scored[:50]
+        if category not in CATS:
+            category = "kills"
+        title, fmt_fn = CATS[category]
+        top = self.hs_mgr.top(category, 50, gid)
 
         emb = discord.Embed(title=title, color=0xFFD700)
         if not top:
@@ -595,6 +739,7 @@ class Wilderness(commands.Cog):
         emb.add_field(name="Combat & Exploring", value=(
             "`!w venture <level>` — Enter the Wilderness\n"
             "`!w fight <npc>` — Fight an NPC\n"
+            "`!w fight x<N> [npc]` — Fight up to N NPCs in a row\n"
             "`!w attack @player` — Attack another player\n"
             "`!w tele` — Teleport out\n"
             "`!w eat [qty] [food]` — Eat food to heal\n"
@@ -782,7 +927,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             # If no item provided -> show list
@@ -802,7 +947,7 @@ class Wilderness(commands.Cog):
                 canonical = food_key
 
             if not canonical:
-                await ctx.reply("Unknown item. Try `!w inspect <itemname>` to check names/aliases.")
+                await ctx.reply("Unknown item." + (self._did_you_mean(itemname) or " Try `!w inspect <itemname>` to check names/aliases."))
                 return
 
             # Prevent duplicates using normalized compare
@@ -823,7 +968,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             bl = getattr(p, "blacklist", None) or []
             if not bl:
@@ -847,7 +992,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             p.blacklist = []
             await self._persist()
@@ -860,7 +1005,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             if not args:
@@ -919,7 +1064,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             if hp is None:
@@ -949,7 +1094,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             query = self._norm(potion_name)
@@ -995,6 +1140,7 @@ class Wilderness(commands.Cog):
                 "str": potion_data.get("str", 0),
                 "remaining_hits": potion_data.get("hits", 0)
             }
+            p.gear_changed()
 
             # Downgrade dose
             uses -= 1
@@ -1070,7 +1216,7 @@ class Wilderness(commands.Cog):
         food_key = None
         if auto_best:
             # Find best food in inventory (highest heal)
-            async with self._mem_lock:
+            async with self.lock_mgr.hold(ctx.author.id):
                 p = self._get_player(ctx.author)
                 best_heal = 0
                 for item_name, item_qty in p.inventory.items():
@@ -1095,7 +1241,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("That food has no heal value.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             have = int(p.inventory.get(food_key, 0))
@@ -1166,13 +1312,13 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w drop <item>` or `!w drop <qty> <item>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
-            inv_key = self._resolve_from_keys_case_insensitive(item_query, p.inventory.keys())
+            inv_key = self._resolve_from_keys_case_insensitive(item_query, p.inventory)
             if not inv_key:
                 maybe = self._resolve_item(item_query) or self._resolve_food(item_query)
                 if maybe:
-                    inv_key = self._resolve_from_keys_case_insensitive(maybe, p.inventory.keys())
+                    inv_key = self._resolve_from_keys_case_insensitive(maybe, p.inventory)
 
             if not inv_key:
                 await ctx.reply("That item isn’t in your inventory.")
@@ -1217,7 +1363,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ground = self._active_ground_items(p)
             await self._persist()
@@ -1262,7 +1408,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w ground pickup <item>` or `!w ground pickup <qty> <item>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             ground = self._active_ground_items(p)
@@ -1271,11 +1417,11 @@ class Wilderness(commands.Cog):
                 return
 
             # Resolve item name from ground keys
-            inv_key = self._resolve_from_keys_case_insensitive(item_query, ground.keys())
+            inv_key = self._resolve_from_keys_case_insensitive(item_query, ground)
             if not inv_key:
                 maybe = self._resolve_item(item_query) or self._resolve_food(item_query)
                 if maybe:
-                    inv_key = self._resolve_from_keys_case_insensitive(maybe, ground.keys())
+                    inv_key = self._resolve_from_keys_case_insensitive(maybe, ground)
 
             if not inv_key:
                 await ctx.reply("That item isn't on the ground.")
@@ -1446,7 +1592,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("That player has not entered the Wilderness yet.")
             return
 
-        p = self.players[member.id]
+        p = self.players.peek(member.id)
         gear = getattr(p, "equipment", None) or {}
 
         if not gear:
@@ -1575,8 +1721,9 @@ class Wilderness(commands.Cog):
     async def reset(self, ctx: commands.Context):
         if not await self._ensure_ready(ctx):
             return
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             self.players.pop(ctx.author.id, None)
+            self._mark_changed(ctx.author.id)
             await self._persist()
         await ctx.reply("✅ Your Wilderness profile has been **reset**. Use !w start to begin again.")
 
@@ -1584,7 +1731,7 @@ class Wilderness(commands.Cog):
     async def start(self, ctx: commands.Context):
         if not await self._ensure_ready(ctx):
             return
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.started:
                 await ctx.reply("You’ve already started. Use !w reset if you want to wipe and start over.")
@@ -1596,6 +1743,7 @@ class Wilderness(commands.Cog):
             p.bank.clear()
             p.risk.clear()
             p.equipment.clear()
+            p.gear_changed()
             p.uniques.clear()
             p.pets.clear()
             p.pet_counts.clear()
@@ -1679,17 +1827,17 @@ class Wilderness(commands.Cog):
             await ctx.reply("That item isn’t equippable (or no slot defined for it).")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
-                inv_key = self._resolve_from_keys_case_insensitive(item_key, p.inventory.keys())
+                inv_key = self._resolve_from_keys_case_insensitive(item_key, p.inventory)
                 has_in_inv = (inv_key is not None and p.inventory.get(inv_key, 0) > 0)
                 if not has_in_inv:
                     await ctx.reply(f"You must have **{item_key}** in your inventory to equip it in the Wilderness.")
                     return
             else:
-                inv_key = self._resolve_from_keys_case_insensitive(item_key, p.inventory.keys())
-                bank_key = self._resolve_from_keys_case_insensitive(item_key, p.bank.keys())
+                inv_key = self._resolve_from_keys_case_insensitive(item_key, p.inventory)
+                bank_key = self._resolve_from_keys_case_insensitive(item_key, p.bank)
                 has_in_inv = (inv_key is not None and p.inventory.get(inv_key, 0) > 0)
                 has_in_bank = (bank_key is not None and p.bank.get(bank_key, 0) > 0)
                 if not has_in_inv and not has_in_bank:
@@ -1776,6 +1924,7 @@ class Wilderness(commands.Cog):
                         else:
                             self._remove_item(p.bank, bank_key, 1)
                     p.equipment["ammo"] = item_key
+                    p.gear_changed()
                     p.ammo_qty = 0
                     await self._persist()
                     await ctx.reply(f"✅ Equipped **{item_key}** in slot **ammo**.")
@@ -1803,6 +1952,7 @@ class Wilderness(commands.Cog):
                     else:
                         p.ammo_qty = qty
                     p.equipment["ammo2"] = item_key
+                    p.gear_changed()
                     await self._persist()
                     await ctx.reply(f"✅ Equipped **{item_key} x{qty}** in **{old_ammo}** (total: x{p.ammo_qty}).")
                     return
@@ -1822,6 +1972,7 @@ class Wilderness(commands.Cog):
                     if old_ammo:
                         self._add_item(p.inventory, old_ammo, p.ammo_qty)
                     p.equipment["ammo"] = item_key
+                    p.gear_changed()
                     p.ammo_qty = qty
                     await self._persist()
                     await ctx.reply(f"✅ Equipped **{item_key} x{qty}** in slot **ammo**.")
@@ -1837,6 +1988,7 @@ class Wilderness(commands.Cog):
                     self._remove_item(p.bank, bank_key, 1)
 
             p.equipment[slot] = item_key
+            p.gear_changed()
             await self._persist()
 
         msg = f"✅ Equipped **{item_key}** in slot **{slot}**."
@@ -1853,7 +2005,7 @@ class Wilderness(commands.Cog):
         slot = slot.strip().lower()
 
         if slot == "all":
-            async with self._mem_lock:
+            async with self.lock_mgr.hold(ctx.author.id):
                 p = self._get_player(ctx.author)
                 if not p.equipment:
                     await ctx.reply("You have nothing equipped.")
@@ -1887,6 +2039,7 @@ class Wilderness(commands.Cog):
                         self._add_item(p.inventory, item, 1)
                         removed.append(f"**{item}** ({s})")
                 p.equipment.clear()
+                p.gear_changed()
                 await self._persist()
 
             await ctx.reply(f"✅ Unequipped all: {', '.join(removed)}.")
@@ -1896,7 +2049,7 @@ class Wilderness(commands.Cog):
             await ctx.reply(f"Unknown slot. Slots: {', '.join(sorted(EQUIP_SLOT_SET))}, all")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             item = p.equipment.get(slot)
             if not item:
@@ -1918,12 +2071,14 @@ class Wilderness(commands.Cog):
                         msg_parts.append(f"**{ammo2} x{p.ammo_qty}**")
                     p.equipment.pop("ammo", None)
                     p.equipment.pop("ammo2", None)
+                    p.gear_changed()
                     p.ammo_qty = 0
                     await self._persist()
                     await ctx.reply(f"✅ Unequipped {' + '.join(msg_parts)} from **ammo**.")
                 else:
                     self._add_item(p.inventory, item, p.ammo_qty)
                     p.equipment.pop(slot, None)
+                    p.gear_changed()
                     qty_returned = p.ammo_qty
                     p.ammo_qty = 0
                     await self._persist()
@@ -1932,6 +2087,7 @@ class Wilderness(commands.Cog):
 
             self._add_item(p.inventory, item, 1)
             p.equipment.pop(slot, None)
+            p.gear_changed()
             await self._persist()
 
         await ctx.reply(f"✅ Unequipped **{item}** from **{slot}**.")
@@ -1957,7 +2113,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             # Failsafe: convert any noted items in the bank to unnoted
             changed = False
@@ -1999,7 +2155,7 @@ class Wilderness(commands.Cog):
             else:
                 specific_item = raw
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             ok, left = self._cd_ready(p, "bank", int(self.config["bank_cooldown_sec"]))
@@ -2018,18 +2174,18 @@ class Wilderness(commands.Cog):
 
             if specific_item:
                 # Deposit a specific item (overrides locks, deposits all of it)
-                inv_key = self._resolve_from_keys_case_insensitive(specific_item, p.inventory.keys())
+                inv_key = self._resolve_from_keys_case_insensitive(specific_item, p.inventory)
                 if not inv_key:
                     maybe = self._resolve_item(specific_item)
                     if maybe:
-                        inv_key = self._resolve_from_keys_case_insensitive(maybe, p.inventory.keys())
+                        inv_key = self._resolve_from_keys_case_insensitive(maybe, p.inventory)
                     # Also try noted variant
                     if not inv_key and maybe:
                         noted_name = self._note(maybe)
-                        inv_key = self._resolve_from_keys_case_insensitive(noted_name, p.inventory.keys())
+                        inv_key = self._resolve_from_keys_case_insensitive(noted_name, p.inventory)
                     if not inv_key:
                         noted_query = self._note(specific_item)
-                        inv_key = self._resolve_from_keys_case_insensitive(noted_query, p.inventory.keys())
+                        inv_key = self._resolve_from_keys_case_insensitive(noted_query, p.inventory)
 
                 if not inv_key or int(p.inventory.get(inv_key, 0)) <= 0:
                     await ctx.reply("That item isn't in your inventory.")
@@ -2082,6 +2238,7 @@ class Wilderness(commands.Cog):
                                 self._add_item(p.bank, item, 1)
                             banked_equip[slot] = item
                     p.equipment.clear()
+                    p.gear_changed()
 
                 # Bank coins
                 if p.coins > 0:
@@ -2147,18 +2304,18 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w withdraw <item>` or `!w withdraw <qty> <item> [noted]`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
                 await ctx.reply("Withdraw items out of the Wilderness. !w tele first.")
                 return
             
             # Find item in bank (case-insensitive), supporting aliases
-            bank_key = self._resolve_from_keys_case_insensitive(item_query, p.bank.keys())
+            bank_key = self._resolve_from_keys_case_insensitive(item_query, p.bank)
             if not bank_key:
                 maybe_canonical = self._resolve_item(item_query)
                 if maybe_canonical:
-                    bank_key = self._resolve_from_keys_case_insensitive(maybe_canonical, p.bank.keys())
+                    bank_key = self._resolve_from_keys_case_insensitive(maybe_canonical, p.bank)
 
             if not bank_key:
                 await ctx.reply("That item isn’t in your bank.")
@@ -2245,12 +2402,12 @@ class Wilderness(commands.Cog):
             await ctx.reply("Player not found.")
             return
 
-        if member.id not in self.players:
+        # Looking at someone else must not pull them into the player cache
+        p = self.players.get(member.id) if member.id == ctx.author.id else self.players.peek(member.id)
+        if p is None:
             await ctx.reply("That player has not entered the Wilderness yet.")
             return
 
-        p = self.players[member.id]
-
         where = f"Wilderness (lvl {p.wildy_level})" if p.in_wilderness else "Safe"
         total_coins = int(p.coins) + int(p.bank_coins)
 
@@ -2408,7 +2565,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("You’re in a PvP fight — finish it before venturing deeper.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             ok, left = self._cd_ready(p, "venture", int(self.config["venture_cooldown_sec"]))
@@ -2484,20 +2641,205 @@ class Wilderness(commands.Cog):
         )
 
 
+    # ── Fight ──────────────────────────────────────────────────────────
+
+    def _parse_fight_count(self, npcname: Optional[str]) -> Tuple[int, Optional[str]]:
+        """Split a leading `xN` batch count off the fight argument."""
+        if not npcname:
+            return 1, npcname
+        m = re.match(r"^x(\d+)(?:\s+(.*))?$", npcname.strip(), re.IGNORECASE)
+        if not m:
+            return 1, npcname
+        cap = max(1, int(self.config.get("fight_batch_max", 10)))
+        return max(1, min(int(m.group(1)), cap)), (m.group(2) or "").strip() or None
+
+    def _pick_fight_npc(self, p: PlayerState, eligible: List[Dict[str, Any]], forced_npc: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[str]]:
+        """Roll the encounter (75% on a targeted NPC) and its header lines."""
+        header_lines: List[str] = []
+        if not forced_npc:
+            return random.choice(eligible), header_lines
+
+        # Bracelet of Slayer Aggression: 100% if targeting slayer task, costs 20 Chaos rune
+        aggro_brace = p.equipment.get("gloves") == "Bracelet of Slayer Aggression"
+        task = p.slayer_task
+        on_task_target = (
+            aggro_brace and task
+            and task.get("npc_type") == forced_npc["npc_type"]
+            and int(task.get("remaining", 0)) > 0
+            and p.inventory.get("Chaos rune", 0) >= 20
+        )
+        if on_task_target:
+            self._remove_item(p.inventory, "Chaos rune", 20)
+        if on_task_target or (random.random() <= 0.75):
+            header_lines.append(f"🎯 Targeted fight: **{forced_npc['name']}** — **SUCCESS**")
+            return forced_npc, header_lines
+
+        pool = [n for n in eligible if self._norm(n["name"]) != self._norm(forced_npc["name"])]
+        header_lines.append(f"🎯 Targeted fight: **{forced_npc['name']}** — **FAILED**, random encounter instead…")
+        return (random.choice(pool) if pool else random.choice(eligible)), header_lines
+
+    def _apply_pvm_death(self, p: PlayerState):
+        p.deaths += 1
+        p.wildy_run_id = int(p.wildy_run_id) + 1
+        p.ground_items = []
+        p.in_wilderness = False
+        p.skulled = False
+        p.wildy_level = 1
+        p.hp = int(self.config["starting_hp"])
+        self._full_heal(p)
+
+    def _fight_warnings(self, p: PlayerState) -> Tuple[List[str], bool]:
+        """Low HP / low food warnings after a fight, plus whether any food is left."""
+        has_food = any(p.inventory.get(f, 0) > 0 for f in FOOD)
+        total_food = sum(int(v) for f, v in p.inventory.items() if f in FOOD and int(v) > 0)
+        warnings = []
+        hp_warn = getattr(p, "warning_health", 0)
+        food_warn = getattr(p, "warning_food", 0)
+        if hp_warn > 0 and p.hp < hp_warn:
+            warnings.append(f"Your HP is low (**{p.hp}/{self.config['max_hp']}** — below {hp_warn})")
+        elif p.hp < 20:
+            warnings.append(f"Your HP is critically low (**{p.hp}/{self.config['max_hp']}**)")
+        if food_warn > 0 and total_food <= food_warn:
+            warnings.append(f"Food is low (**{total_food}** remaining — at or below {food_warn})")
+        elif not has_food:
+            warnings.append("You have **no food** remaining in your inventory")
+        return warnings, has_food
+
+    def _slayer_task_embed(self, user: discord.abc.User, info: Dict[str, Any]) -> discord.Embed:
+        return discord.Embed(
+            title="✅ Slayer Task Complete!",
+            description=(
+                f"**{user.display_name}** has completed their slayer task!\n\n"
+                f"🗡️ Slayer Level: **{info['level']}**\n"
+                f"⭐ Points earned: **+{info['points']}** (Total: **{info['total_points']}**)\n"
+                f"📋 Tasks completed: **{info['tasks_done']}**\n\n"
+                f"Use `!w slayer task` to get a new assignment!"
+            ),
+            color=0x00FF00,
+        )
+
+    async def _fight_batch(self, ctx: commands.Context, p: PlayerState, count: int,
+                           eligible: List[Dict[str, Any]], forced_npc: Optional[Dict[str, Any]]) -> List:
+        """Up to `count` fights in a row under the caller's lock; one persist, one reply.
+
+        Stops early on death, a completed slayer task, or a low HP / low food warning.
+        Returns the broadcasts to send once the lock is released.
+        """
+        inv_before = dict(p.inventory)
+        inv_end = inv_before
+        xp_before = int(p.slayer_xp or 0)
+        pages: List[Any] = []
+        kills: Dict[str, int] = {}
+        eaten: Dict[str, int] = {}
+        ground: Dict[Tuple[str, int], int] = {}
+        broadcasts: List = []
+        task_info = None
+        death = None
+        stop_reason = ""
+        npc_image = None
+        fought = 0
+
+        for n in range(1, count + 1):
+            chosen, header_lines = self._pick_fight_npc(p, eligible, forced_npc)
+            header_lines.insert(0, f"⚔️ Fight **{n}/{count}**")
+            npc_image = chosen.get("image")
+            won, npc_name, events, lost_items, bank_loss, loot_lines, ground_drops, eaten_food, fight_broadcasts, slayer_task_info = \
+                self._simulate_pvm_fight_and_loot(p, chosen, header_lines=header_lines)
+            fought = n
+            for food, qty in (eaten_food or {}).items():
+                eaten[food] = eaten.get(food, 0) + int(qty)
+            pages.extend(self._build_pages(events, per_page=10))
+
+            if not won:
+                death = (npc_name, lost_items, bank_loss)
+                self._apply_pvm_death(p)
+                ground = {}
+                break
+
+            inv_end = dict(p.inventory)
+            kills[npc_name] = kills.get(npc_name, 0) + 1
+            broadcasts.extend(fight_broadcasts)
+            for item, qty, run_id in ground_drops:
+                ground[(item, run_id)] = ground.get((item, run_id), 0) + int(qty)
+            pages.append(
+                f"✅ **You have killed {npc_name}!**\n"
+                f"End HP: **{p.hp}/{self.config['max_hp']}**\n"
+                + ("\n".join(loot_lines) if loot_lines else "(no loot)")
+            )
+
+            if slayer_task_info:
+                task_info = slayer_task_info
+                stop_reason = "Slayer task complete"
+                break
+            warnings, _has_food = self._fight_warnings(p)
+            if warnings and n < count:
+                stop_reason = warnings[0]
+                break
+
+        self._touch(p)
+        await self._persist()
+
+        gained = {k: int(v) - int(inv_before.get(k, 0)) for k, v in inv_end.items() if int(v) > int(inv_before.get(k, 0))}
+        xp_gained = int(p.slayer_xp or 0) - xp_before
+        summary = [f"⚔️ **Batch fight — {fought}/{count} fights, {sum(kills.values())} kills**"]
+        if kills:
+            summary.extend(f"- {name} x{k}" for name, k in sorted(kills.items(), key=lambda kv: (-kv[1], kv[0])))
+        if stop_reason:
+            summary.append(f"⏹️ Stopped early: {stop_reason}")
+        if death:
+            npc_name, lost_items, bank_loss = death
+            summary.append(f"\n☠️ **You died to {npc_name}.**")
+            summary.append(f"📉 **Lost from inventory:**\n{self._format_items_short(lost_items, max_lines=18)}")
+            summary.append(f"🏦 Lost bank coins: **{bank_loss:,}** (2%)")
+        else:
+            summary.append(f"End HP: **{p.hp}/{self.config['max_hp']}**")
+            summary.append(f"\n📦 **Loot kept:**\n{self._format_items_short(gained, max_lines=18)}")
+        if xp_gained > 0:
+            summary.append(f"🗡️ Slayer XP: **+{xp_gained:,}** (Level {self.slayer_mgr.get_slayer_level(p)})")
+        g_lines = self._ground_drop_lines([(item, qty, run_id) for (item, run_id), qty in ground.items()])
+        if g_lines:
+            summary.append("")
+            summary.extend(g_lines)
+        food_lines = self._food_summary_lines(eaten, p.inventory)
+        if food_lines:
+            summary.append("")
+            summary.extend(food_lines)
+        pages.append("\n".join(summary))
+
+        warnings = self._fight_warnings(p)[0] if not death else []
+        view = FightLogView(
+            author_id=ctx.author.id,
+            pages=pages,
+            title=f"{ctx.author.display_name} — {fought} fight{'s' if fought != 1 else ''}",
+            cog=self,
+            # 4 page buttons + 20 pickups stays under Discord's 25 components
+            ground_drops=[(item, qty, run_id) for (item, run_id), qty in ground.items()][:20],
+            start_on_last=True,
+            npc_image=npc_image,
+            embed_color=0xFF4444 if (warnings or death) else 0x2B2D31,
+        )
+        await ctx.reply(embed=view._render_embed(), view=view)
+
+        if task_info:
+            await ctx.send(embed=self._slayer_task_embed(ctx.author, task_info))
+        return broadcasts
+
     @w.command(name="fight")
     async def fight_npc(self, ctx: commands.Context, *, npcname: Optional[str] = None):
-        """Fight an NPC, optionally targeting a specific one (75% chance to encounter it)."""
+        """Fight an NPC, optionally targeting a specific one (75% chance to encounter it).
+
+        `!w fight x5 [npc]` runs up to 5 fights back to back (see _fight_batch).
+        """
         if not await self._ensure_ready(ctx):
             return
 
-        forced_npc: Optional[Tuple[str, int, int, int, str, int, int]] = None
-        forced_success = False
+        count, npcname = self._parse_fight_count(npcname)
+        forced_npc: Optional[Dict[str, Any]] = None
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
-            # 5 second fight cooldown
-            ok, left = self._cd_ready(p, "fight", 1)
+            ok, left = self._cd_ready(p, "fight", int(self.config.get("fight_cooldown_sec", 1)))
             if not ok:
                 await ctx.reply(f"Fight cooldown: **{left}s**")
                 return
@@ -2529,143 +2871,89 @@ class Wilderness(commands.Cog):
                     )
                     return
 
-                # Bracelet of Slayer Aggression: 100% if targeting slayer task, costs 20 Chaos rune
-                aggro_brace = p.equipment.get("gloves") == "Bracelet of Slayer Aggression"
-                task = p.slayer_task
-                on_task_target = (
-                    aggro_brace and task
-                    and task.get("npc_type") == forced_npc["npc_type"]
-                    and int(task.get("remaining", 0)) > 0
-                    and p.inventory.get("Chaos rune", 0) >= 20
-                )
-                if on_task_target:
-                    self._remove_item(p.inventory, "Chaos rune", 20)
-                forced_success = on_task_target or (random.random() <= 0.75)
-                if forced_success:
-                    chosen = forced_npc
-                else:
-                    pool = [n for n in eligible if self._norm(n["name"]) != self._norm(forced_npc["name"])]
-                    chosen = random.choice(pool) if pool else random.choice(eligible)
+            if count > 1:
+                broadcasts = await self._fight_batch(ctx, p, count, eligible, forced_npc)
             else:
-                chosen = random.choice(eligible)
+                chosen, header_lines = self._pick_fight_npc(p, eligible, forced_npc)
 
-            # Build header lines for targeted fight info
-            header_lines: List[str] = []
-            if forced_npc:
-                if forced_success:
-                    header_lines.append(f"🎯 Targeted fight: **{forced_npc['name']}** — **SUCCESS**")
-                else:
-                    header_lines.append(f"🎯 Targeted fight: **{forced_npc['name']}** — **FAILED**, random encounter instead…")
+                won, npc_name, events, lost_items, bank_loss, loot_lines, ground_drops, eaten_food, broadcasts, slayer_task_info = \
+                    self._simulate_pvm_fight_and_loot(p, chosen, header_lines=header_lines or None)
 
-            won, npc_name, events, lost_items, bank_loss, loot_lines, ground_drops, eaten_food, broadcasts, slayer_task_info = \
-                self._simulate_pvm_fight_and_loot(p, chosen, header_lines=header_lines or None)
+                if not won:
+                    food_lines = self._food_summary_lines(eaten_food, lost_items)
 
-            if not won:
-                food_lines = self._food_summary_lines(eaten_food, lost_items)
-
-                p.deaths += 1
-                p.wildy_run_id = int(p.wildy_run_id) + 1
-                p.ground_items = []
-                p.in_wilderness = False
-                p.skulled = False
-                p.wildy_level = 1
-                p.hp = int(self.config["starting_hp"])
-                self._full_heal(p)
+                    self._apply_pvm_death(p)
+                    await self._persist()
+
+                    pages = self._build_pages(events, per_page=10)
+                    summary = (
+                        f"☠️ **You died to {npc_name}.**\n"
+                        f"📉 **Lost from inventory:**\n{self._format_items_short(lost_items, max_lines=18)}\n"
+                        f"🏦 Lost bank coins: **{bank_loss:,}** (2%)"
+                        + (("\n\n" + "\n".join(food_lines)) if food_lines else "")
+                    )
+                    pages.append(summary)
+
+                    npc_image = chosen.get("image")
+                    view = FightLogView(
+                        author_id=ctx.author.id,
+                        pages=pages,
+                        title=f"{ctx.author.display_name} vs {npc_name}",
+                        cog=self,
+                        ground_drops=ground_drops,
+                        start_on_last=True,
+                        npc_image=npc_image,
+                    )
+                    await ctx.reply(embed=view._render_embed(), view=view)
+
+                    return
+
+                self._touch(p)
                 await self._persist()
 
+                warnings, has_food = self._fight_warnings(p)
+
+                embed_color = 0xFF4444 if warnings else 0x2B2D31
+
                 pages = self._build_pages(events, per_page=10)
                 summary = (
-                    f"☠️ **You died to {npc_name}.**\n"
-                    f"📉 **Lost from inventory:**\n{self._format_items_short(lost_items, max_lines=18)}\n"
-                    f"🏦 Lost bank coins: **{bank_loss:,}** (2%)"
-                    + (("\n\n" + "\n".join(food_lines)) if food_lines else "")
+                    f"✅ **You have killed {npc_name}!**\n"
+                    f"End HP: **{p.hp}/{self.config['max_hp']}**\n"
+                    + ("\n".join(loot_lines) if loot_lines else "(no loot)")
                 )
                 pages.append(summary)
 
                 npc_image = chosen.get("image")
-                view = FightLogView(
-                    author_id=ctx.author.id,
-                    pages=pages,
-                    title=f"{ctx.author.display_name} vs {npc_name}",
-                    cog=self,
-                    ground_drops=ground_drops,
-                    start_on_last=True,
-                    npc_image=npc_image,
-                )
+                view = FightLogView(author_id=ctx.author.id, pages=pages, title=f"{ctx.author.display_name} vs {npc_name}", cog=self, ground_drops=ground_drops, start_on_last=True, npc_image=npc_image, embed_color=embed_color)
                 await ctx.reply(embed=view._render_embed(), view=view)
 
-                return
-
-            self._touch(p)
-            await self._persist()
-
-            # Build warnings list
-            has_food = any(p.inventory.get(f, 0) > 0 for f in FOOD)
-            total_food = sum(int(v) for f, v in p.inventory.items() if f in FOOD and int(v) > 0)
-            warnings = []
-            hp_warn = getattr(p, "warning_health", 0)
-            food_warn = getattr(p, "warning_food", 0)
-            if hp_warn > 0 and p.hp < hp_warn:
-                warnings.append(f"Your HP is low (**{p.hp}/{self.config['max_hp']}** — below {hp_warn})")
-            elif p.hp < 20:
-                warnings.append(f"Your HP is critically low (**{p.hp}/{self.config['max_hp']}**)")
-            if food_warn > 0 and total_food <= food_warn:
-                warnings.append(f"Food is low (**{total_food}** remaining — at or below {food_warn})")
-            elif not has_food:
-                warnings.append("You have **no food** remaining in your inventory")
-
-            embed_color = 0xFF4444 if warnings else 0x2B2D31
-
-            pages = self._build_pages(events, per_page=10)
-            summary = (
-                f"✅ **You have killed {npc_name}!**\n"
-                f"End HP: **{p.hp}/{self.config['max_hp']}**\n"
-                + ("\n".join(loot_lines) if loot_lines else "(no loot)")
-            )
-            pages.append(summary)
-
-            npc_image = chosen.get("image")
-            view = FightLogView(author_id=ctx.author.id, pages=pages, title=f"{ctx.author.display_name} vs {npc_name}", cog=self, ground_drops=ground_drops, start_on_last=True, npc_image=npc_image, embed_color=embed_color)
-            await ctx.reply(embed=view._render_embed(), view=view)
+                if slayer_task_info:
+                    await ctx.send(embed=self._slayer_task_embed(ctx.author, slayer_task_info))
 
-            if slayer_task_info:
-                emb = discord.Embed(
-                    title="✅ Slayer Task Complete!",
-                    description=(
-                        f"**{ctx.author.display_name}** has completed their slayer task!\n\n"
-                        f"🗡️ Slayer Level: **{slayer_task_info['level']}**\n"
-                        f"⭐ Points earned: **+{slayer_task_info['points']}** (Total: **{slayer_task_info['total_points']}**)\n"
-                        f"📋 Tasks completed: **{slayer_task_info['tasks_done']}**\n\n"
-                        f"Use `!w slayer task` to get a new assignment!"
-                    ),
-                    color=0x00FF00,
-                )
-                await ctx.send(embed=emb)
+                if warnings:
+                    if has_food:
+                        tip = "Consider using `!w eat`, `!w tele`, or restocking before your next fight!"
+                    else:
+                        tip = "Consider using `!w tele`, `!w shop`, or `!w withdraw` to restock before your next fight!"
+                    emb = discord.Embed(
+                        title="⚠️ Warning!",
+                        description="\n".join(f"- {w}" for w in warnings) + f"\n\n{tip}",
+                        color=0xFF4444,
+                    )
+                    await ctx.send(embed=emb)
 
-            if warnings:
-                if has_food:
-                    tip = "Consider using `!w eat`, `!w tele`, or restocking before your next fight!"
-                else:
-                    tip = "Consider using `!w tele`, `!w shop`, or `!w withdraw` to restock before your next fight!"
-                emb = discord.Embed(
-                    title="⚠️ Warning!",
-                    description="\n".join(f"- {w}" for w in warnings) + f"\n\n{tip}",
-                    color=0xFF4444,
-                )
-                await ctx.send(embed=emb)
-
-            # Contextual tips for newer players
-            kills = p.kills
-            tip_msg = None
-            if kills == 1:
-                tip_msg = "**First kill!** Use `!w deposit` to bank your loot so you don't lose it if you die. Use `!w shop buy 10 lobster` if you need food."
-            elif kills == 5:
-                tip_msg = "**5 kills!** Try `!w slayer task` for slayer assignments — you'll earn bonus XP and points towards powerful rewards."
-            elif kills == 15:
-                tip_msg = "**15 kills!** Check `!w craftables` — you might have enough drops to craft better gear. Use `!w ge` to buy and sell items with other players."
-            if tip_msg:
-                emb = discord.Embed(description=tip_msg, color=0x3498db)
-                await ctx.send(embed=emb)
+                # Contextual tips for newer players
+                kills = p.kills
+                tip_msg = None
+                if kills == 1:
+                    tip_msg = "**First kill!** Use `!w deposit` to bank your loot so you don't lose it if you die. Use `!w shop buy 10 lobster` if you need food."
+                elif kills == 5:
+                    tip_msg = "**5 kills!** Try `!w slayer task` for slayer assignments — you'll earn bonus XP and points towards powerful rewards."
+                elif kills == 15:
+                    tip_msg = "**15 kills!** Check `!w craftables` — you might have enough drops to craft better gear. Use `!w ge` to buy and sell items with other players."
+                if tip_msg:
+                    emb = discord.Embed(description=tip_msg, color=0x3498db)
+                    await ctx.send(embed=emb)
 
         await self._send_broadcasts(ctx.author, broadcasts, ctx.guild.id if ctx.guild else 0)
 
@@ -2676,7 +2964,7 @@ class Wilderness(commands.Cog):
         if target.bot or target.id == ctx.author.id:
             await ctx.reply("Pick a real person (not yourself, not a bot).")
             return
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id, target.id):
             a = self._get_player(ctx.author)
             b = self._get_player(target)
             ok, left = self._cd_ready(a, "attack", int(self.config["attack_cooldown_sec"]))
@@ -2733,7 +3021,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("You’re in a PvP fight — use the **Teleport** button on your turn.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             ok, left = self._cd_ready(p, "tele", int(self.config["teleport_cooldown_sec"]))
@@ -2976,7 +3264,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             # No item -> show help + current locks
@@ -2993,10 +3281,10 @@ class Wilderness(commands.Cog):
             canonical = self._resolve_item(itemname) or self._resolve_food(itemname) or itemname.strip()
 
             # Find the actual inventory key (preserves casing)
-            inv_key = self._resolve_from_keys_case_insensitive(canonical, p.inventory.keys())
+            inv_key = self._resolve_from_keys_case_insensitive(canonical, p.inventory)
             if not inv_key:
                 # Try also direct (maybe they typed exact inv item like "Super potion (2)")
-                inv_key = self._resolve_from_keys_case_insensitive(itemname, p.inventory.keys())
+                inv_key = self._resolve_from_keys_case_insensitive(itemname, p.inventory)
 
             if not inv_key or int(p.inventory.get(inv_key, 0)) <= 0:
                 await ctx.reply("That item isn’t in your inventory, so it can’t be locked.")
@@ -3021,7 +3309,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             locked = getattr(p, "locked", None) or []
             if not locked:
@@ -3064,7 +3352,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w chest open mysterious` or `!w chest open bone`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
                 await ctx.reply("Open chests out of the Wilderness.")
@@ -3188,7 +3476,7 @@ class Wilderness(commands.Cog):
 
         price_each = int(items[shop_key])
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
                 await ctx.reply("Buy items out of the Wilderness.")
@@ -3294,13 +3582,13 @@ class Wilderness(commands.Cog):
         canonical = self._resolve_item(item_query)
         if not canonical:
             # As a convenience, try matching exact inventory key name (case-insensitive)
-            async with self._mem_lock:
+            async with self.lock_mgr.hold(ctx.author.id):
                 p = self._get_player(ctx.author)
-                inv_key_direct = self._resolve_from_keys_case_insensitive(item_query, p.inventory.keys())
+                inv_key_direct = self._resolve_from_keys_case_insensitive(item_query, p.inventory)
             canonical = inv_key_direct
 
         if not canonical:
-            await ctx.reply("Unknown item.")
+            await ctx.reply("Unknown item." + self._did_you_mean(item_query))
             return
 
         meta = ITEMS.get(canonical, {})
@@ -3320,14 +3608,14 @@ class Wilderness(commands.Cog):
             await ctx.reply("That item has no shop value (can’t be sold).")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
                 await ctx.reply("Sell items out of the Wilderness.")
                 return
 
             # Find the exact inventory key (preserves original casing)
-            inv_key = self._resolve_from_keys_case_insensitive(canonical, p.inventory.keys())
+            inv_key = self._resolve_from_keys_case_insensitive(canonical, p.inventory)
             have = int(p.inventory.get(inv_key, 0)) if inv_key else 0
 
             if have <= 0:
@@ -3395,7 +3683,7 @@ class Wilderness(commands.Cog):
             await ctx.reply(f"**{item_query}** is not a craftable item. Use `!w craftables` to see recipes.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.craft_mgr.craft(p, craft_name)
             if ok:
@@ -3442,7 +3730,7 @@ class Wilderness(commands.Cog):
             await ctx.reply(f"**{item_query}** cannot be broken down. Use `!w breakdownitems` to see options.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.breakdown_mgr.breakdown(p, bd_name)
             if ok:
@@ -3466,7 +3754,7 @@ class Wilderness(commands.Cog):
             await ctx.reply(f"**{rune_query}** is not a valid rune.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.rc_mgr.craft_runes(p, rune_name)
             if ok:
@@ -3480,7 +3768,7 @@ class Wilderness(commands.Cog):
     async def presets_list_cmd(self, ctx: commands.Context):
         if not await self._ensure_ready(ctx):
             return
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             names = self.preset_mgr.list_presets(p)
         if names:
@@ -3493,7 +3781,7 @@ class Wilderness(commands.Cog):
     async def preset_group(self, ctx: commands.Context):
         if not await self._ensure_ready(ctx):
             return
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             names = self.preset_mgr.list_presets(p)
         if names:
@@ -3510,7 +3798,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w preset create <name>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
                 await ctx.reply("You can't manage presets while in the Wilderness.")
@@ -3530,7 +3818,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w preset override <name>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
                 await ctx.reply("You can't manage presets while in the Wilderness.")
@@ -3550,7 +3838,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w preset load <name>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if p.in_wilderness:
                 await ctx.reply("You can't load presets while in the Wilderness.")
@@ -3570,7 +3858,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w preset delete <name>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.preset_mgr.delete(p, name)
             if ok:
@@ -3587,7 +3875,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w preset check <name>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, key_or_err, data = self.preset_mgr.check(p, name)
 
@@ -3629,11 +3917,11 @@ class Wilderness(commands.Cog):
                             "`!w alch auto <item>` — Toggle auto-alch on drops.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             resolved = self._resolve_item(item_name.strip())
             if not resolved:
-                await ctx.reply(f"Unknown item: **{item_name.strip()}**")
+                await ctx.reply(f"Unknown item: **{item_name.strip()}**" + self._did_you_mean(item_name))
                 return
 
             value = ITEMS.get(resolved, {}).get("value", 0)
@@ -3641,7 +3929,7 @@ class Wilderness(commands.Cog):
                 await ctx.reply(f"**{resolved}** has no alch value.")
                 return
 
-            inv_key = self._resolve_from_keys_case_insensitive(resolved, p.inventory.keys())
+            inv_key = self._resolve_from_keys_case_insensitive(resolved, p.inventory)
             inv_qty = p.inventory.get(inv_key, 0) if inv_key else 0
             if inv_qty <= 0:
                 await ctx.reply(f"You don't have any **{resolved}** in your inventory.")
@@ -3668,7 +3956,7 @@ class Wilderness(commands.Cog):
             return
 
         if not item_name.strip():
-            async with self._mem_lock:
+            async with self.lock_mgr.hold(ctx.author.id):
                 p = self._get_player(ctx.author)
                 auto_list = getattr(p, "alch_auto", None) or []
             if not auto_list:
@@ -3678,11 +3966,11 @@ class Wilderness(commands.Cog):
             await ctx.reply("🔥 **Auto-alch list:**\n" + "\n".join(lines))
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             resolved = self._resolve_item(item_name.strip())
             if not resolved:
-                await ctx.reply(f"Unknown item: **{item_name.strip()}**")
+                await ctx.reply(f"Unknown item: **{item_name.strip()}**" + self._did_you_mean(item_name))
                 return
 
             if p.alch_auto is None:
@@ -3708,7 +3996,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
         slayer_lvl = self.slayer_mgr.get_slayer_level(p)
@@ -3750,7 +4038,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             task = p.slayer_task
@@ -3789,7 +4077,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.slayer_mgr.skip_task(p)
             if ok:
@@ -3842,7 +4130,7 @@ class Wilderness(commands.Cog):
             await ctx.reply(f"Item not found in slayer shop: **{item_name.strip()}**")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.slayer_mgr.buy_shop_item(p, matched_key)
             if ok:
@@ -3875,7 +4163,7 @@ class Wilderness(commands.Cog):
             return
 
         if not npc_name.strip():
-            async with self._mem_lock:
+            async with self.lock_mgr.hold(ctx.author.id):
                 p = self._get_player(ctx.author)
                 blocked = list(p.slayer_blocked or [])
 
@@ -3894,7 +4182,7 @@ class Wilderness(commands.Cog):
             await ctx.reply(f"🗡️ **Block list ({len(blocked)}/{MAX_SLAYER_BLOCKS}):**\n" + "\n".join(lines))
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.slayer_mgr.block_npc(p, npc_name.strip())
             if ok:
@@ -3911,7 +4199,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Usage: `!w slayer block remove <npc>`")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             ok, msg = self.slayer_mgr.unblock_npc(p, npc_name.strip())
             if ok:
@@ -3940,24 +4228,33 @@ class Wilderness(commands.Cog):
 
     def _resolve_uncut_gem(self, query: str) -> Optional[str]:
         """Resolve a user query to an uncut gem name from GEM_CUTTING keys."""
-        norm_q = self._norm(query)
-        for uncut in GEM_CUTTING:
-            if self._norm(uncut) == norm_q:
-                return uncut
-        # Also try matching by cut gem name (e.g. "sapphire" → "Uncut sapphire")
-        for uncut, cut in GEM_CUTTING.items():
-            if self._norm(cut) == norm_q:
-                return uncut
+        # Uncut or cut gem name (e.g. "sapphire" → "Uncut sapphire")
+        uncut = UNCUT_GEMS.get(self._norm(query))
+        if uncut:
+            return uncut
         # Try resolve through alias system
         resolved = self._resolve_item(query)
         if resolved and resolved in GEM_CUTTING:
             return resolved
         # Check if they typed the cut gem name and we can find the uncut version
-        if resolved:
-            for uncut, cut in GEM_CUTTING.items():
-                if cut == resolved:
-                    return uncut
-        return None
+        return CUT_TO_UNCUT.get(resolved) if resolved else None
+
+    def _finish_gem_cutting(self, p: PlayerState) -> bool:
+        """Bank the cut gems and clear the job if it has run its full time."""
+        gc_start = p.cd.get("gem_cutting")
+        if not gc_start:
+            return False
+        total = p.cd.get("gem_cutting_total", 0)
+        if _now() - int(gc_start) < total * 1.2:
+            return False
+        result_gem = p.cd.get("gem_cutting_result", "")
+        if result_gem and total > 0:
+            self._add_item(p.bank, result_gem, total)
+        p.cd.pop("gem_cutting", None)
+        p.cd.pop("gem_cutting_gem", None)
+        p.cd.pop("gem_cutting_total", None)
+        p.cd.pop("gem_cutting_result", None)
+        return True
 
     @w.group(name="cut", invoke_without_command=True)
     async def cut_cmd(self, ctx: commands.Context, *, args: str = ""):
@@ -3973,7 +4270,7 @@ class Wilderness(commands.Cog):
             )
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             if p.in_wilderness:
@@ -4050,7 +4347,7 @@ class Wilderness(commands.Cog):
             await ctx.reply("Wilderness is still loading. Try again in a moment.")
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             gc_start = p.cd.get("gem_cutting")
@@ -4124,7 +4421,7 @@ class Wilderness(commands.Cog):
 
         recipe = CONSUMABLES[source_name]
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             # Check inventory first, then bank
@@ -4184,7 +4481,7 @@ class Wilderness(commands.Cog):
             return
 
         if not item_name.strip():
-            async with self._mem_lock:
+            async with self.lock_mgr.hold(ctx.author.id):
                 p = self._get_player(ctx.author)
                 auto_list = getattr(p, "consume_auto", None) or []
             if not auto_list:
@@ -4194,11 +4491,11 @@ class Wilderness(commands.Cog):
             await ctx.reply("🔮 **Auto-consume list:**\n" + "\n".join(lines))
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             resolved = self._resolve_item(item_name.strip())
             if not resolved:
-                await ctx.reply(f"Unknown item: **{item_name.strip()}**")
+                await ctx.reply(f"Unknown item: **{item_name.strip()}**" + self._did_you_mean(item_name))
                 return
 
             if resolved not in CONSUMABLES:
@@ -4251,7 +4548,7 @@ class Wilderness(commands.Cog):
         result_name = recipe["result"]
         materials = recipe["materials"]
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
 
             # Check the source item in inventory first, then bank
@@ -4305,7 +4602,7 @@ class Wilderness(commands.Cog):
         if not await self._ensure_ready(ctx):
             return
 
-        async with self._mem_lock:
+        async with self.lock_mgr.hold(ctx.author.id):
             p = self._get_player(ctx.author)
             if not p.started:
                 await ctx.reply("Create a profile first with `!w start`.")